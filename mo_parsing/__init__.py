@@ -38,6 +38,11 @@ STANDARD_WHITESPACE = whitespaces.STANDARD_WHITESPACE = Whitespace().use()
 from mo_parsing.infix import LEFT_ASSOC, RIGHT_ASSOC, infix_notation, delimited_list, one_of
 from mo_parsing.regex import Regex
 from mo_parsing.tokens import *
+from mo_parsing.collapse import Collapsed
+from mo_parsing.first import first_sets
+from mo_parsing.codegen import CompiledParser
+from mo_parsing.vm import Program
+from mo_parsing import pool, snapshot
 
 __all__ = [
     "And",
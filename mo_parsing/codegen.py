@@ -0,0 +1,529 @@
+# encoding: utf-8
+"""
+TRANSLATE A Parser TO PYTHON SOURCE, WITH ONE FUNCTION FOR EACH ParserElement
+
+EACH FUNCTION DOES WHAT THE ELEMENT'S try_impl() DOES, AND RUNS ITS PARSE
+ACTIONS, SO THERE IS NO _parse(), NO memo CHECK, AND NO POLYMORPHIC CALL
+IN BETWEEN; THE LITERALS ARE IN THE SOURCE, AND THE REGEX METHODS, AND
+ELEMENTS, ARE DEFAULT ARGUMENTS (SO THEY ARE LOCALS)
+
+A FAILURE IS None; THE ParseException IS MADE BY PARSING AGAIN WITH THE
+Parser, WITHOUT THE PARSE ACTIONS. ELEMENTS WITHOUT A TRANSLATION ARE CALLED WITH _parse()
+"""
+from mo_dots import is_null
+from mo_imports import export
+
+from mo_parsing.collapse import Collapsed
+from mo_parsing.core import ParseState, _reachable_forwards, _reset, _state
+from mo_parsing.enhancement import (
+    Combine,
+    Forward,
+    LookAhead,
+    LookBehind,
+    Many,
+    NotAny,
+    OneOrMore,
+    Optional,
+    ParseEnhancement,
+    ZeroOrMore,
+    _suppress_post_parse,
+)
+from mo_parsing.exceptions import ParseException
+from mo_parsing.expressions import And, Fast, MatchFirst, Or
+from mo_parsing.regex import Regex
+from mo_parsing.results import Annotation, ForwardResults, ParseResults
+from mo_parsing.tokens import (
+    CaselessKeyword,
+    CaselessLiteral,
+    Char,
+    CharsNotIn,
+    Empty,
+    Keyword,
+    Literal,
+    SingleCharLiteral,
+    StringEnd,
+    Word,
+)
+from mo_parsing.utils import Log, MAX_INT
+
+STRING_END = StringEnd().parser_config.regex
+
+
+class CompiledParser(object):
+    """
+    SAME AS THE Parser IT WAS MADE FROM, BUT FASTER
+    """
+
+    __slots__ = ["parser", "source", "forwards", "root", "skip"]
+
+    def __init__(self, parser):
+        self.parser = parser
+        self._build()
+
+    def _build(self):
+        parser = self.parser
+        self.forwards = _reachable_forwards(parser.original)
+        generator = _Generator(parser.memo is not None)
+        self.source, namespace = generator.generate(parser.element, parser.whitespace)
+        exec(compile(self.source, "<mo_parsing.codegen>", "exec"), namespace)
+        self.root = namespace["root"]
+        self.skip = namespace["skip"]
+
+    def parse(self, string, parse_all=False):
+        """
+        :param string: THE STRING TO PARSE
+        :param parse_all: TRUE IF THE WHOLE STRING MUST MATCH
+        :return: SAME AS Parser.parse()
+
+        ON FAILURE, THE Parser PARSES string AGAIN TO MAKE THE ParseException,
+        WITH do_actions=False, SO PARSE ACTIONS WITH SIDE EFFECTS DO NOT RUN
+        TWICE. ONLY WHEN THAT PARSE MATCHES (A PARSE ACTION, OR CONDITION,
+        MADE THE FAILURE) ARE THE ACTIONS RUN AGAIN, BY Parser.parse()
+        """
+        if any(f.expr is not e for f, e in self.forwards):
+            # A Forward WAS ASSIGNED SINCE THE SOURCE WAS MADE
+            self.parser._check_forwards()
+            self._build()
+        _reset()
+        with ParseState(self.parser.memo):
+            start = self.skip(string, 0)
+            tokens = self.root(string, start, True)
+            if tokens is not None and parse_all:
+                end = self.skip(string, tokens.end)
+                if end < len(string) and not STRING_END.match(string, end):
+                    tokens = None
+        if tokens is None:
+            # THE Parser MAKES THE SAME ParseException
+            failure = self.parser._explain(string, parse_all)
+            if failure is None:
+                return self.parser.parse(string, parse_all)
+            raise failure
+        if self.parser.named:
+            return tokens
+        return tokens.tokens[0]
+
+    parse_string = parse
+
+
+def compile_parser(parser):
+    """
+    :return: CompiledParser FOR THE GIVEN Parser
+    """
+    return CompiledParser(parser)
+
+
+def run_actions(result, string, actions):
+    """
+    SAME AS THE PARSE ACTION LOOP IN ParserElement._parse_uncached()
+    :return: THE LAST RESULT, OR None IF AN ACTION RAISED ParseException
+    """
+    try:
+        for fn in actions:
+            next_result = fn(result, result.start, string)
+            if next_result.end < result.end:
+                Log.error(
+                    "parse action {{name}} not allowed to roll back the end of parsing", name=fn.__name__,
+                )
+            result = next_result
+    except ParseException:
+        return None
+    return result
+
+
+def parse_element(element, string, start, do_actions):
+    """
+    :return: element._parse(), OR None IF IT FAILED
+    """
+    try:
+        return element._parse(string, start, do_actions)
+    except ParseException:
+        return None
+
+
+class _Generator(object):
+    __slots__ = ["memo", "names", "namespace", "todo", "lines", "tables", "locals", "whitespaces"]
+
+    def __init__(self, memo):
+        """
+        :param memo: True IF THE Parser HAS A PACKRAT MEMO
+        """
+        self.memo = memo
+        self.names = {}  # MAP FROM id(element) TO FUNCTION NAME
+        self.namespace = {
+            "ParseResults": ParseResults,
+            "ForwardResults": ForwardResults,
+            "Annotation": Annotation,
+            "ParseException": ParseException,
+            "run_actions": run_actions,
+            "parse_element": parse_element,
+            "state": _state,
+        }
+        self.todo = []
+        self.lines = []
+        self.tables = []  # (NAME, [(KEY, [FUNCTION NAME, ...]), ...]) FOR EACH Fast
+        self.locals = []  # CONSTANTS USED BY THE FUNCTION BEING MADE
+        self.whitespaces = {}  # MAP FROM id(Whitespace.regex) TO CONSTANT NAME
+
+    def generate(self, root, whitespace):
+        """
+        :return: (SOURCE, NAMESPACE) WITH root(string, start, do_actions) AND skip(string, start)
+        """
+        root_name = self.function(root)
+        while self.todo:
+            element = self.todo.pop()
+            self.lines.extend(self.define(element))
+            self.lines.append("")
+        for name, lookup in self.tables:
+            entries = ", ".join(f"{key!r}: ({''.join(f + ', ' for f in functions)})" for key, functions in lookup)
+            self.lines.append(f"{name} = {{{entries}}}")
+        self.lines.append(f"root = {root_name}")
+        self.lines.append("")
+        self.lines.append("def skip(string, start):")
+        self.lines.extend(self.skip(whitespace, "start", "start", "    "))
+        self.lines.append("    return start")
+        return "\n".join(self.lines) + "\n", self.namespace
+
+    def function(self, element):
+        """
+        :return: NAME OF THE FUNCTION FOR element
+        """
+        name = self.names.get(id(element))
+        if name is None:
+            name = self.names[id(element)] = f"p{len(self.names)}"
+            self.namespace[f"e{name[1:]}"] = element
+            self.todo.append(element)
+        return name
+
+    def constant(self, name, value):
+        self.namespace[name] = value
+        self.locals.append(name)
+        return name
+
+    def skip(self, whitespace, target, position, indent):
+        """
+        :return: LINES TO SET target TO whitespace.skip(string, position)
+        """
+        if not whitespace.white_chars and not whitespace.ignore_list:
+            if target == position:
+                return []
+            return [f"{indent}{target} = {position}"]
+        white = self.whitespaces.setdefault(id(whitespace.regex), f"w{len(self.whitespaces)}")
+        self.constant(white, whitespace.regex.match)
+        return [
+            f"{indent}found = {white}(string, {position})",
+            f"{indent}{target} = found.end() if found else {position}",
+        ]
+
+    def define(self, element):
+        name = self.names[id(element)]
+        n = name[1:]
+        self.locals = []
+        if self.memo and element.parser_config.memoize is None:
+            # _parse() TURNS OFF THE MEMO INSIDE
+            body = None
+        else:
+            body = self.body(element, n)
+        if body is None:
+            # NO TRANSLATION
+            return [
+                f"def {name}(string, start, do_actions, e=e{n}):",
+                f"    return parse_element(e, string, start, do_actions)",
+            ]
+        params = "".join(f", {c}={c}" for c in dict.fromkeys(self.locals))
+        if self.memo and element.parser_config.memoize:
+            return [
+                f"def {name}(string, start, do_actions, e=e{n}):",
+                f"    table = state.current.memo",
+                f"    if table is None:",
+                f"        return {name}_(string, start, do_actions)",
+                f"    return table.call(e, {name}_, string, start, do_actions)",
+                f"",
+                f"def {name}_(string, start, do_actions, e=e{n}, ParseResults=ParseResults{params}):",
+            ] + body
+        return [f"def {name}(string, start, do_actions, e=e{n}, ParseResults=ParseResults{params}):"] + body
+
+    def body(self, element, n):
+        """
+        :return: LINES OF THE FUNCTION BODY, THAT SETS r TO THE RESULT, OR None IF NOT TRANSLATED
+        """
+        config = element.parser_config
+        if config.fail_action:
+            return None
+        clazz = element.__class__
+        if clazz is Literal:
+            match = config.match
+            lines = [
+                f"    if not string.startswith({match!r}, start):",
+                f"        return None",
+                f"    r = ParseResults(e, start, start + {len(match)}, [{match!r}], [])",
+            ]
+        elif clazz is SingleCharLiteral:
+            match = config.match
+            lines = [
+                f"    if string[start:start + 1] != {match!r}:",
+                f"        return None",
+                f"    r = ParseResults(e, start, start + 1, [{match!r}], [])",
+            ]
+        elif clazz in (Keyword, CaselessKeyword, CaselessLiteral):
+            regex = self.constant(f"m{n}", config.regex.match)
+            lines = [
+                f"    found = {regex}(string, start)",
+                f"    if not found:",
+                f"        return None",
+                f"    r = ParseResults(e, start, found.end(), [{config.match!r}], [])",
+            ]
+        elif clazz in (Word, Char, CharsNotIn, Regex):
+            regex = self.constant(f"m{n}", (element.regex if clazz in (Word, Regex) else config.regex).match)
+            lines = [
+                f"    found = {regex}(string, start)",
+                f"    if not found:",
+                f"        return None",
+                f"    r = ParseResults(e, start, found.end(), [found.group()], [])",
+            ]
+        elif clazz is Collapsed:
+            regex = self.constant(f"m{n}", element.regex.match)
+            lines = [
+                f"    found = {regex}(string, start)",
+                f"    if not found:",
+                f"        return None",
+                f"    r = ParseResults(e, start, found.end(), e._tokens(found), [])",
+            ]
+        elif clazz is Empty:
+            lines = [f"    r = ParseResults(e, start, start, [], [])"]
+        elif clazz is StringEnd:
+            regex = self.constant(f"m{n}", config.regex.match)
+            lines = [
+                f"    if start >= len(string):",
+                f"        r = ParseResults(e, len(string), len(string), [], [])",
+                f"    else:",
+                f"        found = {regex}(string, start)",
+                f"        if not found:",
+                f"            return None",
+                f"        r = ParseResults(e, start, found.end(), [], [])",
+            ]
+        elif clazz is NotAny:
+            if not element.regex:
+                return None
+            regex = self.constant(f"m{n}", element.regex.match)
+            lines = [
+                f"    if not {regex}(string, start):",
+                f"        return None",
+                f"    r = ParseResults(e, start, start, [], [])",
+            ]
+        elif clazz is And:
+            lines = self.sequence(element)
+        elif clazz is MatchFirst:
+            lines = self.first(element)
+        elif clazz is Or:
+            lines = self.longest(element)
+        elif clazz in (Many, OneOrMore, ZeroOrMore):
+            lines = self.many(element)
+        elif clazz is Optional:
+            default = self.constant(f"d{n}", config.default_value)
+            lines = [
+                f"    r = {self.function(element.expr)}(string, start, do_actions)",
+                f"    if r is None:",
+                f"        r = ParseResults(e, start, start, {default}, [])",
+                f"    else:",
+                f"        r = ParseResults(e, r.start, r.end, [r], [])",
+            ]
+        elif clazz is Forward:
+            if config.left_recursion or is_null(element.expr):
+                return None
+            lines = [
+                f"    r = {self.function(element.expr)}(string, start, do_actions)",
+                f"    if r is None:",
+                f"        return None",
+                f"    r = ForwardResults(e, r.start, r.end, [r], [])",
+            ]
+        elif clazz is Combine:
+            lines = [
+                f"    r = {self.function(element.expr)}(string, start, do_actions)",
+                f"    if r is None:",
+                f"        return None",
+                f"    r = ParseResults(e, start, r.end, [r.as_string(sep={config.separator!r})], [])",
+            ]
+        elif clazz is LookAhead:
+            lines = [
+                f"    r = {self.function(element.expr)}(string, start, do_actions)",
+                f"    if r is None:",
+                f"        return None",
+                f"    r.__class__ = Annotation",
+                f"    r = ParseResults(e, start, start, [r], [])",
+            ]
+        elif isinstance(element, ParseEnhancement) and clazz.parse_impl is ParseEnhancement.parse_impl:
+            # Group, Dict, Suppress, AND OTHER CONVERTERS THAT ONLY HAVE PARSE ACTIONS
+            lines = [
+                f"    r = {self.function(element.expr)}(string, start, do_actions)",
+                f"    if r is None:",
+                f"        return None",
+            ]
+            if element.parse_action == [_suppress_post_parse]:
+                return lines + [
+                    f"    if do_actions:",
+                    f"        return ParseResults(e, r.start, r.end, [], [])",
+                    f"    return ParseResults(e, r.start, r.end, [r], [])",
+                ]
+            lines.append(f"    r = ParseResults(e, r.start, r.end, [r], [])")
+        else:
+            return None
+
+        if element.parse_action:
+            actions = self.constant(f"a{n}", element.parse_action)
+            if config.callDuringTry:
+                lines.append(f"    return run_actions(r, string, {actions})")
+                return lines
+            lines.append(f"    if do_actions:")
+            lines.append(f"        return run_actions(r, string, {actions})")
+        lines.append(f"    return r")
+        return lines
+
+    def sequence(self, element):
+        """
+        SAME AS And.try_impl()
+        """
+        lines = [f"    end = index = start", f"    acc = []"]
+        whitespace = element.parser_config.whitespace
+        for i, expr in enumerate(element.exprs):
+            if isinstance(expr, And.SyntaxErrorGuard):
+                continue
+            if i:
+                if isinstance(expr, LookBehind):
+                    lines.append(f"    if end > index:")
+                    lines.append(f"        index = end")
+                else:
+                    skip = self.skip(whitespace, "index", "end", "        ")
+                    if skip:
+                        lines.append(f"    if end > index:")
+                        lines.extend(skip)
+                    else:
+                        lines.append(f"    index = end")
+            lines.append(f"    r = {self.function(expr)}(string, index, do_actions)")
+            lines.append(f"    if r is None:")
+            lines.append(f"        return None")
+            if expr.min_length():
+                lines.append(f"    acc.append(r)")
+                lines.append(f"    end = r.end")
+            else:
+                # AN EMPTY ZeroOrMore IS DROPPED
+                lines.append(
+                    f"    if r or index != r.end or not isinstance(r.type, Many) or r.type.parser_config.min_match:"
+                )
+                lines.append(f"        acc.append(r)")
+                lines.append(f"        end = r.end")
+        lines.append(f"    r = ParseResults(e, start, end, acc, [])")
+        self.namespace["Many"] = Many
+        return lines
+
+    def first(self, element):
+        """
+        SAME AS MatchFirst.try_impl(), WITH THE Fast LOOKUP IN LINE
+        """
+        lines = []
+        for i, alternative in enumerate(element.alternate):
+            indent = "    "
+            if i:
+                lines.append(f"    if r is None:")
+                indent = "        "
+            if alternative.__class__ is Fast:
+                table = self.table(alternative)
+                lines.extend([
+                    f"{indent}r = None",
+                    f"{indent}found = m{table}(string, start)",
+                    f"{indent}if found:",
+                    f"{indent}    for f in {table}.get(found.group(0).lower(), ()):",
+                    f"{indent}        r = f(string, start, do_actions)",
+                    f"{indent}        if r is not None:",
+                    f"{indent}            break",
+                ])
+            else:
+                lines.append(f"{indent}r = {self.function(alternative)}(string, start, do_actions)")
+        if not lines:
+            return ["    return None"]
+        lines.append(f"    if r is None:")
+        lines.append(f"        return None")
+        lines.append(f"    r = ParseResults(e, r.start, r.end, [r], [])")
+        return lines
+
+    def longest(self, element):
+        """
+        SAME AS Or.parse_impl(): TRY EVERY ALTERNATIVE, AND KEEP THE LONGEST RESULT
+        """
+        lines = [f"    best = None"]
+        for alternative in element.alternate:
+            if alternative.__class__ is Fast:
+                table = self.table(alternative)
+                lines.extend([
+                    f"    found = m{table}(string, start)",
+                    f"    if found:",
+                    f"        for f in {table}.get(found.group(0).lower(), ()):",
+                    f"            r = f(string, start, do_actions)",
+                    f"            if r is not None and (best is None or r.end > best.end):",
+                    f"                best = r",
+                ])
+            else:
+                lines.extend([
+                    f"    r = {self.function(alternative)}(string, start, do_actions)",
+                    f"    if r is not None and (best is None or r.end > best.end):",
+                    f"        best = r",
+                ])
+        lines.extend([
+            f"    if best is None:",
+            f"        return None",
+            f"    r = ParseResults(e, best.start, best.end, [best], [])",
+        ])
+        return lines
+
+    def table(self, fast):
+        """
+        :return: NAME OF THE LOOKUP TABLE FOR THE Fast, ITS REGEX IS m<NAME>
+        """
+        name = f"f{len(self.tables)}"
+        self.tables.append((name, [(k, [self.function(e) for e in v]) for k, v in fast.lookup.items()]))
+        self.constant(f"m{name}", fast.regex.match)
+        return name
+
+    def many(self, element):
+        """
+        SAME AS Many.try_impl(), AND ZeroOrMore.try_impl()
+        """
+        config = element.parser_config
+        min_match, max_match = config.min_match, config.max_match
+        lines = [
+            f"    acc = []",
+            f"    end = start",
+            f"    count = 0",
+            f"    length = len(string)",
+            f"    while end < length:",
+        ]
+        skip = self.skip(config.whitespace, "index", "end", "        ")
+        lines.extend(skip or [f"        index = end"])
+        if config.end:
+            stopper = self.constant(f"s{id(element)}", config.end.match)
+            lines.append(f"        if {stopper}(string, index):")
+            lines.append(f"            break")
+        lines.extend([
+            f"        r = {self.function(element.expr)}(string, index, do_actions)",
+            f"        if r is None:",
+            f"            break",
+            f"        end = r.end",
+            f"        if r.end - r.start:",
+            f"            acc.append(r)",
+            f"            count += 1",
+        ])
+        if max_match != MAX_INT:
+            lines.append(f"            if count >= {max_match}:")
+            lines.append(f"                break")
+        if min_match:
+            lines.append(f"    if count < {min_match}:")
+            lines.append(f"        return None")
+            lines.append(f"    elif count:")
+        else:
+            lines.append(f"    if count:")
+        lines.append(f"        r = ParseResults(e, acc[0].start, acc[-1].end, acc, [])")
+        lines.append(f"    else:")
+        lines.append(f"        r = ParseResults(e, start, end, acc, [])")
+        return lines
+
+
+export("mo_parsing.core", compile_parser)
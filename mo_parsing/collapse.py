@@ -0,0 +1,477 @@
+# encoding: utf-8
+"""
+REPLACE SUB-GRAMMARS THAT ARE REGULAR, AND HAVE NO PARSE ACTIONS, NAMES OR
+FAIL ACTIONS, WITH ONE COMPILED REGEX
+
+THE REGEX KEEPS THE PEG MEANING: AN ELEMENT THAT MATCHED IS NEVER MATCHED
+A DIFFERENT WAY, SO EVERY PIECE IS AN ATOMIC GROUP (?>...) OR A POSSESSIVE
+REPEAT *+, WHICH NEED PYTHON 3.11
+"""
+import re
+import sys
+
+from mo_imports import export
+
+from mo_parsing.core import ParserElement
+from mo_parsing.enhancement import (
+    Combine,
+    Forward,
+    Many,
+    OneOrMore,
+    Optional,
+    ParseEnhancement,
+    Suppress,
+    ZeroOrMore,
+    _dict_post_parse,
+    _suppress_post_parse,
+)
+from mo_parsing.expressions import And, MatchFirst, Or, ParseExpression, Fast
+from mo_parsing.regex import Regex
+from mo_parsing.results import ParseResults
+from mo_parsing.tokens import (
+    CaselessKeyword,
+    CaselessLiteral,
+    Char,
+    Keyword,
+    Literal,
+    SingleCharLiteral,
+    Word,
+)
+from mo_parsing.utils import MAX_INT
+
+ENABLED = sys.version_info >= (3, 11)
+if ENABLED:
+    from re import _parser as sre_parse
+    from re._constants import (
+        ASSERT,
+        ASSERT_NOT,
+        ATOMIC_GROUP,
+        BRANCH,
+        GROUPREF,
+        GROUPREF_EXISTS,
+        MAX_REPEAT,
+        MAXREPEAT,
+        MIN_REPEAT,
+        POSSESSIVE_REPEAT,
+        SUBPATTERN,
+    )
+
+CONSTANT_LEAVES = (Literal, SingleCharLiteral, CaselessLiteral, Keyword, CaselessKeyword)
+REPEATS = (Many, OneOrMore, ZeroOrMore)
+SHAPES = (_suppress_post_parse, _dict_post_parse)  # PARSE ACTIONS THAT CAN NOT REJECT A MATCH
+INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+
+
+class Collapsed(ParseEnhancement):
+    """
+    ONE REGEX FOR ALL OF expr
+    THE TOKENS ARE THE CAPTURED GROUPS, OR THE CONSTANT FOR A CASELESS MATCH
+    """
+
+    __slots__ = ["regex", "tokens"]
+
+    def __init__(self, expr, regex, tokens):
+        """
+        :param expr: THE SUB-GRAMMAR, STILL USED TO REPORT FAILURES
+        :param regex: COMPILED PATTERN MATCHING WHAT expr MATCHES
+        :param tokens: LIST OF (group, constant) FOR EACH TOKEN, IN ORDER
+        """
+        ParseEnhancement.__init__(self, expr)
+        self.regex = regex
+        self.tokens = tokens
+        self.parser_name = expr.parser_name
+        self.streamlined = True
+
+    def copy(self):
+        output = ParseEnhancement.copy(self)
+        output.regex = self.regex
+        output.tokens = self.tokens
+        return output
+
+    def parse_impl(self, string, start, do_actions=True):
+        found = self.regex.match(string, start)
+        if found is None:
+            # THE SUB-GRAMMAR FAILS THE SAME WAY, WITH A BETTER MESSAGE
+            return self.expr.parse_impl(string, start, do_actions)
+        return ParseResults(self, start, found.end(), self._tokens(found), [])
+
+    def try_impl(self, string, start, do_actions=True):
+        found = self.regex.match(string, start)
+        if found is None:
+            return self.expr.try_impl(string, start, do_actions)
+        return ParseResults(self, start, found.end(), self._tokens(found), [])
+
+    def _tokens(self, found):
+        groups = found.groups()
+        output = []
+        for group, constant in self.tokens:
+            value = groups[group - 1]
+            if value is not None:
+                output.append(value if constant is None else constant)
+        return output
+
+    def __regex__(self):
+        return self.expr.__regex__()
+
+    def __str__(self):
+        return str(self.expr)
+
+
+def collapse(element):
+    """
+    :return: element, WITH EACH REGULAR SUB-GRAMMAR REPLACED BY A Collapsed
+    """
+    if not ENABLED:
+        return element
+    return _Rewriter().rewrite(element)
+
+
+class _Rewriter(object):
+    __slots__ = ["done"]
+
+    def __init__(self):
+        self.done = {}  # MAP FROM id(element) TO ITS REPLACEMENT
+
+    def rewrite(self, element):
+        done = self.done.get(id(element))
+        if done is not None:
+            return done
+
+        if isinstance(element, (And, MatchFirst, Optional, Suppress, Combine) + REPEATS):
+            output = _collapsed(element)
+            if output is not None:
+                self.done[id(element)] = output
+                return output
+
+        if isinstance(element, Forward):
+            if element.expr is None:
+                return element
+            output = Forward.copy(element)
+            self.done[id(element)] = output
+            output.expr = self.rewrite(element.expr)
+            return output
+        if isinstance(element, (Regex, Collapsed)):
+            # Regex.expr IS ONLY A DESCRIPTION OF THE PATTERN
+            output = element
+        elif isinstance(element, ParseEnhancement):
+            expr = self.rewrite(element.expr) if isinstance(element.expr, ParserElement) else element.expr
+            if expr is element.expr:
+                output = element
+            else:
+                output = element.copy()
+                output.expr = expr
+        elif isinstance(element, ParseExpression):
+            exprs = [self.rewrite(e) for e in element.exprs]
+            if all(n is o for n, o in zip(exprs, element.exprs)):
+                output = element
+            else:
+                output = element.copy()
+                output.exprs = exprs
+                if isinstance(element, (MatchFirst, Or)):
+                    output.alternate = self.alternate(element, exprs)
+        else:
+            output = element
+        self.done[id(element)] = output
+        return output
+
+    def alternate(self, element, exprs):
+        """
+        :return: element.alternate, WITH THE SAME SHAPE, OVER THE REWRITTEN exprs
+        (faster() CAN NOT BE CALLED AGAIN; A Forward BEING REWRITTEN HAS NO expr YET)
+        """
+        if element.alternate is element.exprs:
+            return exprs
+        output = []
+        for e in element.alternate:
+            if isinstance(e, Fast):
+                fast = ParserElement.copy(e)
+                fast.lookup = {k: [self.rewrite(ee) for ee in v] for k, v in e.lookup.items()}
+                fast.regex = e.regex
+                fast.all_keys = e.all_keys
+                fast.message = e.message
+                output.append(fast)
+            else:
+                output.append(self.rewrite(e))
+        return output
+
+
+def _collapsed(element):
+    """
+    :return: Collapsed FOR element, OR None IF IT IS NOT REGULAR
+    """
+    if _shifts_start(element):
+        # THE ParseResults WOULD START AFTER THE WHITESPACE
+        return None
+    builder = _Builder()
+    pattern = builder.pattern(element, True)
+    if pattern is None or builder.leaves < 2:
+        # A SINGLE LEAF IS ALREADY ONE MATCH
+        return None
+    try:
+        regex = re.compile(pattern)
+    except Exception:
+        return None
+    return Collapsed(element, regex, builder.tokens)
+
+
+def _shifts_start(element):
+    """
+    :return: True IF THE ParseResults OF element CAN START AFTER WHERE IT WAS ASKED TO
+    """
+    if isinstance(element, REPEATS) and not isinstance(element, Optional):
+        return True
+    if isinstance(element, MatchFirst):
+        return any(_shifts_start(e) for e in element.exprs)
+    if isinstance(element, (Optional, Suppress)):
+        return _shifts_start(element.expr)
+    return False
+
+
+def recognizer(element, actions=False):
+    """
+    :param actions: True IF THE PARSE ACTIONS RUN (THEY MAY REJECT A MATCH)
+    :return: REGEX THAT MATCHES WHAT element MATCHES, OR None
+    THE TOKENS ARE NOT NEEDED, SO THE NAMES, AND THE PARSE ACTIONS THAT DO NOT
+    RUN (OR ONLY SHAPE THE TOKENS), DO NOT MATTER
+    """
+    if not ENABLED or _shifts_start(element):
+        return None
+    pattern = _Builder(True, actions).pattern(element, False)
+    if pattern is None:
+        return None
+    try:
+        return re.compile(pattern)
+    except Exception:
+        return None
+
+
+class _Builder(object):
+    """
+    TRANSLATE A SUB-GRAMMAR TO A REGEX PATTERN, REMEMBERING WHICH GROUP HOLDS EACH TOKEN
+    """
+
+    __slots__ = ["groups", "tokens", "leaves", "lossy", "recognize", "actions"]
+
+    def __init__(self, recognize=False, actions=False):
+        self.groups = 0
+        self.tokens = []
+        self.leaves = 0
+        self.lossy = False  # True IF THE TOKENS ARE NOT ALL OF THE MATCHED TEXT
+        self.recognize = recognize  # True IF ONLY THE MATCH MATTERS, NOT THE TOKENS
+        self.actions = actions  # True IF THE PARSE ACTIONS RUN, WHEN recognize
+
+    def pattern(self, expr, emit):
+        """
+        :param emit: True IF THE TOKENS OF expr ARE KEPT
+        :return: PATTERN MATCHING WHAT expr MATCHES, OR None IF NOT POSSIBLE
+        """
+        if expr.parser_config.fail_action:
+            return None
+        clazz = expr.__class__
+        if self.recognize:
+            if expr.parse_action and (expr.parser_config.callDuringTry or self.actions):
+                if any(a not in SHAPES for a in expr.parse_action):
+                    return None
+            if clazz is not Combine and isinstance(expr, ParseEnhancement) and clazz.parse_impl is ParseEnhancement.parse_impl:
+                # Group, Suppress, AND THE OTHERS THAT ONLY SHAPE THE TOKENS
+                return self.pattern(expr.expr, False)
+        else:
+            if expr.token_name:
+                return None
+            if clazz is Suppress:
+                if expr.parse_action != [_suppress_post_parse]:
+                    return None
+                self.lossy = True
+                return self.pattern(expr.expr, False)
+            if expr.parse_action:
+                return None
+        if clazz in CONSTANT_LEAVES:
+            return self.leaf(expr.parser_config.regex, expr.parser_config.match, emit)
+        if clazz is Char:
+            return self.leaf(expr.parser_config.regex, None, emit)
+        if clazz in (Word, Regex):
+            return self.leaf(expr.regex, None, emit)
+        if clazz is Combine:
+            return self.combine(expr, emit)
+        if clazz is And:
+            return self.sequence(expr, emit)
+        if clazz is MatchFirst:
+            alternatives = [self.pattern(e, emit) for e in expr.exprs]
+            if None in alternatives:
+                return None
+            return "(?>" + "|".join(alternatives) + ")"
+        if clazz is Optional:
+            inner = self.optional(expr, emit)
+            if inner is None:
+                return None
+            return f"(?:{inner})?+"
+        if clazz in REPEATS:
+            inner = self.repeat(expr, emit)
+            if inner is None:
+                return None
+            min_match = expr.parser_config.min_match
+            max_match = expr.parser_config.max_match
+            if max_match == MAX_INT:
+                return f"{inner}{{{min_match},}}+"
+            return f"{inner}{{{min_match},{max_match}}}+"
+        return None
+
+    def leaf(self, regex, constant, emit):
+        if regex.groupindex or _backtracks(regex.pattern):
+            return None
+        self.leaves += 1
+        if constant is not None and regex.flags & re.IGNORECASE:
+            self.lossy = True
+        flags = regex.flags & ~re.UNICODE
+        inline = "".join(v for k, v in INLINE_FLAGS.items() if flags & k)
+        if flags & ~sum(INLINE_FLAGS):
+            return None
+        pattern = f"(?>(?{inline}:{regex.pattern}))" if inline else f"(?>{regex.pattern})"
+        if emit:
+            self.groups += 1
+            self.tokens.append((self.groups, constant))
+            pattern = f"({pattern})"
+        self.groups += regex.groups
+        return pattern
+
+    def combine(self, expr, emit):
+        """
+        Combine JOINS THE TOKENS, WHICH IS THE MATCHED TEXT WHEN NOTHING IS
+        SKIPPED, SUPPRESSED, OR REPLACED BY A CONSTANT
+        """
+        if self.recognize:
+            return self.pattern(expr.expr, False)
+        if expr.parser_config.separator:
+            return None
+        lossy, self.lossy = self.lossy, False
+        if emit:
+            self.groups += 1
+            group = self.groups
+        inner = self.pattern(expr.expr, False)
+        if inner is None or self.lossy:
+            return None
+        self.lossy = lossy
+        if emit:
+            self.tokens.append((group, None))
+            return f"({inner})"
+        return inner
+
+    def sequence(self, expr, emit):
+        """
+        And ONLY SKIPS WHITESPACE AFTER A CHILD THAT MATCHED SOMETHING, SO THE
+        FIRST CHILD MUST ALWAYS MATCH SOMETHING, AND THE REST EITHER ALWAYS
+        MATCH SOMETHING, OR ARE AN Optional/ZeroOrMore THAT INCLUDES THE
+        WHITESPACE IN ITS MATCH
+        """
+        whitespace = expr.parser_config.whitespace
+        first, *rest = expr.exprs
+        if first.min_length() <= 0:
+            return None
+        acc = [self.pattern(first, emit)]
+        for e in rest:
+            gap = self.gap(whitespace)
+            if e.min_length() > 0:
+                acc.append(gap)
+                acc.append(self.pattern(e, emit))
+            elif e.__class__ is Optional:
+                inner = self.optional(e, emit)
+                acc.append(None if inner is None else f"(?:{gap}{inner})?+")
+            elif e.__class__ in REPEATS and not e.parser_config.min_match:
+                inner = self.repeat(e, emit)
+                if inner is None:
+                    return None
+                max_match = e.parser_config.max_match
+                upper = "" if max_match == MAX_INT else str(max_match)
+                acc.append(f"(?:{gap}{inner}{{1,{upper}}}+)?+")
+            else:
+                return None
+        if None in acc:
+            return None
+        return "".join(acc)
+
+    def optional(self, expr, emit):
+        """
+        :return: PATTERN FOR THE CONTENT OF Optional, WHEN IT IS PRESENT
+        """
+        if expr.expr.min_length() <= 0 or expr.parser_config.end:
+            return None
+        if not self.recognize and (expr.parser_config.default_value or expr.parse_action or expr.token_name):
+            return None
+        return self.pattern(expr.expr, emit)
+
+    def repeat(self, expr, emit):
+        """
+        :return: PATTERN FOR ONE REPETITION, WITH THE WHITESPACE BEFORE IT
+        """
+        if expr.parser_config.end or expr.parser_config.fail_action:
+            return None
+        if not self.recognize and (expr.parse_action or expr.token_name):
+            return None
+        if expr.expr.min_length() <= 0:
+            return None
+        gap = self.gap(expr.parser_config.whitespace)
+        before = len(self.tokens)
+        inner = self.pattern(expr.expr, emit)
+        if inner is None:
+            return None
+        if len(self.tokens) > before and expr.parser_config.max_match > 1:
+            # A GROUP ONLY CAPTURES THE LAST REPETITION
+            return None
+        return f"(?:{gap}{inner})"
+
+    def gap(self, whitespace):
+        """
+        :return: PATTERN FOR Whitespace.skip()
+        """
+        if not whitespace.white_chars and not whitespace.ignore_list:
+            return ""
+        self.lossy = True
+        regex = whitespace.regex
+        self.groups += regex.groups
+        return f"(?>(?s:{regex.pattern}))"
+
+
+def _backtracks(pattern):
+    """
+    :return: True IF pattern HAS AN UNBOUNDED REPEAT INSIDE ANOTHER, LIKE (a+)+,
+    WHICH CAN TAKE EXPONENTIAL TIME TO FAIL (ALSO True FOR BACKREFERENCES,
+    WHICH WOULD POINT TO THE WRONG GROUP)
+    """
+    try:
+        return _nested(sre_parse.parse(pattern), False)
+    except Exception:
+        return True
+
+
+def _nested(items, in_repeat):
+    for op, av in items:
+        if op in (MAX_REPEAT, MIN_REPEAT):
+            _, high, sub = av
+            if high == MAXREPEAT:
+                if in_repeat or _nested(sub, True):
+                    return True
+            elif _nested(sub, in_repeat):
+                return True
+        elif op is POSSESSIVE_REPEAT:
+            # NO BACKTRACKING INTO A POSSESSIVE REPEAT
+            if _nested(av[2], False):
+                return True
+        elif op is ATOMIC_GROUP:
+            if _nested(av, False):
+                return True
+        elif op is SUBPATTERN:
+            if _nested(av[3], in_repeat):
+                return True
+        elif op is BRANCH:
+            if any(_nested(b, in_repeat) for b in av[1]):
+                return True
+        elif op in (ASSERT, ASSERT_NOT):
+            if _nested(av[1], in_repeat):
+                return True
+        elif op in (GROUPREF, GROUPREF_EXISTS):
+            return True
+    return False
+
+
+export("mo_parsing.core", collapse)
+export("mo_parsing.core", recognizer)
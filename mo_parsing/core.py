@@ -1,16 +1,18 @@
 # encoding: utf-8
 import sys
 from collections import namedtuple
-from threading import RLock
+from threading import local
+from types import GeneratorType
 from typing import List
 
 from mo_future import text, first
-from mo_imports import export, expect
+from mo_imports import export, expect, Expecting
 
 from mo_parsing import whitespaces
-from mo_parsing.exceptions import ParseException
+from mo_parsing.exceptions import ParseException, Farthest
+from mo_parsing.memo import Memo
 from mo_parsing.results import ParseResults
-from mo_parsing.utils import Log, MAX_INT, wrap_parse_action, empty_tuple
+from mo_parsing.utils import Log, MAX_INT, wrap_parse_action, empty_tuple, is_forward, portable
 
 (
     SkipTo,
@@ -30,7 +32,15 @@ from mo_parsing.utils import Log, MAX_INT, wrap_parse_action, empty_tuple
     Token,
     Group,
     regex_parameters,
-    _suppress_post_parse
+    _suppress_post_parse,
+    collapse,
+    compile_parser,
+    assemble,
+    dispatch,
+    scanner,
+    recognizer,
+    parse_many,
+    load_or_build,
 ) = expect(
     "SkipTo",
     "Many",
@@ -49,41 +59,132 @@ from mo_parsing.utils import Log, MAX_INT, wrap_parse_action, empty_tuple
     "Token",
     "Group",
     "regex_parameters",
-    "_suppress_post_parse"
+    "_suppress_post_parse",
+    "collapse",
+    "compile_parser",
+    "assemble",
+    "dispatch",
+    "scanner",
+    "recognizer",
+    "parse_many",
+    "load_or_build",
 )
 
 DEBUG = False
+_unscanned = object()  # Parser.scan, Parser.regular AND Parser.exact ARE MADE ON FIRST USE
 
-# TODO: Replace with a stack of parse state
 _reset_actions = []
 
 
 def add_reset_action(action):
     """
     ADD A FUNCTION THAT WILL RESET GLOBAL STATE THAT A PARSER MAY USE
+    PREFER PUTTING PER-PARSE STATE ON THE ParseState, GLOBAL STATE IS NOT THREAD SAFE
     :param action:  CALLABLE
     """
     _reset_actions.append(action)
 
 
-locker = RLock()
-streamlined = {}
+class ParseState(object):
+    """
+    THE MUTABLE STATE OF A SINGLE CALL TO A Parser ENTRYPOINT
+    EACH THREAD HAS ITS OWN STACK OF THESE, SO INDEPENDENT PARSES CAN RUN AT THE SAME TIME
+    """
+
+    __slots__ = [
+        "content",
+        "skips",
+        "num_captures",
+        "indent_stack",
+        "memo",
+        "seeds",
+        "farthest",
+        "lines",
+        "previous",
+    ]
+
+    def __init__(self, memo=None, farthest=False):
+        self.content = None  # THE STRING THE skips ARE FOR
+        self.skips = {}  # MAP FROM Whitespace TO ITS CACHE OF SKIP POSITIONS IN content
+        self.num_captures = 0  # USED BY mo_parsing.regex TO NAME CAPTURE GROUPS
+        self.indent_stack = [1]  # USED BY mo_parsing.helpers.indented_block
+        self.memo = memo and memo.table()  # PACKRAT CACHE, IF THE Parser ASKED FOR ONE
+        self.seeds = {}  # LEFT RECURSIVE Forward RESULTS, WHILE THEY ARE GROWING
+        self.farthest = Farthest() if farthest else None  # REPLACES ParseResults.failures
+        self.lines = None  # LineIndex OF THE LAST STRING lineno(), col() OR line() WAS ASKED ABOUT
+        self.previous = None
+
+    def __enter__(self):
+        self.previous = _state.current
+        _state.current = self
+        return self
 
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _state.current = self.previous
+        self.previous = None
 
-def entrypoint(func):
-    def output(*args, **kwargs):
-        with locker:
-            for a in _reset_actions:
+    def drive(self, generator):
+        """
+        RUN THE generator WITH THIS STATE, EVEN IF IT IS CONSUMED LATER
+        """
+        while True:
+            with self:
                 try:
-                    a()
-                except Exception as e:
-                    Log.error("reset action failed", cause=e)
+                    value = next(generator)
+                except StopIteration:
+                    return
+            yield value
+
+
+class _ThreadState(local):
+    def __init__(self):
+        self.current = ParseState()
+
 
-            return func(*args, **kwargs)
+_state = _ThreadState()
+
+
+def parse_state():
+    """
+    :return: THE ParseState OF THE PARSE RUNNING ON THIS THREAD
+    """
+    return _state.current
+
+
+def _reset():
+    for a in _reset_actions:
+        try:
+            a()
+        except Exception as e:
+            Log.error("reset action failed", cause=e)
+
+
+def entrypoint(func, farthest=None):
+    """
+    :param farthest: OVERRIDE THE farthest MODE OF THE Parser
+    """
+    def output(self, *args, **kwargs):
+        if self.assignments != _assignments:
+            self._check_forwards()
+        _reset()
+        state = ParseState(self.memo, self.farthest if farthest is None else farthest)
+        with state:
+            result = func(self, *args, **kwargs)
+        if isinstance(result, GeneratorType):
+            return state.drive(result)
+        return result
 
     return output
 
 
+def recognition(func):
+    """
+    entrypoint THAT ONLY NEEDS TO KNOW WHERE THE MATCHES ARE: farthest MODE
+    KEEPS NO ParseResults.failures, AND FAILED MATCHES RAISE NOTHING
+    """
+    return entrypoint(func, True)
+
+
 def _verify_whitespace(whi: List):
     if whi is None:
         return None
@@ -105,9 +206,101 @@ def _verify_whitespace(whi: List):
     return whi
 
 
+_assignments = 0  # NUMBER OF Forward ASSIGNMENTS, SO CACHED Parsers CAN NOTICE CHANGE
+
+
+def forward_assigned():
+    """
+    CALLED BY Forward.__lshift__, WHICH MAY INVALIDATE THE CACHED Parsers
+    """
+    global _assignments
+    _assignments += 1
+
+
+def _reachable_forwards(element):
+    """
+    :return: ALL Forward REACHABLE FROM element, AND WHAT THEY ARE ASSIGNED
+    """
+    output = []
+    seen = set()
+    todo = [element]
+    while todo:
+        e = todo.pop()
+        if id(e) in seen:
+            continue
+        seen.add(id(e))
+        if is_forward(e):
+            output.append((e, e.expr))
+        todo.extend(_children(e))
+    return tuple(output)
+
+
+def _post_order(*roots):
+    """
+    :return: ALL ELEMENTS REACHABLE FROM roots, EACH AFTER ITS CHILDREN (BUT FOR
+    CYCLES), SO pickle FINDS THE CHILDREN DONE, AND DOES NOT RECURSE DEEP
+    """
+    output = []
+    seen = set()
+    todo = [(r, False) for r in roots]
+    while todo:
+        e, done = todo.pop()
+        if done:
+            output.append(e)
+            continue
+        if id(e) in seen:
+            continue
+        seen.add(id(e))
+        todo.append((e, True))
+        todo.extend((c, False) for c in _children(e))
+    return output
+
+
+def _children(element):
+    if element.__class__.__name__ == "Regex":
+        return  # ITS expr ONLY DESCRIBES THE PATTERN, AND IS MADE ON FIRST USE
+    child = getattr(element, "expr", None)
+    if isinstance(child, ParserElement):
+        yield child
+    yield from getattr(element, "exprs", empty_tuple)
+    yield from (c for c in getattr(element, "parser_config", empty_tuple) if isinstance(c, ParserElement))
+
+
+class ParserCache(object):
+    """
+    THE Parser FOR A ParserElement, AND WHAT MUST NOT CHANGE FOR IT TO BE REUSED
+    """
+
+    __slots__ = ["parser", "whitespace", "assignments", "forwards"]
+
+    def __init__(self, parser, whitespace, element):
+        self.parser = parser
+        self.whitespace = whitespace
+        self.assignments = _assignments
+        self.forwards = _reachable_forwards(element)
+
+    def get(self):
+        if self.whitespace is not whitespaces.CURRENT:
+            return None
+        if self.assignments == _assignments:
+            return self.parser
+        if any(f.expr is not e for f, e in self.forwards):
+            return None
+        # SOME OTHER Forward WAS ASSIGNED
+        self.assignments = _assignments
+        return self.parser
+
+
 class Parser(object):
-    def __init__(self, element):
-        self.element = element = element.streamline()
+    def __init__(self, element, memo=None, farthest=False):
+        """
+        :param element: THE ParserElement TO PARSE WITH
+        :param memo: TURN ON PACKRAT MEMOIZATION: True, A MAXIMUM SIZE, OR A Memo
+        :param farthest: ONLY TRACK THE FARTHEST FAILURE FOR ERROR MESSAGES; ParseResults.failures STAYS EMPTY
+        """
+        self.memo = Memo.normalize(memo)
+        self.farthest = farthest
+        element = element.streamline()
         try:
             self.whitespace = (
                 _verify_whitespace(element.whitespace)
@@ -118,10 +311,81 @@ class Parser(object):
             Log.error("problem", cause=cause)
 
         with self.whitespace:
-            self.element = Group(element)
+            # WITHOUT THE Collapsed ELEMENTS, TO EXPLAIN A FAILURE
+            self.original = Group(element)
 
         self.named = bool(element.token_name)
         self.streamlined = True
+        self._collapse()
+
+    def _collapse(self):
+        """
+        REPLACE THE REGULAR SUB-GRAMMARS WITH Collapsed ELEMENTS, AND SET THE
+        dispatch TABLE OF EVERY CHOICE
+        THE Forwards ARE COPIED, SO WE MUST WATCH FOR THEIR RE-ASSIGNMENT
+        """
+        element = self.original.expr
+        self.assignments = _assignments
+        self.forwards = _reachable_forwards(element)
+        if isinstance(collapse, Expecting):
+            # THE regex MODULE NEEDS A Parser BEFORE collapse IS LOADED
+            collapsed = element
+        else:
+            collapsed = collapse(element)
+        if collapsed is element:
+            self.element = self.original
+        else:
+            with self.whitespace:
+                self.element = Group(collapsed)
+        if not isinstance(dispatch, Expecting):
+            dispatch(self.original, self.element)
+        self.scan = self.regular = self.exact = _unscanned
+
+    def _check_forwards(self):
+        """
+        SOME Forward WAS ASSIGNED; COLLAPSE AGAIN IF IT WAS ONE OF OURS
+        """
+        if any(f.expr is not e for f, e in self.forwards):
+            self._collapse()
+        else:
+            self.assignments = _assignments
+
+    @staticmethod
+    def load_or_build(cache_path, factory, memo=None, farthest=False):
+        """
+        :param cache_path: FILE FOR THE SNAPSHOT OF THE Parser
+        :param factory: FUNCTION THAT RETURNS THE GRAMMAR (ParserElement OR Parser)
+        :param memo: SEE Parser(), IF factory RETURNS A ParserElement
+        :param farthest: SEE Parser(), IF factory RETURNS A ParserElement
+        :return: THE Parser SAVED AT cache_path, IF IT WAS BUILT FROM THE SAME
+        SOURCE; OTHERWISE THE Parser BUILT WITH factory, WHICH IS SAVED THERE
+        """
+        return load_or_build(cache_path, factory, memo, farthest)
+
+    def __getstate__(self):
+        # THE REGEXES MADE ON FIRST USE ARE KEPT, IF THEY WERE MADE
+        return {
+            "elements": _post_order(self.original, self.element),
+            **{k: v for k, v in self.__dict__.items() if v is not _unscanned},
+        }
+
+    def __setstate__(self, state):
+        state.pop("elements")
+        self.scan = self.regular = self.exact = _unscanned
+        self.__dict__.update(state)
+        self.assignments = _assignments
+
+    def compile(self):
+        """
+        :return: CompiledParser, WITH A PYTHON FUNCTION FOR EACH ParserElement, THAT GIVES THE SAME ParseResults
+        """
+        return compile_parser(self)
+
+    def assemble(self):
+        """
+        :return: Program, THE GRAMMAR AS INSTRUCTIONS FOR A STACK MACHINE, THAT PARSES DEEP NESTING WITHOUT RECURSION
+        """
+        return assemble(self)
 
     @entrypoint
     def parse(self, string, parse_all=False):
@@ -152,17 +416,44 @@ class Parser(object):
 
     parse_string = parse
 
-    def _parseString(self, string, parse_all=False):
+    def _parseString(self, string, parse_all=False, do_actions=True):
+        try:
+            return self._parse_element(self.element, string, parse_all, do_actions)
+        except ParseException:
+            if self.original is self.element:
+                raise
+        # A Collapsed ELEMENT DOES NOT KEEP THE FAILURES INSIDE IT, SO THE
+        # ORIGINAL GRAMMAR IS ASKED FOR THE ERROR
+        _reset()
+        with ParseState(self.memo, self.farthest):
+            return self._parse_element(self.original, string, parse_all, do_actions)
+
+    @entrypoint
+    def _explain(self, string, parse_all=False):
+        """
+        :return: THE ParseException FOR A string THAT compile() OR assemble()
+        FAILED TO PARSE, FROM A PARSE WITHOUT THE PARSE ACTIONS, SO THEIR SIDE
+        EFFECTS DO NOT HAPPEN AGAIN; None IF ONLY A PARSE ACTION FAILED
+        """
+        try:
+            self._parseString(string, parse_all, do_actions=False)
+        except ParseException as cause:
+            return cause
+        return None
+
+    def _parse_element(self, element, string, parse_all, do_actions=True):
+        if self.farthest and ParserElement._parse is _native_parse:
+            return self._tryString(element, string, parse_all, do_actions)
         start = self.whitespace.skip(string, 0)
         try:
-            tokens = self.element._parse(string, start)
+            tokens = element._parse(string, start, do_actions)
             if parse_all:
                 end = self.whitespace.skip(string, tokens.end)
                 try:
                     StringEnd()._parse(string, end)
                 except ParseException as pe:
                     raise ParseException(
-                        self.element, 0, string, cause=tokens.failures + [pe]
+                        element, 0, string, cause=tokens.failures + [pe]
                     ) from None
 
             if self.named:
@@ -170,8 +461,30 @@ class Parser(object):
             else:
                 return tokens.tokens[0]
         except ParseException as cause:
+            farthest = _state.current.farthest
+            if farthest is not None:
+                raise farthest.exception(element, string, cause) from None
             raise cause.best_cause from None
 
+    def _tryString(self, element, string, parse_all=False, do_actions=True):
+        """
+        NO EXCEPTIONS ARE RAISED INSIDE THE GRAMMAR; FAILURES ARE None, AND
+        THE ONE ParseException IS MADE HERE, FROM THE Farthest REGISTER
+        """
+        farthest = _state.current.farthest
+        start = self.whitespace.skip(string, 0)
+        tokens = element._try(string, start, do_actions)
+        if tokens is not None and parse_all:
+            end = self.whitespace.skip(string, tokens.end)
+            if StringEnd()._try(string, end) is None:
+                tokens = None
+        if tokens is None:
+            raise farthest.exception(element, string)
+        if self.named:
+            return tokens
+        else:
+            return tokens.tokens[0]
+
     @entrypoint
     def scan_string(self, string, max_matches=MAX_INT, overlap=False):
         """
@@ -187,23 +500,168 @@ class Parser(object):
             )
         )
 
-    def _scan_string(self, string, max_matches=MAX_INT, overlap=False):
+    def _scan_string(self, string, max_matches=MAX_INT, overlap=False, do_actions=True):
         instrlen = len(string)
         start = end = 0
         matches = 0
+        scan = self._scanner()
+        regular = None if do_actions else self._regular()
+        white = self.whitespace.white_chars
+        trying = _state.current.farthest is not None and ParserElement._parse is _native_parse
         while end <= instrlen and matches < max_matches:
-            try:
-                start = self.whitespace.skip(string, end)
-                tokens = self.element._parse(string, start)
-            except ParseException:
-                end = start + 1
+            if scan is not None:
+                # NOTHING MATCHES BEFORE THE NEXT CANDIDATE, SO START AT THE WHITESPACE BEFORE IT
+                found = scan.search(string, end)
+                if found is None:
+                    break
+                candidate = found.start()
+                while candidate > end and string[candidate - 1] in white:
+                    candidate -= 1
+                end = candidate
+            start = self.whitespace.skip(string, end)
+            if regular is not None:
+                # NO TOKENS, JUST WHERE THE MATCH ENDS
+                found = regular.match(string, start)
+                if found is None:
+                    end = start + 1
+                    continue
+                tokens, stop = None, found.end()
             else:
-                matches += 1
-                yield tokens, tokens.start, tokens.end
-                if overlap or tokens.end <= end:
-                    end += 1
+                if trying:
+                    tokens = self.element._try(string, start, do_actions)
                 else:
-                    end = tokens.end
+                    try:
+                        tokens = self.element._parse(string, start, do_actions)
+                    except ParseException:
+                        tokens = None
+                if tokens is None:
+                    end = start + 1
+                    continue
+                start, stop = tokens.start, tokens.end
+            matches += 1
+            yield tokens, start, stop
+            if overlap or stop <= end:
+                end += 1
+            else:
+                end = stop
+
+    @recognition
+    def scan_spans(self, string, max_matches=MAX_INT, overlap=False):
+        """
+        WHERE scan_string FINDS ITS MATCHES, WITHOUT MAKING THE TOKENS, OR RUNNING THE
+        PARSE ACTIONS; A CONDITION ONLY REJECTS A MATCH IF IT IS callDuringTry,
+        OR IT IS INSIDE AN Or, WHERE THE CONDITIONS STILL DECIDE THE LONGEST
+        :param string: TO BE SCANNED
+        :param max_matches: MAXIMUM NUMBER MATCHES TO RETURN
+        :param overlap: IF MATCHES CAN OVERLAP
+        :return: SEQUENCE OF (start, end)
+        """
+        return (
+            (s, e)
+            for _, s, e in self._scan_string(
+                string, max_matches=max_matches, overlap=overlap, do_actions=False
+            )
+        )
+
+    @recognition
+    def count(self, string):
+        """
+        :return: NUMBER OF MATCHES search_string FINDS, COUNTED LIKE scan_spans
+        """
+        return sum(1 for _ in self._scan_string(string, do_actions=False))
+
+    def _scanner(self):
+        """
+        :return: REGEX FOR WHERE A MATCH CAN START, None IF IT CAN BE ANYWHERE
+        """
+        if self.scan is _unscanned:
+            if isinstance(scanner, Expecting):
+                self.scan = None
+            else:
+                self.scan = scanner(self.element, self.whitespace)
+        return self.scan
+
+    def _regular(self):
+        """
+        :return: REGEX THAT MATCHES WHAT THE GRAMMAR MATCHES WITHOUT PARSE ACTIONS, OR None
+        """
+        if self.regular is _unscanned:
+            if isinstance(recognizer, Expecting):
+                self.regular = None
+            else:
+                self.regular = recognizer(self.original.expr)
+        return self.regular
+
+    def _exact(self):
+        """
+        :return: REGEX THAT MATCHES WHAT THE GRAMMAR MATCHES WITH ITS PARSE ACTIONS, OR None
+        """
+        if self.exact is _unscanned:
+            if isinstance(recognizer, Expecting):
+                self.exact = None
+            else:
+                self.exact = recognizer(self.original.expr, actions=True)
+        return self.exact
+
+    @recognition
+    def matches(self, string, parse_all=True):
+        """
+        :return: True IF parse(string, parse_all) WOULD SUCCEED
+        NO ParseException IS MADE, AND A GRAMMAR WITHOUT PARSE ACTIONS THAT IS
+        REGULAR IS MATCHED WITH ONE REGEX
+        """
+        return self._recognize(string, parse_all)
+
+    @recognition
+    def failure_offset(self, string, parse_all=True):
+        """
+        :return: None IF parse(string, parse_all) WOULD SUCCEED, OTHERWISE THE
+        FARTHEST OFFSET THE GRAMMAR REACHED BEFORE IT FAILED
+        """
+        if self._recognize(string, parse_all):
+            return None
+        if self.exact is not None:
+            # THE REGEX CAN NOT TELL WHERE IT FAILED
+            _state.current.farthest = Farthest()
+            self._recognize(string, parse_all, False)
+        return max(_state.current.farthest.loc, 0)
+
+    def parse_many(self, strings, factory=None, workers=None, chunksize=100, ordered=True, parse_all=False, convert=None):
+        """
+        PARSE MANY INDEPENDENT STRINGS, ON A POOL OF PROCESSES
+        :param strings: ITERABLE OF STRINGS, READ AS THE WORKERS NEED THEM
+        :param factory: IMPORTABLE FUNCTION THAT RETURNS THIS GRAMMAR (ParserElement OR Parser); EACH WORKER CALLS IT ONCE
+                        (DEFAULT IS TO PICKLE THIS Parser FOR EACH WORKER)
+        :param workers: NUMBER OF PROCESSES (DEFAULT ONE PER CPU); 1 PARSES IN THIS PROCESS
+        :param chunksize: NUMBER OF STRINGS SENT TO A WORKER AT A TIME
+        :param ordered: YIELD THE RESULTS IN THE ORDER OF strings, OTHERWISE AS THE CHUNKS FINISH
+        :param convert: IMPORTABLE FUNCTION OF ParseResults TO PLAIN DATA (DEFAULT as_list())
+        :return: GENERATOR OF PLAIN DATA, OR ParseException FOR THE STRINGS THAT FAILED
+        """
+        return parse_many(self, strings, factory, workers, chunksize, ordered, parse_all, convert)
+
+    def _recognize(self, string, parse_all, regex=True):
+        start = self.whitespace.skip(string, 0)
+        exact = self._exact() if regex else None
+        if exact is not None:
+            found = exact.match(string, start)
+            if found is None:
+                return False
+            end = found.end()
+        elif ParserElement._parse is _native_parse:
+            tokens = self.element._try(string, start)
+            if tokens is None:
+                return False
+            end = tokens.end
+        else:
+            try:
+                end = self.element._parse(string, start).end
+            except ParseException:
+                return False
+        if not parse_all:
+            return True
+        end = self.whitespace.skip(string, end)
+        return end == len(string) or StringEnd()._try(string, end) is not None
 
     @entrypoint
     def transform_string(self, string):
@@ -313,8 +771,10 @@ class ParserElement(object):
         "streamlined",
         "min_length_cache",
         "parser_config",
+        "parser_cache",
     ]
-    Config = namedtuple("Config", ["callDuringTry", "fail_action"])
+    # memoize IS None WHEN NOTHING INSIDE THE ELEMENT IS MEMOIZED, SEE no_memo()
+    Config = namedtuple("Config", ["callDuringTry", "fail_action", "memoize"])
 
     def __init__(self):
         self.parse_action = list()
@@ -322,9 +782,47 @@ class ParserElement(object):
         self.token_name = ""
         self.streamlined = False
         self.min_length_cache = -1
+        self.parser_cache = None
 
         self.parser_config = self.Config(*([None] * len(self.Config._fields)))
-        self.set_config(callDuringTry=False, fail_action=None)
+        self.set_config(callDuringTry=False, fail_action=None, memoize=True)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "parse_impl" in cls.__dict__ and "try_impl" not in cls.__dict__:
+            # AN INHERITED try_impl() WOULD NOT MATCH THE NEW parse_impl()
+            cls.try_impl = ParserElement.try_impl
+
+    def __getstate__(self):
+        """
+        EVERY SLOT, WITH THE Config AS A tuple, AND THE PARSE ACTIONS AS THE
+        FUNCTIONS GIVEN, REFERENCED BY QUALIFIED NAME (OR CODE, FOR A lambda)
+        """
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in self.__class__.__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name.startswith("__"):
+                    name = f"_{cls.__name__.lstrip('_')}{name}"
+                try:
+                    # THE SLOT ITSELF, NOT A PROPERTY OF A SUBCLASS
+                    state[name] = portable(cls.__dict__[name].__get__(self))
+                except AttributeError:
+                    pass
+        if "parser_config" in state:
+            state["parser_config"] = tuple(portable(v) for v in self.parser_config)
+        if "parse_action" in state:
+            state["parse_action"] = [_action_state(a) for a in self.parse_action]
+        if "parser_cache" in state:
+            state["parser_cache"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        if "parser_config" in state:
+            self.parser_config = self.Config(*state["parser_config"])
+        if "parse_action" in state:
+            self.parse_action = [_load_action(a) for a in state["parse_action"]]
 
     def set_config(self, **map):
         data = {
@@ -341,6 +839,7 @@ class ParserElement(object):
         output.parser_config = self.parser_config
         output.streamlined = self.streamlined
         output.min_length_cache = -1
+        output.parser_cache = None
         return output
 
     def set_parser_name(self, name):
@@ -400,22 +899,9 @@ class ParserElement(object):
         - fatal   = if True, will raise ParseFatalException to stop parsing immediately; otherwise will raise ParseException
 
         """
-
-        def make_cond(fn):
-            def cond(token, index, string):
-                result = fn(token, index, string)
-                if not bool(result.tokens[0]):
-                    error = ParseException(token.type, index, string, msg=message)
-                    if fatal:
-                        Log.error("fatal error", cause=error)
-                    raise error
-                return token
-
-            return cond
-
         output = self.copy()
         for fn in fns:
-            output.parse_action.append(make_cond(wrap_parse_action(fn)))
+            output.parse_action.append(_condition(wrap_parse_action(fn), message, fatal))
 
         output.set_config(
             callDuringTry=self.parser_config.callDuringTry or callDuringTry
@@ -435,6 +921,17 @@ class ParserElement(object):
         self.set_config(fail_action=fn)
         return self
 
+    def no_memo(self, inside=False):
+        """
+        RETURN COPY OF THIS ELEMENT THAT IS NEVER MEMOIZED
+        USE THIS WHEN THE PARSE ACTIONS ARE NOT PURE (THEY DEPEND ON, OR CHANGE, STATE)
+        :param inside: ALSO TURN OFF THE MEMO FOR EVERYTHING PARSED INSIDE THIS
+        ELEMENT, FOR WHEN THEY DEPEND ON STATE THAT CHANGES WHILE IT IS PARSED
+        """
+        output = self.copy()
+        output.set_config(memoize=None if inside else False)
+        return output
+
     def is_annotated(self):
         action = first(a for a in self.parse_action if a is not _suppress_post_parse)
         return action or self.token_name or self.parser_name
@@ -464,32 +961,160 @@ class ParserElement(object):
     def parse_impl(self, string, start, do_actions=True):
         return ParseResults(self, start, start, [], [])
 
+    def _actions(self, do_actions):
+        """
+        :param do_actions: True, False, OR None WHEN AN Or IS TRYING ITS
+        ALTERNATIVES: THE CONDITIONS STILL DECIDE WHICH ONE MATCHES, SO THEY
+        RUN, WITH THE PARSE ACTIONS BEFORE THEM (WHICH MAY MAKE WHAT THEY TEST)
+        :return: THE PARSE ACTIONS TO RUN ON A MATCH
+        """
+        if do_actions or self.parser_config.callDuringTry:
+            return self.parse_action
+        if do_actions is None:
+            actions = self.parse_action
+            for i in range(len(actions), 0, -1):
+                if hasattr(actions[i - 1], "condition"):
+                    return actions[:i]
+        return None
+
     def _parse(self, string, start, do_actions=True):
+        state = _state.current
+        memo = state.memo
+        if memo is not None:
+            memoize = self.parser_config.memoize
+            if memoize:
+                return memo.parse(self, string, start, do_actions)
+            if memoize is None:
+                # NOTHING INSIDE IS MEMOIZED EITHER
+                state.memo = None
+                try:
+                    return self._parse_uncached(string, start, do_actions)
+                finally:
+                    state.memo = memo
+        return self._parse_uncached(string, start, do_actions)
+
+    def _parse_uncached(self, string, start, do_actions=True):
         try:
             result = self.parse_impl(string, start, do_actions)
         except ParseException as cause:
             self.parser_config.fail_action and self.parser_config.fail_action(
                 self, start, string, cause
             )
-            raise ParseException(self, start, string, cause=cause) from None
+            farthest = _state.current.farthest
+            if farthest is None:
+                raise ParseException(self, start, string, cause=cause) from None
+            # REGISTER THE FARTHEST FAILURE, AND DROP THE CAUSES
+            failure = ParseException(self, start, string)
+            if not cause.unsorted_cause:
+                farthest.add(cause)
+            elif self.parser_name:
+                farthest.add(failure)
+            raise failure from None
+
+        actions = self._actions(do_actions) if self.parse_action else None
+        if actions:
+            try:
+                for fn in actions:
+                    next_result = fn(result, result.start, string)
+                    if next_result.end < result.end:
+                        Log.error(
+                            "parse action {{name}} not allowed to roll back the end of parsing",
+                            name=fn.__name__
+                        )
+                    result = next_result
+            except ParseException as cause:
+                farthest = _state.current.farthest
+                if farthest is not None:
+                    farthest.add(cause)
+                raise
+        if result.failures and _state.current.farthest is not None:
+            result.failures = []
+        return result
 
-        if do_actions or self.parser_config.callDuringTry:
-            for fn in self.parse_action:
-                next_result = fn(result, result.start, string)
-                if next_result.end < result.end:
-                    Log.error(
-                        "parse action {{name}} not allowed to roll back the end of parsing",
-                        name=fn.__name__
-                    )
-                result = next_result
+    def try_impl(self, string, start, do_actions=True):
+        """
+        :return: ParseResults, OR None (REGISTERED WITH no_match) IF THERE IS NO MATCH
+        THIS IS THE ADAPTER FOR ELEMENTS THAT ONLY HAVE A parse_impl()
+        """
+        try:
+            return self.parse_impl(string, start, do_actions)
+        except ParseException as cause:
+            if not cause.unsorted_cause:
+                _state.current.farthest.add(cause)
+            return None
+
+    def _try(self, string, start, do_actions=True):
+        """
+        SAME AS _parse(), BUT RETURN None INSTEAD OF RAISING ParseException
+        ONLY USED IN farthest MODE, WHERE THE Farthest REGISTER HOLDS THE FAILURES
+        """
+        state = _state.current
+        memo = state.memo
+        if memo is not None:
+            memoize = self.parser_config.memoize
+            if memoize:
+                return memo.try_parse(self, string, start, do_actions)
+            if memoize is None:
+                state.memo = None
+                try:
+                    return self._try_uncached(string, start, do_actions)
+                finally:
+                    state.memo = memo
+        return self._try_uncached(string, start, do_actions)
+
+    def _try_uncached(self, string, start, do_actions=True):
+        farthest = _state.current.farthest
+        loc, size = farthest.loc, len(farthest.expected)
+        result = self.try_impl(string, start, do_actions)
+        if result is None:
+            if farthest.loc != loc or len(farthest.expected) != size:
+                # THE FAILURES OF THE CHILDREN BECOME THE CAUSES OF THIS ONE, AS IN THE DEFAULT MODE
+                farthest.group(self, start, loc, size)
+            elif self.parser_name:
+                farthest.fail(self, start)
+            self.parser_config.fail_action and self.parser_config.fail_action(
+                self, start, string, ParseException(self, start, string)
+            )
+            return None
+
+        actions = self._actions(do_actions) if self.parse_action else None
+        if actions:
+            try:
+                for fn in actions:
+                    next_result = fn(result, result.start, string)
+                    if next_result.end < result.end:
+                        Log.error(
+                            "parse action {{name}} not allowed to roll back the end of parsing",
+                            name=fn.__name__
+                        )
+                    result = next_result
+            except ParseException as cause:
+                _state.current.farthest.add(cause)
+                return None
+        if result.failures:
+            result.failures = []
         return result
 
-    def finalize(self):
+    def finalize(self, memo=None, farthest=False):
         """
         Return a Parser for use in parsing (optimization only)
+        WITHOUT OPTIONS, THE Parser IS CACHED UNTIL THE WHITESPACE CONTEXT, OR A
+        REACHABLE Forward, CHANGES
+        :param memo: TURN ON PACKRAT MEMOIZATION: True, A MAXIMUM SIZE, OR A Memo
+        :param farthest: ONLY TRACK THE FARTHEST FAILURE FOR ERROR MESSAGES; ParseResults.failures STAYS EMPTY
         :return:
         """
-        return Parser(self)
+        if memo is not None or farthest:
+            return Parser(self, memo=memo, farthest=farthest)
+        cache = self.parser_cache
+        if cache is not None:
+            parser = cache.get()
+            if parser is not None:
+                return parser
+        whitespace = whitespaces.CURRENT
+        parser = Parser(self)
+        self.parser_cache = ParserCache(parser, whitespace, self)
+        return parser
 
     def parse(self, string, parse_all=False):
         return self.finalize().parse(string, parse_all)
@@ -503,6 +1128,27 @@ class ParserElement(object):
             .scan_string(string, max_matches=max_matches, overlap=overlap)
         )
 
+    def scan_spans(self, string, max_matches=MAX_INT, overlap=False):
+        return (
+            self
+            .finalize()
+            .scan_spans(string, max_matches=max_matches, overlap=overlap)
+        )
+
+    def count(self, string):
+        return self.finalize().count(string)
+
+    def parse_many(self, strings, factory=None, workers=None, chunksize=100, ordered=True, parse_all=False, convert=None):
+        return self.finalize().parse_many(
+            strings,
+            factory=factory,
+            workers=workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            parse_all=parse_all,
+            convert=convert,
+        )
+
     def transform_string(self, string):
         return self.finalize().transform_string(string)
 
@@ -763,11 +1409,59 @@ class ParserElement(object):
             expr = Word(nums)
             assert expr.matches("100")
         """
-        try:
-            self.parse_string(text(test_string), parse_all=parse_all)
-            return True
-        except ParseException:
-            return False
+        return self.finalize().matches(text(test_string), parse_all=parse_all)
+
+    def failure_offset(self, string, parse_all=True):
+        return self.finalize().failure_offset(string, parse_all=parse_all)
+
+
+def _condition(fn, message, fatal):
+    def cond(token, index, string):
+        result = fn(token, index, string)
+        if not bool(result.tokens[0]):
+            error = ParseException(token.type, index, string, msg=message)
+            if fatal:
+                Log.error("fatal error", cause=error)
+            raise error
+        return token
+
+    cond.condition = fn.action, message, fatal
+    return cond
+
+
+def _action_state(action):
+    """
+    :return: WHAT IS PICKLED FOR A PARSE ACTION: THE FUNCTION GIVEN, NOT ITS WRAPPER
+    """
+    condition = getattr(action, "condition", None)
+    if condition:
+        fn, message, fatal = condition
+        return "condition", portable(fn), message, fatal
+    original = getattr(action, "action", None)
+    if original:
+        return "action", portable(original)
+    return portable(action)
+
+
+def _load_action(state):
+    if not isinstance(state, tuple):
+        return state
+    if state[0] == "condition":
+        _, fn, message, fatal = state
+        return _condition(wrap_parse_action(fn), message, fatal)
+    return wrap_parse_action(state[1])
+
+
+_native_parse = ParserElement._parse  # Debugger AND Profiler REPLACE _parse, AND NEED THE EXCEPTIONS
+
+
+def no_match(expr, start, msg=""):
+    """
+    REGISTER THE FAILURE OF expr AT start, FOR try_impl()
+    :return: None
+    """
+    _state.current.farthest.fail(expr, start, msg)
+    return None
 
 
 class _PendingSkip(ParserElement):
@@ -811,3 +1505,5 @@ NO_RESULTS = ParseResults(NO_PARSER, -1, 0, [], [])
 export("mo_parsing.results", ParserElement)
 export("mo_parsing.results", NO_PARSER)
 export("mo_parsing.results", NO_RESULTS)
+export("mo_parsing.lines", parse_state)
+export("mo_parsing.skips", parse_state)
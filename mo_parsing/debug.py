@@ -56,9 +56,10 @@ def _debug_parse(debugger):
                 fail(self, start, string, cause)
             raise ParseException(self, start, string, cause=cause) from None
 
-        if self.parse_action and (do_actions or self.parser_config.callDuringTry):
+        actions = self._actions(do_actions) if self.parse_action else None
+        if actions:
             try:
-                for fn in self.parse_action:
+                for fn in actions:
                     tokens = fn(tokens, start, string)
             except Exception as cause:
                 fail(self, start, string, cause)
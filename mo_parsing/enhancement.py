@@ -6,8 +6,9 @@ from mo_future import text, is_text
 from mo_imports import export, expect
 
 from mo_parsing import whitespaces
-from mo_parsing.core import ParserElement
+from mo_parsing.core import ParserElement, parse_state, forward_assigned, no_match
 from mo_parsing.exceptions import ParseException, RecursiveGrammarException
+from mo_parsing.memo import copy_result
 from mo_parsing.results import ParseResults, ForwardResults, Annotation
 from mo_parsing.utils import (
     Log,
@@ -67,6 +68,12 @@ class ParseEnhancement(ParserElement):
         except ParseException as cause:
             raise ParseException(self, start, string, cause=cause) from None
 
+    def try_impl(self, string, start, do_actions=True):
+        result = self.expr._try(string, start, do_actions)
+        if result is None:
+            return None
+        return ParseResults(self, result.start, result.end, [result], [])
+
     def streamline(self):
         if self.streamlined:
             return self
@@ -86,7 +93,7 @@ class ParseEnhancement(ParserElement):
 
     def check_recursion(self, seen=empty_tuple):
         if self in seen:
-            raise RecursiveGrammarException(seen + (self,))
+            return _check_loop(self, seen)
         if self.expr != None:
             self.expr.check_recursion(seen + (self,))
 
@@ -121,6 +128,13 @@ class LookAhead(ParseEnhancement):
 
         return ParseResults(self, start, start, [result], result.failures)
 
+    def try_impl(self, string, start, do_actions=True):
+        result = self.expr._try(string, start, do_actions)
+        if result is None:
+            return None
+        result.__class__ = Annotation
+        return ParseResults(self, start, start, [result], [])
+
     def __regex__(self):
         return "*", f"(?={self.expr.__regex__()[1]})"
 
@@ -164,6 +178,14 @@ class NotAny(LookAhead):
             except:
                 return ParseResults(self, start, start, [], [])
 
+    def try_impl(self, string, start, do_actions=True):
+        regex = self.regex
+        if regex:
+            if regex.match(string, start):
+                return ParseResults(self, start, start, [], [])
+            return no_match(self, start)
+        return ParserElement.try_impl(self, string, start, do_actions)
+
     def streamline(self):
         output = ParseEnhancement.streamline(self)
         if isinstance(output, Empty):
@@ -272,6 +294,38 @@ class Many(ParseEnhancement):
             else:
                 return ParseResults(self, start, end, acc, failures)
 
+    def try_impl(self, string, start, do_actions=True):
+        acc = []
+        end = start
+        max = self.parser_config.max_match
+        min = self.parser_config.min_match
+        stopper = self.parser_config.end
+        whitespace = self.parser_config.whitespace
+        expr = self.expr
+        count = 0
+        while end < len(string):
+            index = whitespace.skip(string, end)
+            if stopper and stopper.match(string, index):
+                if min <= count:
+                    break
+                no_match(self, end, "found stopper too soon")
+                break
+            result = expr._try(string, index, do_actions)
+            if result is None:
+                break
+            end = result.end
+            if result.end - result.start:
+                acc.append(result)
+                count += 1
+                if count >= max:
+                    break
+
+        if count < min or max < count:
+            return None
+        if count:
+            return ParseResults(self, acc[0].start, acc[-1].end, acc, [])
+        return ParseResults(self, start, end, acc, [])
+
     def streamline(self):
         if self.streamlined:
             return self
@@ -377,6 +431,12 @@ class ZeroOrMore(Many):
         except ParseException as pe:
             return ParseResults(self, start, start, [], [pe])
 
+    def try_impl(self, string, start, do_actions=True):
+        result = Many.try_impl(self, string, start, do_actions)
+        if result is None:
+            return ParseResults(self, start, start, [], [])
+        return result
+
     def __str__(self):
         if self.parser_name:
             return self.parser_name
@@ -406,6 +466,12 @@ class Optional(Many):
         except ParseException as pe:
             return ParseResults(self, start, start, self.parser_config.default_value, [pe])
 
+    def try_impl(self, string, start, do_actions=True):
+        results = self.expr._try(string, start, do_actions)
+        if results is None:
+            return ParseResults(self, start, start, self.parser_config.default_value, [])
+        return ParseResults(self, results.start, results.end, [results], [])
+
     def __str__(self):
         if self.parser_name:
             return self.parser_name
@@ -416,7 +482,7 @@ class Optional(Many):
 class SkipTo(ParseEnhancement):
     """Token for skipping over all undefined text until the matched expression is found."""
 
-    __slots__ = []
+    __slots__ = ["scan"]
     Config = append_config(ParseEnhancement, "include", "fail", "ignore", "whitespace")
 
     def __init__(self, expr, include=False, ignore=None, fail_on=None, engine_=None):
@@ -438,8 +504,14 @@ class SkipTo(ParseEnhancement):
             ignore=ignore,
             whitespace=engine_ or whitespaces.CURRENT,
         )
+        self.scan = None  # REGEX FOR WHERE fail, ignore, OR expr CAN START, SET BY THE Parser
         self.parser_name = str(self)
 
+    def copy(self):
+        output = ParseEnhancement.copy(self)
+        output.scan = None
+        return output
+
     def min_length(self):
         return 0
 
@@ -458,6 +530,10 @@ class SkipTo(ParseEnhancement):
 
         loc = start
         while loc <= instrlen:
+            if self.scan is not None:
+                loc = self._next(string, loc)
+                if loc > instrlen:
+                    continue
             skip_end = loc
             loc = before_end = self.parser_config.whitespace.skip(string, loc)
             if fail:
@@ -503,6 +579,93 @@ class SkipTo(ParseEnhancement):
         else:
             return ParseResults(self, start, before_end, skip_result, [])
 
+    def try_impl(self, string, start, do_actions=True):
+        instrlen = len(string)
+        fail = self.parser_config.fail
+        ignore = self.parser_config.ignore
+        whitespace = self.parser_config.whitespace
+        expr = self.expr
+
+        loc = start
+        while loc <= instrlen:
+            if self.scan is not None:
+                loc = self._next(string, loc)
+                if loc > instrlen:
+                    continue
+            skip_end = loc
+            loc = before_end = whitespace.skip(string, loc)
+            if fail and fail._try(string, loc) is not None:
+                # break if fail_on expression matches
+                break
+
+            if ignore:
+                # advance past ignore expressions
+                while 1:
+                    result = ignore._try(string, loc)
+                    if result is None:
+                        break
+                    loc = skip_end = result.end
+                    loc = before_end = whitespace.skip(string, loc)
+            result = expr._try(string, loc, False)
+            if result is None:
+                # no match, advance loc in string
+                loc += 1
+            else:
+                # matched skipto expr, done
+                loc = result.end
+                break
+        else:
+            # ran off the end of the input string without matching skipto expr, fail
+            return no_match(self, start)
+
+        # build up return values
+        end = loc
+        skiptext = string[start:skip_end]
+        skip_result = []
+        if skiptext:
+            skip_result.append(skiptext)
+
+        if self.parser_config.include:
+            end_result = expr._try(string, before_end, do_actions)
+            if end_result is None:
+                return None
+            skip_result.append(end_result)
+            return ParseResults(self, start, end, skip_result, [])
+        else:
+            return ParseResults(self, start, before_end, skip_result, [])
+
+    def _next(self, string, loc):
+        """
+        :return: WHERE THE LOOP MUST LOOK NEXT, len(string)+1 IF NOTHING IS LEFT
+        NOTHING CAN MATCH BEFORE THE NEXT scan CANDIDATE, SO THE LOOP CAN START AT THE
+        WHITESPACE BEFORE IT.  IN farthest MODE, THE LAST POSITION SKIPPED IS STILL
+        TRIED, TO REGISTER THE SAME FAILURE
+        """
+        farthest = parse_state().farthest
+        found = self.scan.search(string, loc)
+        if found is None:
+            end = len(string)
+            return end + 1 if farthest is None else max(loc, end)
+        white = self.parser_config.whitespace.white_chars
+        candidate = found.start()
+        while candidate > loc and string[candidate - 1] in white:
+            candidate -= 1
+        if farthest is not None and candidate > loc:
+            return candidate - 1
+        return candidate
+
+
+def _check_loop(element, seen):
+    """
+    element IS IN seen, SO WE HAVE A LOOP THAT CONSUMED NOTHING
+    ONLY A LEFT RECURSIVE Forward CAN PARSE THAT
+    """
+    loop = seen[seen.index(element) :]
+    for e in loop:
+        if isinstance(e, Forward) and e.parser_config.left_recursion:
+            return
+    raise RecursiveGrammarException(seen + (element,))
+
 
 class Forward(ParserElement):
     """Forward declaration of an expression to be defined later -
@@ -528,6 +691,14 @@ class Forward(ParserElement):
 
     Converting to use the '<<=' operator instead will avoid this problem.
 
+    Left recursion is an error, unless ``left_recursion=True``::
+
+        expr = Forward(left_recursion=True)
+        expr <<= Group(expr + "+" + term) | term
+
+    which parses ``1+2+3`` as ``[[1, "+", 2], "+", 3]`` by growing the
+    match of ``expr``, starting from ``term``, until it stops getting longer
+
     See `ParseResults.pprint` for an example of a recursive
     parser created using ``Forward``.
     """
@@ -540,9 +711,11 @@ class Forward(ParserElement):
         "_in_expecting",
         "__in_whitespace",
     ]
+    Config = append_config(ParserElement, "left_recursion")
 
-    def __init__(self, expr=Null):
+    def __init__(self, expr=Null, left_recursion=False):
         ParserElement.__init__(self)
+        self.set_config(left_recursion=left_recursion)
         self.expr = None
         self.used_by = []
 
@@ -575,6 +748,7 @@ class Forward(ParserElement):
         self._str = ""
         if is_forward(self.expr):
             return self.expr << other
+        forward_assigned()
 
         while is_forward(other):
             other = other.expr
@@ -607,7 +781,7 @@ class Forward(ParserElement):
 
     def check_recursion(self, seen=empty_tuple):
         if self in seen:
-            raise RecursiveGrammarException(seen + (self,))
+            return _check_loop(self, seen)
         if self.expr != None:
             self.expr.check_recursion(seen + (self,))
 
@@ -644,6 +818,8 @@ class Forward(ParserElement):
             self.__in_whitespace = False
 
     def parse_impl(self, string, loc, do_actions=True):
+        if self.parser_config.left_recursion:
+            return self._grow(string, loc, do_actions)
         try:
             result = self.expr._parse(string, loc, do_actions)
             return ForwardResults(self, result.start, result.end, [result], result.failures)
@@ -654,6 +830,49 @@ class Forward(ParserElement):
                 )
             raise cause from None
 
+    def try_impl(self, string, loc, do_actions=True):
+        if self.parser_config.left_recursion or is_null(self.expr):
+            return ParserElement.try_impl(self, string, loc, do_actions)
+        result = self.expr._try(string, loc, do_actions)
+        if result is None:
+            return None
+        return ForwardResults(self, result.start, result.end, [result], [])
+
+    def _grow(self, string, loc, do_actions):
+        """
+        SEED-GROWING (Warth et al.) FOR LEFT RECURSION
+        THE RECURSIVE CALL AT loc SEES THE PREVIOUS (SHORTER) MATCH, STARTING
+        WITH FAILURE, AND WE REPEAT UNTIL THE MATCH STOPS GROWING
+        """
+        state = parse_state()
+        seeds = state.seeds
+        key = (id(self), loc, do_actions)
+        seed = seeds.get(key)
+        if seed is not None:
+            if isinstance(seed, ParseException):
+                raise seed.with_traceback(None)
+            return copy_result(seed)
+
+        # THE PACKRAT CACHE WOULD REMEMBER RESULTS BUILT ON AN OLD SEED
+        memo, state.memo = state.memo, None
+        seeds[key] = ParseException(self, loc, string, "left recursion")
+        try:
+            result = None
+            while True:
+                try:
+                    attempt = self.expr._parse(string, loc, do_actions)
+                except ParseException as cause:
+                    if result is None:
+                        raise ParseException(self, loc, string, cause=cause) from None
+                    break
+                if result is not None and attempt.end <= result.end:
+                    break
+                result = seeds[key] = attempt
+        finally:
+            del seeds[key]
+            state.memo = memo
+        return ForwardResults(self, result.start, result.end, [result], result.failures)
+
     def __regex__(self):
         if self._in_regex:
             Log.error("recursion not supported")
@@ -719,6 +938,14 @@ class Combine(TokenConverter):
         except ParseException as cause:
             raise ParseException(self, start, string, cause=cause)
 
+    def try_impl(self, string, start, do_actions=True):
+        result = self.expr.try_impl(string, start, do_actions=do_actions)
+        if result is None:
+            return None
+        return ParseResults(
+            self, start, result.end, [result.as_string(sep=self.parser_config.separator)], [],
+        )
+
     def streamline(self):
         if self.streamlined:
             return self
@@ -186,6 +186,78 @@ class RecursiveGrammarException(Exception):
         ])
 
 
+class Farthest(object):
+    """
+    REGISTER OF THE FARTHEST FAILURE, AND WHAT WAS EXPECTED THERE
+    USED INSTEAD OF KEEPING ALL THE failures IN THE ParseResults
+    """
+
+    __slots__ = ["loc", "expected"]
+
+    def __init__(self):
+        self.loc = -1
+        self.expected = []
+
+    def add(self, failure):
+        loc = failure.start
+        if loc > self.loc:
+            self.loc = loc
+            self.expected = [failure]
+        elif loc == self.loc:
+            self.expected.append(failure)
+
+    def fail(self, expr, start, msg=""):
+        """
+        REGISTER expr FAILED TO MATCH AT start, WITHOUT MAKING AN EXCEPTION
+        """
+        if start > self.loc:
+            self.loc = start
+            self.expected = [(expr, msg)]
+        elif start == self.loc:
+            self.expected.append((expr, msg))
+
+    def group(self, expr, start, loc, size):
+        """
+        THE FAILURES REGISTERED AT THE FARTHEST LOCATION, SINCE IT WAS AT loc
+        WITH size FAILURES, BECOME THE CAUSES OF ONE FAILURE OF expr AT start;
+        LIKE THE ParseException TREE OF THE DEFAULT MODE, WHERE A NAMED FAILURE
+        ONLY HIDES ITS SIBLINGS
+        """
+        if self.loc != loc:
+            size = 0
+        expected = self.expected
+        if size + 1 < len(expected) or expr.parser_name:
+            expected[size:] = [(expr, start, expected[size:])]
+
+    def relabel(self, expr):
+        """
+        AN And REPORTS THE FAILURE OF ITS NAMED expr AT THE FARTHEST LOCATION
+        IT REACHED, NOT WHERE expr STARTED
+        """
+        last = self.expected and self.expected[-1]
+        if isinstance(last, tuple) and len(last) == 3 and last[0] is expr and last[1] < self.loc:
+            self.expected[-1] = (expr, self.loc, [last])
+
+    def exception(self, expr, string, cause=None):
+        """
+        :return: THE BEST ParseException TO SHOW, OR cause IF NOTHING WAS REGISTERED
+        """
+        if not self.expected:
+            if cause is None:
+                return ParseException(expr, 0, string)
+            return cause.best_cause
+        loc = self.loc
+
+        def exception(e):
+            if isinstance(e, ParseException):
+                return e
+            if len(e) == 2:
+                return ParseException(e[0], loc, string, e[1])
+            return ParseException(e[0], e[1], string, cause=[exception(c) for c in e[2]])
+
+        return ParseException(expr, 0, string, cause=[exception(e) for e in self.expected]).best_cause
+
+
 def compare_causes(a, b):
     if isinstance(a, ParseException):
         if isinstance(b, ParseException):
@@ -1,13 +1,12 @@
 # encoding: utf-8
 import json
 from collections import OrderedDict
-from operator import itemgetter
 
 from mo_future import Iterable, text, generator_types
 from mo_imports import export
 
 from mo_parsing import whitespaces
-from mo_parsing.core import ParserElement, _PendingSkip
+from mo_parsing.core import ParserElement, _PendingSkip, _state, no_match
 from mo_parsing.enhancement import Optional, SkipTo, Many, LookBehind
 from mo_parsing.exceptions import (
     ParseException,
@@ -296,6 +295,30 @@ class And(ParseExpression):
 
         return ParseResults(self, start, end, acc, failures)
 
+    def try_impl(self, string, start, do_actions=True):
+        whitespace = self.parser_config.whitespace
+        end = index = start
+        acc = []
+        for expr in self.exprs:
+            if end > index:
+                if isinstance(expr, LookBehind):
+                    index = end
+                else:
+                    index = whitespace.skip(string, end)
+            if isinstance(expr, And.SyntaxErrorGuard):
+                continue
+            result = expr._try(string, index, do_actions)
+            if result is None:
+                if expr.parser_name:
+                    _state.current.farthest.relabel(expr)
+                return None
+            if not result and index == result.end and isinstance(result.type, Many) and result.type.parser_config.min_match == 0:
+                continue
+            acc.append(result)
+            end = result.end
+
+        return ParseResults(self, start, end, acc, [])
+
     def __add__(self, other):
         if other is Ellipsis:
             return _PendingSkip(self)
@@ -341,6 +364,31 @@ class And(ParseExpression):
             )
 
 
+def _candidates(expr, string, start):
+    """
+    :return: THE expr.alternate THAT CAN MATCH AT start, BY THE FIRST CHARACTER
+    """
+    dispatch = expr.dispatch
+    if dispatch is None:
+        return expr.alternate
+    farthest = _state.current.farthest
+    if farthest is not None and farthest.loc <= start:
+        # THE SKIPPED FAILURES, AT start, MUST BE REGISTERED IN ORDER
+        return expr.alternate
+    return dispatch.get(string[start : start + 1], dispatch[None])
+
+
+def _beyond(failures, start):
+    """
+    :return: True IF THE SKIPPED ALTERNATIVES, THAT FAIL AT start, CAN NOT BE THE BEST CAUSE
+    """
+    return _state.current.farthest is not None or any(f.loc > start for f in failures)
+
+
+def _end(match):
+    return match[0].end
+
+
 class Or(ParseExpression):
     """
     Requires that at least one `ParseExpression` is found. If
@@ -349,15 +397,17 @@ class Or(ParseExpression):
     operator.
     """
 
-    __slots__ = ["alternate"]
+    __slots__ = ["alternate", "dispatch"]
 
     def __init__(self, exprs):
         ParseExpression.__init__(self, exprs)
         self.alternate = self.exprs
+        self.dispatch = None  # FROM NEXT CHARACTER TO THE alternate THAT CAN MATCH, SET BY THE Parser
 
     def copy(self):
         output = ParseExpression.copy(self)
         output.alternate = self.alternate
+        output.dispatch = None
         return output
 
     def _min_length(self):
@@ -375,11 +425,10 @@ class Or(ParseExpression):
             if len(output.exprs) == 0:
                 output = Empty()
             if len(output.exprs) == 1:
-                output = output.exprs[0]
-                if not isinstance(output, ParseExpression):
-                    return output
+                return output.exprs[0]
 
         output.alternate = faster(output.exprs)
+        output.dispatch = None
 
         output.streamlined = True
         output.check_recursion()
@@ -390,23 +439,22 @@ class Or(ParseExpression):
         return [e.whitespace for e in self.exprs]
 
     def parse_impl(self, string, start, do_actions=True):
-        failures = []
+        candidates = _candidates(self, string, start)
+        if not do_actions:
+            # THE CONDITIONS STILL DECIDE WHICH ALTERNATIVE IS THE LONGEST
+            do_actions = None
         matches = []
-
-        for e in self.alternate:
-            if isinstance(e, Fast):
-                for ee in e.get_short_list(string, start):
-                    try:
-                        end = ee._parse(string, start).end
-                        matches.append((end, ee))
-                    except ParseException as err:
-                        failures.append(err)
-            else:
-                try:
-                    end = e._parse(string, start).end
-                    matches.append((end, e))
-                except ParseException as err:
-                    failures.append(err)
+        tried = [self._trial(e, string, start, do_actions, matches) for e in candidates]
+        failures = [f for t in tried for f in t]
+        if (
+            candidates is not self.alternate
+            and all(result.end == start for result, _ in matches)
+            and not _beyond(failures, start)
+        ):
+            # THE SKIPPED FAILURES ARE AT start, AND CAN STILL BE THE BEST CAUSE
+            done = {id(e): f for e, f in zip(candidates, tried)}
+            tried = [done[id(e)] if id(e) in done else self._trial(e, string, start, False, []) for e in self.alternate]
+            failures = [f for t in tried for f in t]
 
         if not matches:
             raise ParseException(
@@ -416,52 +464,25 @@ class Or(ParseExpression):
                 msg="no defined alternatives to match",
                 cause=failures,
             )
-        if len(matches) == 1:
-            _, expr = matches[0]
-            result = expr._parse(string, start, do_actions)
-            failures.extend(result.failures)
-            return ParseResults(self, result.start, result.end, [result], failures)
-
-        if matches:
-            # re-evaluate all matches in descending order of length of match, in case attached actions
-            # might change whether or how much they match of the input.
-            matches.sort(key=itemgetter(0), reverse=True)
-
-            if not do_actions:
-                # no further conditions or parse actions to change the selection of
-                # alternative, so the first match will be the best match
-                _, expr = matches[0]
-                result = expr._parse(string, start, do_actions)
-                failures.extend(result.failures)
-                return ParseResults(self, result.start, result.end, [result], failures)
-
-            longest = -1, None
-            for loc, expr in matches:
-                if loc <= longest[0]:
-                    # already have a longer match than this one will deliver, we are done
-                    return longest
 
-                try:
-                    result = expr._parse(string, start, do_actions)
-                except ParseException as err:
-                    failures.append(err)
-                else:
-                    failures.extend(result.failures)
-                    if result.end >= loc:
-                        return ParseResults(
-                            self, result.start, result.end, [result], failures
-                        )
-                    # didn't match as much as before
-                    elif result.end > longest[0]:
-                        longest = (
-                            result.end,
-                            ParseResults(
-                                self, result.start, result.end, [result], failures,
-                            ),
-                        )
+        # THE TRIALS RAN THE PARSE ACTIONS, SO THE LONGEST TRIAL IS THE RESULT
+        # max() KEEPS THE FIRST OF EQUAL LENGTH, SO THE FIRST LISTED WINS A TIE
+        result, _ = max(matches, key=_end)
+        failures.extend(result.failures)
+        return ParseResults(self, result.start, result.end, [result], failures)
 
-            if longest != (-1, None):
-                return longest
+    def _trial(self, e, string, start, do_actions, matches):
+        """
+        PARSE ALTERNATIVE e (OR ITS SHORT LIST), AND ADD (result, expr) TO matches
+        :return: THE FAILURES
+        """
+        failures = []
+        for ee in e.get_short_list(string, start) if isinstance(e, Fast) else (e,):
+            try:
+                matches.append((ee._parse(string, start, do_actions), ee))
+            except ParseException as err:
+                failures.append(err)
+        return failures
 
     def check_recursion(self, seen=empty_tuple):
         seen_more = seen + (self,)
@@ -492,15 +513,17 @@ class MatchFirst(ParseExpression):
     match. May be constructed using the `|` operator.
     """
 
-    __slots__ = ["alternate"]
+    __slots__ = ["alternate", "dispatch"]
 
     def __init__(self, exprs):
         ParseExpression.__init__(self, exprs)
         self.alternate = self.exprs
+        self.dispatch = None  # FROM NEXT CHARACTER TO THE alternate THAT CAN MATCH, SET BY THE Parser
 
     def copy(self):
         output = ParseExpression.copy(self)
         output.alternate = self.alternate
+        output.dispatch = None
         return output
 
     def _min_length(self):
@@ -516,17 +539,54 @@ class MatchFirst(ParseExpression):
 
     def parse_impl(self, string, start, do_actions=True):
         failures = []
-
-        for e in self.alternate:
+        candidates = _candidates(self, string, start)
+        for e in candidates:
             try:
                 result = e._parse(string, start, do_actions)
+                if candidates is not self.alternate and result.end == start:
+                    failures = self._skipped(string, start, candidates, failures, e)
                 failures.extend(result.failures)
                 return ParseResults(self, result.start, result.end, [result], failures)
             except ParseException as cause:
                 failures.append(cause)
 
+        if candidates is not self.alternate:
+            failures = self._skipped(string, start, candidates, failures)
         raise ParseException(self, start, string, cause=failures)
 
+    def _skipped(self, string, start, candidates, failures, winner=None):
+        """
+        THE ALTERNATIVES SKIPPED BY THE dispatch FAIL AT start, SO THEY ONLY
+        MATTER WHEN NOTHING ELSE GOT FARTHER
+        :return: failures OF ALL alternate BEFORE winner, IN ORDER, FOR THE SAME ERROR MESSAGE
+        """
+        if _beyond(failures, start):
+            return failures
+        tried = {id(e): f for e, f in zip(candidates, failures)}
+        output = []
+        for e in self.alternate:
+            if e is winner:
+                break
+            cause = tried.get(id(e))
+            if cause is None:
+                try:
+                    e._parse(string, start, False)
+                    continue
+                except ParseException as c:
+                    cause = c
+            output.append(cause)
+        return output
+
+    def try_impl(self, string, start, do_actions=True):
+        return self._try_all(_candidates(self, string, start), string, start, do_actions)
+
+    def _try_all(self, alternate, string, start, do_actions):
+        for e in alternate:
+            result = e._try(string, start, do_actions)
+            if result is not None:
+                return ParseResults(self, result.start, result.end, [result], [])
+        return None
+
     def streamline(self):
         if self.streamlined:
             return self
@@ -542,6 +602,7 @@ class MatchFirst(ParseExpression):
                 return output.exprs[0]
 
         output.alternate = faster(output.exprs)
+        output.dispatch = None
 
         output.streamlined = True
         output.check_recursion()
@@ -640,7 +701,7 @@ def _distinct(a, b):
 
 
 class Fast(ParserElement):
-    __slots__ = ["lookup", "regex", "all_keys"]
+    __slots__ = ["lookup", "regex", "all_keys", "message"]
 
     def __init__(self, maps):
         ParserElement.__init__(self)
@@ -686,6 +747,7 @@ class Fast(ParserElement):
         self.lookup = {k: e for k, e in shorter}
         self.regex = regex_compile("|".join(regex_caseless(k) for k, _ in shorter))
         self.all_keys = list(sorted(all_keys))
+        self.message = "expecting one of " + json.dumps(self.all_keys)
 
     def get_short_list(self, string, start):
         """
@@ -703,7 +765,7 @@ class Fast(ParserElement):
             index = found.group(0).lower()
             if index not in self.lookup:
                 raise ParseException(
-                    self, start, string, "expecting one of " + json.dumps(self.all_keys)
+                    self, start, string, self.message
                 )
             exprs = self.lookup[index]
 
@@ -717,9 +779,45 @@ class Fast(ParserElement):
             raise ParseException(self, start, string, cause=causes)
         else:
             raise ParseException(
-                self, start, string, "expecting one of " + json.dumps(self.all_keys)
+                self, start, string, self.message
             )
 
+    def try_impl(self, string, start, do_actions=True):
+        found = self.regex.match(string, start)
+        if found:
+            exprs = self.lookup.get(found.group(0).lower())
+            if exprs is not None:
+                for e in exprs:
+                    result = e._try(string, start, do_actions)
+                    if result is not None:
+                        return result
+                return None
+        return no_match(self, start, self.message)
+
+
+def _prefixes(exprs):
+    """
+    LIKE faster(), BUT FOR ALL exprs AT ONCE
+    :return: (regex, lookup, keyed) WHERE regex MATCHES THE LONGEST KNOWN PREFIX,
+    lookup IS FROM ITS lower() TO THE POSITIONS OF THE exprs THAT CAN START WITH IT,
+    AND keyed ARE THE POSITIONS OF THE exprs WITH KNOWN PREFIXES; None IF THERE ARE NONE
+    """
+    keys = []
+    for e in exprs:
+        expect = [k.lower() for k in e.expecting()]
+        keys.append(expect if all(expect) else [])
+    # LONGEST FIRST, SO THE regex MATCHES THE LONGEST
+    all_keys = sorted(set(k for kk in keys for k in kk), key=lambda k: (-len(k), k))
+    if not all_keys:
+        return None
+    lookup = {
+        k: tuple(i for i, kk in enumerate(keys) if any(k.startswith(p) for p in kk))
+        for k in all_keys
+    }
+    regex = regex_compile("|".join(regex_caseless(k) for k in all_keys))
+    keyed = set(i for i, kk in enumerate(keys) if kk)
+    return regex, lookup, keyed
+
 
 class MatchAll(ParseExpression):
     """
@@ -729,7 +827,7 @@ class MatchAll(ParseExpression):
     May be constructed using the ``'&'`` operator.
     """
 
-    __slots__ = []
+    __slots__ = ["dispatch", "prefixes"]
     Config = append_config(ParseExpression, "min_match", "max_match", "whitespace")
 
     def __init__(self, exprs):
@@ -738,6 +836,8 @@ class MatchAll(ParseExpression):
         :param mins: list of integers indincating any minimums
         """
         ParseExpression.__init__(self, exprs)
+        self.prefixes = None  # (regex, lookup, keyed) FOR THE exprs THAT START WITH A KNOWN PREFIX
+        self.dispatch = None  # FROM NEXT CHARACTER TO THE POSITIONS OF THE OTHER exprs THAT CAN MATCH, SET BY THE Parser
         self.set_config(
             whitespace=whitespaces.CURRENT,
             min_match=[
@@ -748,10 +848,17 @@ class MatchAll(ParseExpression):
             ],
         )
 
+    def copy(self):
+        output = ParseExpression.copy(self)
+        output.prefixes = self.prefixes
+        output.dispatch = None
+        return output
+
     def streamline(self):
         if self.streamlined:
             return self
         output = ParseExpression.streamline(self)
+        output.prefixes = _prefixes(output.exprs)
         output.set_config(
             min_match=[
                 e.parser_config.min_match if isinstance(e, Many) else 1
@@ -762,6 +869,7 @@ class MatchAll(ParseExpression):
                 for e in output.exprs
             ],
         )
+        output.dispatch = None
         return output
 
     def _min_length(self):
@@ -773,34 +881,45 @@ class MatchAll(ParseExpression):
         return [e.whitespace for e in self.exprs]
 
     def parse_impl(self, string, start, do_actions=True):
-        end = start
-        match_order = []
-        todo = list(zip(
-            self.exprs, self.parser_config.min_match, self.parser_config.max_match
-        ))
-        count = [0] * len(self.exprs)
+        exprs = self.exprs
+        min_match, max_match = self.parser_config.min_match, self.parser_config.max_match
+        whitespace = self.parser_config.whitespace
+        everything = range(len(exprs))
+        count = [0] * len(exprs)
+        results = []
         failures = []
-        while todo:
-            for i, (c, (e, mi, ma)) in enumerate(zip(count, todo)):
-                try:
-                    result = e._parse(string, end)
-                    failures.extend(result.failures)
-                    loc = result.end
-                    if loc == end:
-                        continue
-                    end = self.parser_config.whitespace.skip(string, loc)
-                    c2 = count[i] = c + 1
-                    if c2 >= ma:
-                        del todo[i]
-                        del count[i]
-                    match_order.append(e)
+        end = start
+        while True:
+            # EACH ROUND MATCHES THE FIRST LISTED EXPRESSION THAT CONSUMES SOMETHING
+            candidates = self._candidates(string, end, everything)
+            tried = []
+            result = None
+            for i in candidates:
+                if count[i] >= max_match[i]:
+                    continue
+                result, causes = self._trial(i, string, end, do_actions)
+                tried.append((i, causes))
+                if result is not None:
                     break
-                except ParseException as pe:
-                    failures.append(pe)
-            else:
+            causes = [f for _, c in tried for f in c]
+            if result is None:
+                if candidates is not everything and not _beyond(failures + causes, end):
+                    # THE SKIPPED FAILURES ARE AT end, AND CAN STILL BE THE BEST CAUSE
+                    done = dict(tried)
+                    causes = [
+                        f
+                        for i in everything
+                        if count[i] < max_match[i]
+                        for f in (done[i] if i in done else self._trial(i, string, end, False)[1])
+                    ]
+                failures.extend(causes)
                 break
+            failures.extend(causes)
+            count[i] += 1
+            results.append(result)
+            end = whitespace.skip(string, result.end)
 
-        for c, (e, mi, ma) in zip(count, todo):
+        for c, e, mi in zip(count, exprs, min_match):
             if c < mi:
                 raise ParseException(
                     self,
@@ -810,38 +929,49 @@ class MatchAll(ParseExpression):
                     cause=failures,
                 )
 
-        found = set(id(m) for m in match_order)
-        missing = [
-            e
-            for e, mi in zip(self.exprs, self.parser_config.min_match)
-            if id(e) not in found and mi > 0
-        ]
-        if missing:
-            missing = ", ".join(text(e) for e in missing)
-            raise ParseException(
-                self,
-                start,
-                string,
-                f"Missing one or more required elements ({missing})",
-                failures,
-            )
-
         # add any unmatched Optionals, in case they have default values defined
-        match_order += [e for e in self.exprs if id(e) not in found]
+        for c, e in zip(count, exprs):
+            if not c:
+                result = e._parse(string, end, do_actions)
+                end = whitespace.skip(string, result.end)
+                results.append(result)
 
-        if not match_order:
+        if not results:
             return ParseResults(self, start, start, [], failures)
-
-        # TODO: CAN WE AVOID THIS RE-PARSE?
-        results = []
-        end = start
-        for e in match_order:
-            result = e._parse(string, end, do_actions)
-            end = self.parser_config.whitespace.skip(string, result.end)
-            results.append(result)
-
         return ParseResults(self, results[0].start, results[-1].end, results, failures)
 
+    def _candidates(self, string, start, everything):
+        """
+        :return: POSITIONS OF THE exprs THAT CAN CONSUME A CHARACTER AT start
+        """
+        dispatch = self.dispatch
+        if dispatch is None:
+            return everything
+        farthest = _state.current.farthest
+        if farthest is not None and farthest.loc <= start:
+            # THE SKIPPED FAILURES, AT start, MUST BE REGISTERED IN ORDER
+            return everything
+        candidates = dispatch.get(string[start : start + 1], dispatch[None])
+        if self.prefixes is None:
+            return candidates
+        regex, lookup, _ = self.prefixes
+        found = regex.match(string, start)
+        if not found:
+            return candidates
+        return tuple(sorted(candidates + lookup.get(found.group(0).lower(), empty_tuple)))
+
+    def _trial(self, i, string, start, do_actions):
+        """
+        :return: (result, failures) WHERE result IS None IF exprs[i] DID NOT CONSUME A CHARACTER
+        """
+        try:
+            result = self.exprs[i]._parse(string, start, do_actions)
+        except ParseException as cause:
+            return None, [cause]
+        if result.end == start:
+            return None, result.failures
+        return result, result.failures
+
     def __str__(self):
         if self.parser_name:
             return self.parser_name
@@ -0,0 +1,548 @@
+# encoding: utf-8
+"""
+FIRST SETS: THE CHARACTERS EACH ParserElement CAN START WITH
+
+EVERY MatchFirst AND Or GETS A dispatch TABLE, FROM THE NEXT CHARACTER TO
+THE ALTERNATIVES THAT CAN START WITH IT, SO THE OTHERS ARE NOT TRIED; EVERY
+MatchAll GETS ONE TO THE POSITIONS OF THE exprs THAT CAN CONSUME IT; EVERY
+SkipTo GETS A scan REGEX TO SEARCH FOR THE NEXT PLACE IT CAN STOP
+
+A FIRST SET IS A TUPLE (chars, other, nullable)
+    chars - BIT MASK OF THE CHARACTERS chr(0) TO chr(255)
+    other - True IF IT MAY START WITH A CHARACTER ABOVE chr(255)
+    nullable - True IF IT MAY MATCH WITHOUT CONSUMING A CHARACTER
+WHEN NOT SURE, AN ELEMENT CAN START WITH ANYTHING, AND IS nullable
+"""
+import re
+
+from mo_imports import export
+
+from mo_parsing.collapse import INLINE_FLAGS, Collapsed
+from mo_parsing.core import ParserElement
+from mo_parsing.enhancement import (
+    Combine,
+    Forward,
+    LookAhead,
+    Many,
+    Optional,
+    ParseEnhancement,
+    SkipTo,
+)
+from mo_parsing.expressions import And, Fast, MatchAll, MatchFirst, Or
+from mo_parsing.regex import Regex
+from mo_parsing.tokens import (
+    CaselessKeyword,
+    CaselessLiteral,
+    Char,
+    CharsNotIn,
+    Empty,
+    Keyword,
+    Literal,
+    NoMatch,
+    SingleCharLiteral,
+    Word,
+)
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+ALL = (1 << 256) - 1
+ANYTHING = (ALL, True, True)
+NOTHING = (0, False, False)
+ZERO_WIDTH = (0, False, True)
+
+CHARACTERS = [chr(c) for c in range(256)]
+CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: r"\d",
+    sre_parse.CATEGORY_NOT_DIGIT: r"\D",
+    sre_parse.CATEGORY_SPACE: r"\s",
+    sre_parse.CATEGORY_NOT_SPACE: r"\S",
+    sre_parse.CATEGORY_WORD: r"\w",
+    sre_parse.CATEGORY_NOT_WORD: r"\W",
+}
+REGEX_LEAVES = (Literal, SingleCharLiteral, Keyword, CaselessKeyword, CaselessLiteral, Char, CharsNotIn)
+
+
+def dispatch(*roots):
+    """
+    SET THE dispatch TABLE OF EVERY MatchFirst, Or AND MatchAll REACHABLE FROM roots
+    """
+    firsts = first_sets(*roots)
+    for e in _reachable(roots):
+        if isinstance(e, (MatchFirst, Or)):
+            e.dispatch = _table(e.alternate, [firsts.get(id(a), ANYTHING) for a in e.alternate])
+        elif isinstance(e, MatchAll):
+            # A MatchAll IGNORES ZERO-WIDTH MATCHES, SO nullable DOES NOT MATTER
+            # THE exprs WITH KNOWN PREFIXES ARE FOUND WITH e.prefixes INSTEAD
+            keyed = e.prefixes[2] if e.prefixes else ()
+            sets = [
+                NOTHING if i in keyed else firsts.get(id(a), ANYTHING)[:2] + (False,)
+                for i, a in enumerate(e.exprs)
+            ]
+            e.dispatch = _table(range(len(e.exprs)), sets)
+        elif isinstance(e, SkipTo):
+            e.scan = _scan(e, firsts)
+
+
+def _table(alternate, sets):
+    """
+    :param sets: FIRST SET OF EACH alternate
+    :return: MAP FROM CHARACTER ("" AT THE END, None FOR ABOVE chr(255)) TO
+    THE ALTERNATIVES TO TRY; None IF NOTHING IS SKIPPED
+    """
+    if all(chars == ALL and other for chars, other, _ in sets):
+        return None
+    table = {}
+    shared = {}  # SO EQUAL CANDIDATE LISTS ARE ONE TUPLE
+    for c, char in enumerate(CHARACTERS):
+        bit = 1 << c
+        candidates = tuple(a for a, (chars, _, nullable) in zip(alternate, sets) if nullable or chars & bit)
+        table[char] = shared.setdefault(candidates, candidates)
+    table[""] = tuple(a for a, (_, _, nullable) in zip(alternate, sets) if nullable)
+    table[None] = tuple(a for a, (_, other, nullable) in zip(alternate, sets) if nullable or other)
+    if all(len(v) == len(alternate) for v in table.values()):
+        return None
+    return table
+
+
+def scanner(element, whitespace):
+    """
+    :return: REGEX THAT MATCHES WHERE element, OR A COMMENT OF whitespace, CAN
+    START; None IF THAT CAN BE ANYWHERE
+    """
+    return _search([element], whitespace, first_sets(element))
+
+
+def _scan(e, firsts):
+    """
+    :return: REGEX THAT MATCHES WHERE THE fail, ignore, expr, OR A COMMENT OF
+    SkipTo e CAN START; None IF THAT CAN BE ANYWHERE
+    """
+    config = e.parser_config
+    targets = [t for t in (e.expr, config.fail, config.ignore) if t]
+    return _search(targets, config.whitespace, firsts)
+
+
+def _search(targets, whitespace, firsts):
+    targets = targets + whitespace.ignore_list
+    others = first_sets(*(t for t in targets if id(t) not in firsts))
+    patterns = []
+    for t in targets:
+        chars, other, nullable = firsts.get(id(t)) or others.get(id(t), ANYTHING)
+        if nullable:
+            return None
+        pattern = _prefix(t, set())
+        if pattern is None:
+            pattern = _class(chars, other)
+        if pattern:
+            patterns.append(pattern)
+    try:
+        return re.compile("|".join(patterns) or "(?!)")
+    except Exception:
+        return None
+
+
+def _prefix(e, seen):
+    """
+    :return: PATTERN THAT MATCHES WHEREVER e CAN MATCH (AND MAYBE MORE), OR None
+    PARSE ACTIONS AND NAMES CAN ONLY REJECT A MATCH, SO THEY ARE IGNORED
+    """
+    clazz = e.__class__
+    if clazz in REGEX_LEAVES:
+        return _leaf(e.parser_config.regex)
+    elif clazz is Word or clazz is Regex or clazz is Collapsed:
+        return _leaf(e.regex)
+    elif clazz is And:
+        return _prefix(e.exprs[0], seen)
+    elif clazz is MatchFirst or clazz is Or:
+        alternatives = [_prefix(x, seen) for x in e.exprs]
+        if None in alternatives:
+            return None
+        return "|".join(f"(?:{a})" for a in alternatives)
+    elif clazz is Forward:
+        if e.expr is None or id(e) in seen:
+            return None
+        seen.add(id(e))
+        return _prefix(e.expr, seen)
+    elif clazz is Combine or (isinstance(e, ParseEnhancement) and clazz.parse_impl is ParseEnhancement.parse_impl):
+        return _prefix(e.expr, seen)
+    return None
+
+
+def _leaf(regex):
+    """
+    :return: PATTERN OF regex THAT CAN BE PUT IN AN ALTERNATION, OR None
+    """
+    if regex.groupindex or re.search(r"\\[1-9]", regex.pattern):
+        # GROUP REFERENCES WOULD POINT TO THE WRONG GROUP
+        return None
+    flags = regex.flags & ~re.UNICODE
+    if flags & ~sum(INLINE_FLAGS):
+        return None
+    inline = "".join(v for k, v in INLINE_FLAGS.items() if flags & k)
+    if inline:
+        return f"(?{inline}:{regex.pattern})"
+    return regex.pattern
+
+
+def _class(chars, other):
+    """
+    :return: PATTERN FOR THE FIRST CHARACTERS (chars, other)
+    """
+    patterns = []
+    members = "".join(re.escape(c) for i, c in enumerate(CHARACTERS) if chars >> i & 1)
+    if members:
+        patterns.append(f"[{members}]")
+    if other:
+        patterns.append(r"[^\x00-\xff]")
+    return "|".join(patterns)
+
+
+def first_sets(*roots):
+    """
+    :return: MAP FROM id(element) TO ITS FIRST SET, FOR ALL ELEMENTS REACHABLE FROM roots
+    """
+    elements = _reachable(roots)
+    firsts = {id(e): NOTHING for e in elements}
+    # THE Forward LOOPS NEED A FIXED POINT; FIRST SETS ONLY GROW
+    changed = True
+    while changed:
+        changed = False
+        for e in reversed(elements):
+            value = _first(e, firsts)
+            if value != firsts[id(e)]:
+                firsts[id(e)] = value
+                changed = True
+    return firsts
+
+
+def _reachable(roots):
+    """
+    :return: ELEMENTS REACHABLE FROM roots, PARENTS BEFORE CHILDREN
+    """
+    output = []
+    seen = set()
+    todo = list(reversed(roots))
+    while todo:
+        e = todo.pop()
+        if id(e) in seen:
+            continue
+        seen.add(id(e))
+        output.append(e)
+        if isinstance(e, (Regex, Collapsed)):
+            continue
+        children = list(getattr(e, "exprs", ()))
+        child = getattr(e, "expr", None)
+        if isinstance(child, ParserElement):
+            children.append(child)
+        for a in getattr(e, "alternate", ()):
+            if isinstance(a, Fast):
+                children.append(a)
+                for ee in a.lookup.values():
+                    children.extend(ee)
+        todo.extend(reversed(children))
+    return output
+
+
+def _first(e, firsts):
+    """
+    :return: FIRST SET OF e, USING THE CURRENT firsts OF ITS CHILDREN
+    """
+    clazz = e.__class__
+    if clazz in REGEX_LEAVES:
+        return _regex_first(e.parser_config.regex)
+    elif clazz is Word or clazz is Regex or clazz is Collapsed:
+        return _regex_first(e.regex)
+    elif isinstance(e, Empty):
+        return ZERO_WIDTH
+    elif clazz is NoMatch:
+        return NOTHING
+    elif clazz is And:
+        return _sequence(firsts.get(id(x), ANYTHING) for x in e.exprs)
+    elif clazz is MatchFirst or clazz is Or:
+        return _union(firsts.get(id(x), ANYTHING) for x in e.alternate)
+    elif clazz is Fast:
+        return _union(firsts.get(id(x), ANYTHING) for ee in e.lookup.values() for x in ee)
+    elif clazz is MatchAll:
+        # ZERO-WIDTH MATCHES DO NOT COUNT, SO ONLY EMPTY IF NOTHING IS REQUIRED
+        chars, other, _ = _union(firsts.get(id(x), ANYTHING) for x in e.exprs)
+        return chars, other, not any(e.parser_config.min_match)
+    elif isinstance(e, LookAhead):
+        # ZERO WIDTH (INCLUDES NotAny, AND PrecededBy)
+        return ZERO_WIDTH
+    elif clazz is Forward:
+        if e.expr is None:
+            return ANYTHING
+        return firsts.get(id(e.expr), ANYTHING)
+    elif clazz is Optional:
+        chars, other, _ = firsts.get(id(e.expr), ANYTHING)
+        return chars, other, True
+    elif isinstance(e, Many):
+        # THE FIRST REPEAT MAY SKIP WHITESPACE
+        chars, other, nullable = firsts.get(id(e.expr), ANYTHING)
+        white, white_other = _whitespace_first(e.parser_config.whitespace)
+        return chars | white, other or white_other, nullable or not e.parser_config.min_match
+    elif clazz is Combine or (isinstance(e, ParseEnhancement) and clazz.parse_impl is ParseEnhancement.parse_impl):
+        return firsts.get(id(e.expr), ANYTHING)
+    return ANYTHING
+
+
+def _sequence(firsts):
+    chars, other = 0, False
+    for c, o, nullable in firsts:
+        chars |= c
+        other = other or o
+        if not nullable:
+            return chars, other, False
+    return chars, other, True
+
+
+def _union(firsts):
+    chars, other, nullable = NOTHING
+    for c, o, n in firsts:
+        chars |= c
+        other = other or o
+        nullable = nullable or n
+    return chars, other, nullable
+
+
+def _whitespace_first(whitespace):
+    """
+    :return: (chars, other) THAT whitespace CAN SKIP
+    """
+    if whitespace.ignore_list:
+        # COMMENTS CAN START WITH ANYTHING
+        return ALL, True
+    chars = 0
+    other = False
+    for c in whitespace.white_chars:
+        if ord(c) < 256:
+            chars |= 1 << ord(c)
+        else:
+            other = True
+    return chars, other
+
+
+def _regex_first(regex):
+    """
+    :return: FIRST SET OF THE COMPILED regex
+    """
+    key = regex.pattern, regex.flags
+    output = _regex_firsts.get(key)
+    if output is None:
+        try:
+            output = _pattern_first(sre_parse.parse(regex.pattern, regex.flags), bool(regex.flags & re.IGNORECASE))
+        except Exception:
+            output = ANYTHING
+        _regex_firsts[key] = output
+    return output
+
+
+_regex_firsts = {}
+
+
+def _pattern_first(items, caseless):
+    chars, other = 0, False
+    for op, av in items:
+        c, o, nullable = _item_first(op, av, caseless)
+        chars |= c
+        other = other or o
+        if not nullable:
+            return chars, other, False
+    return chars, other, True
+
+
+def _item_first(op, av, caseless):
+    if op is sre_parse.LITERAL:
+        return _characters([chr(av)], caseless) + (False,)
+    elif op is sre_parse.NOT_LITERAL:
+        chars, _ = _characters([chr(av)], caseless)
+        return ALL & ~chars, True, False
+    elif op is sre_parse.IN:
+        return _in(av, caseless) + (False,)
+    elif op is sre_parse.ANY:
+        return ALL, True, False
+    elif op is sre_parse.SUBPATTERN:
+        _, add_flags, del_flags, sub = av
+        if add_flags & re.IGNORECASE:
+            caseless = True
+        elif del_flags & re.IGNORECASE:
+            caseless = False
+        return _pattern_first(sub, caseless)
+    elif op is sre_parse.BRANCH:
+        return _union(_pattern_first(b, caseless) for b in av[1])
+    elif op in _REPEATS:
+        low, _, sub = av
+        chars, other, nullable = _pattern_first(sub, caseless)
+        return chars, other, nullable or not low
+    elif op is _ATOMIC_GROUP:
+        return _pattern_first(av, caseless)
+    elif op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return ZERO_WIDTH
+    return ANYTHING
+
+
+def regex_expecting(regex):
+    """
+    :return: THE STRINGS EVERY MATCH OF THE COMPILED regex STARTS WITH (lower()),
+    SEE ParserElement.expecting(); EMPTY IF NOT KNOWN
+    """
+    key = regex.pattern, regex.flags
+    output = _regex_prefixes.get(key)
+    if output is None:
+        try:
+            paths = _sequence_prefixes(sre_parse.parse(regex.pattern, regex.flags), bool(regex.flags & re.IGNORECASE))
+            output = () if any(not p for p, _ in paths) else tuple({p.lower(): 1 for p, _ in paths})
+        except Exception:
+            output = ()
+        _regex_prefixes[key] = output
+    return output
+
+
+def regex_min_length(regex):
+    """
+    :return: LENGTH OF THE SHORTEST MATCH OF THE COMPILED regex
+    """
+    try:
+        return sre_parse.parse(regex.pattern, regex.flags).getwidth()[0]
+    except Exception:
+        return 0
+
+
+_regex_prefixes = {}
+MAX_PREFIXES = 256  # MORE WOULD NOT HELP A dispatch TABLE
+
+
+def _sequence_prefixes(items, caseless):
+    """
+    :return: LIST OF (prefix, exact) FOR THE PATTERN items; exact IF THE prefix
+    IS ALL THAT WAS MATCHED SO FAR, SO WHAT FOLLOWS CAN BE APPENDED
+    """
+    paths = [("", True)]
+    for op, av in items:
+        if all(not exact for _, exact in paths):
+            break
+        options = _item_prefixes(op, av, caseless)
+        if options is None:
+            return [(p, False) for p, _ in paths]
+        more = {}
+        for prefix, exact in paths:
+            if exact:
+                for p, e in options:
+                    more[prefix + p] = more.get(prefix + p, True) and e
+            else:
+                more[prefix] = False
+        if len(more) > MAX_PREFIXES:
+            return [(p, False) for p, _ in paths]
+        paths = list(more.items())
+    return paths
+
+
+def _item_prefixes(op, av, caseless):
+    """
+    :return: LIST OF (prefix, exact) FOR ONE ITEM OF A PATTERN, None IF NOT KNOWN
+    """
+    if op is sre_parse.LITERAL:
+        c = chr(av)
+        if caseless and (av > 127 or c in _MORE_CASES):
+            # re ALSO MATCHES A CHARACTER THAT IS NOT c.lower() OR c.upper() (ſ FOR s)
+            return None
+        return [(c, True)]
+    elif op is sre_parse.IN:
+        chars, other = _in(av, caseless)
+        if other:
+            return None
+        return [(c, True) for i, c in enumerate(CHARACTERS) if chars & (1 << i)]
+    elif op is sre_parse.SUBPATTERN:
+        _, add_flags, del_flags, sub = av
+        if add_flags & re.IGNORECASE:
+            caseless = True
+        elif del_flags & re.IGNORECASE:
+            caseless = False
+        return _sequence_prefixes(sub, caseless)
+    elif op is sre_parse.BRANCH:
+        return [path for b in av[1] for path in _sequence_prefixes(b, caseless)]
+    elif op in _REPEATS:
+        low, high, sub = av
+        options = _sequence_prefixes(sub, caseless)
+        if any(not p for p, _ in options):
+            return None
+        # AFTER THE FIRST REPEAT, THE NEXT MAY BE ANOTHER
+        options = [(p, e and high == 1) for p, e in options]
+        if not low:
+            options.append(("", True))
+        return options
+    elif op is _ATOMIC_GROUP:
+        return _sequence_prefixes(av, caseless)
+    elif op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        return [("", True)]
+    return None
+
+
+_MORE_CASES = "IKSiks"  # ASCII THAT re IGNORECASE MATCHES TO İ, ı, K (KELVIN), OR ſ
+_REPEATS = tuple(getattr(sre_parse, n) for n in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT") if hasattr(sre_parse, n))
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+
+def _in(items, caseless):
+    """
+    :return: (chars, other) FOR A CHARACTER SET [...]
+    """
+    chars, other, negate = 0, False, False
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            c, o = _characters([chr(av)], caseless)
+            chars |= c
+            other = other or o
+        elif op is sre_parse.RANGE:
+            low, high = av
+            if caseless:
+                # A CHARACTER ABOVE chr(255) MAY MATCH ONE BELOW, SO ASK re
+                chars |= _caseless(f"[{re.escape(chr(low))}-{re.escape(chr(high))}]")
+                other = True
+            else:
+                c, o = _characters([chr(i) for i in range(low, min(high, 255) + 1)], caseless)
+                chars |= c
+                other = other or o or high > 255
+        elif op is sre_parse.CATEGORY:
+            test = re.compile(CATEGORIES[av]).match
+            chars |= sum(1 << i for i, ch in enumerate(CHARACTERS) if test(ch))
+            other = True
+        else:
+            return ALL, True
+    if negate:
+        return ALL & ~chars, True
+    return chars, other
+
+
+def _characters(characters, caseless):
+    """
+    :return: (chars, other) FOR THE GIVEN CHARACTERS
+    """
+    chars, other = 0, caseless
+    if caseless:
+        return _caseless("|".join(re.escape(c) for c in characters)), True
+    for c in characters:
+        if len(c) == 1 and ord(c) < 256:
+            chars |= 1 << ord(c)
+        else:
+            other = True
+    return chars, other
+
+
+def _caseless(pattern):
+    """
+    :return: chars THAT pattern MATCHES, IGNORING CASE THE WAY re DOES (ſ MATCHES s)
+    """
+    test = re.compile(pattern, re.IGNORECASE).match
+    return sum(1 << i for i, ch in enumerate(CHARACTERS) if test(ch))
+
+
+export("mo_parsing.core", dispatch)
+export("mo_parsing.core", scanner)
+export("mo_parsing.regex", regex_expecting)
+export("mo_parsing.regex", regex_min_length)
@@ -5,7 +5,7 @@ from datetime import datetime
 from mo_future import text
 
 from mo_parsing import whitespaces
-from mo_parsing.core import add_reset_action
+from mo_parsing.core import parse_state
 from mo_parsing.enhancement import (
     Combine,
     Dict,
@@ -45,6 +45,47 @@ from mo_parsing.utils import (
 )
 from mo_parsing.whitespaces import Whitespace, STANDARD_WHITESPACE, NO_WHITESPACE
 
+_default = object()  # nested_expr() IGNORES quoted_string, UNLESS TOLD OTHERWISE
+_lazy_builders = {}  # NAME -> (NAMES, BUILDER) OF THE GRAMMARS MADE ON FIRST ACCESS
+
+
+def _lazy(*names):
+    """
+    DECORATOR FOR A FUNCTION THAT BUILDS THE MODULE ATTRIBUTES names; IT IS
+    CALLED ON FIRST ACCESS OF ANY OF THEM, NOT ON IMPORT
+    """
+
+    def register(builder):
+        for name in names:
+            _lazy_builders[name] = names, builder
+        return builder
+
+    return register
+
+
+def __getattr__(name):
+    """
+    BUILD THE HELPER GRAMMAR name, AND KEEP IT AS A MODULE ATTRIBUTE
+    """
+    module = globals()
+    if name in module:
+        return module[name]
+    if name not in _lazy_builders:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    names, builder = _lazy_builders[name]
+    with STANDARD_WHITESPACE:
+        values = builder()
+    if len(names) == 1:
+        values = (values,)
+    for n, value in zip(names, values):
+        # ANOTHER THREAD MAY HAVE BUILT IT TOO; ALL GET THE FIRST
+        module.setdefault(n, value)
+    return module[name]
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_builders})
+
 
 def QuotedString(
     quote_char,
@@ -142,22 +183,25 @@ def QuotedString(
     return (output / post_parse).streamline()
 
 
-dblQuotedString = Combine(
-    #       0         1         2         3         4         5
-    #       012345678901234567890123456789012345678901234567890123456789
-    Regex(r'"(?:[^"\n\r\\]|(?:"")|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*')
-    + '"'
-).set_parser_name("string enclosed in double quotes")
-sglQuotedString = Combine(
-    Regex(r"'(?:[^'\n\r\\]|(?:'')|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*") + "'"
-).set_parser_name("string enclosed in single quotes")
-quoted_string = Combine(
-    Regex(r'"(?:[^"\n\r\\]|(?:"")|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*') + '"'
-    | Regex(r"'(?:[^'\n\r\\]|(?:'')|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*") + "'"
-).set_parser_name("quoted_string using single or double quotes")
-unicode_string = Combine(
-    Literal("u") + quoted_string
-).set_parser_name("unicode string literal")
+@_lazy("dblQuotedString", "sglQuotedString", "quoted_string", "unicode_string")
+def _quoted_strings():
+    dbl_quoted_string = Combine(
+        #       0         1         2         3         4         5
+        #       012345678901234567890123456789012345678901234567890123456789
+        Regex(r'"(?:[^"\n\r\\]|(?:"")|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*')
+        + '"'
+    ).set_parser_name("string enclosed in double quotes")
+    sgl_quoted_string = Combine(
+        Regex(r"'(?:[^'\n\r\\]|(?:'')|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*") + "'"
+    ).set_parser_name("string enclosed in single quotes")
+    quoted_string = Combine(
+        Regex(r'"(?:[^"\n\r\\]|(?:"")|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*') + '"'
+        | Regex(r"'(?:[^'\n\r\\]|(?:'')|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*") + "'"
+    ).set_parser_name("quoted_string using single or double quotes")
+    unicode_string = Combine(
+        Literal("u") + quoted_string
+    ).set_parser_name("unicode string literal")
+    return dbl_quoted_string, sgl_quoted_string, quoted_string, unicode_string
 
 
 def counted_array(expr, int_expr=None):
@@ -187,6 +231,7 @@ def counted_array(expr, int_expr=None):
         int_expr = Word(nums) / (lambda t: int(t[0]))
 
     array_expr = Forward()
+    array_expr.set_config(memoize=False)  # CHANGES DURING THE PARSE
 
     def countFieldParseAction(t, l, s):
         n = t[0]
@@ -224,10 +269,10 @@ def matchPreviousLiteral(expr):
     will match ``"1:1"``, but not ``"1:2"``.  Because this
     matches a previous literal, will also match the leading
     ``"1:1"`` in ``"1:10"``. If this is not desired, use
-    `matchPreviousExpr`. Do *not* use with packrat parsing
-    enabled.
+    `matchPreviousExpr`.
     """
     rep = Forward()
+    rep.set_config(memoize=False)  # CHANGES DURING THE PARSE
 
     def copyTokenToRepeater(t, l, s):
         if t:
@@ -257,10 +302,10 @@ def matchPreviousExpr(expr):
     will match ``"1:1"``, but not ``"1:2"``.  Because this
     matches by expressions, will *not* match the leading ``"1:1"``
     in ``"1:10"``; the expressions are evaluated first, and then
-    compared, so ``"1"`` is compared with ``"10"``. Do *not* use
-    with packrat parsing enabled.
+    compared, so ``"1"`` is compared with ``"10"``.
     """
     rep = Forward()
+    rep.set_config(memoize=False)  # CHANGES DURING THE PARSE
     e2 = expr.copy()
     rep <<= e2
 
@@ -399,7 +444,7 @@ def located_expr(expr):
     return Group(locator("locn_start") + Group(expr)("value") + locator("locn_end"))
 
 
-def nested_expr(opener="(", closer=")", content=None, ignore_expr=quoted_string):
+def nested_expr(opener="(", closer=")", content=None, ignore_expr=_default):
     """Helper method for defining nested lists enclosed in opening and
     closing delimiters ("(" and ")" are the default).
 
@@ -426,6 +471,8 @@ def nested_expr(opener="(", closer=")", content=None, ignore_expr=quoted_string)
     pass ``None`` for this argument.
 
     """
+    if ignore_expr is _default:
+        ignore_expr = __getattr__("quoted_string")
     if opener == closer:
         raise ValueError("opening and closing strings cannot be the same")
     if content is None:
@@ -558,7 +605,7 @@ def makeHTMLTags(tag, suppress_LT=Suppress("<"), suppress_GT=Suppress(">")):
         resname = tag.parser_name
 
     tagAttrName = Word(alphas, alphanums + "_-:")
-    tagAttrValue = quoted_string / remove_quotes | Word(printables, exclude=">")
+    tagAttrValue = __getattr__("quoted_string") / remove_quotes | Word(printables, exclude=">")
     simpler_name = "".join(resname.replace(":", " ").title().split())
 
     with STANDARD_WHITESPACE:
@@ -661,17 +708,6 @@ def with_class(classname, namespace=""):
     return with_attribute(**{classattr: classname})
 
 
-_indent_stack = [(1, None, None)]
-
-
-def reset_stack():
-    global _indent_stack
-    _indent_stack = [(1, None, None)]
-
-
-add_reset_action(reset_stack)
-
-
 def indented_block(blockStatementExpr, indent=True):
     """Helper method for defining space-delimited indentation blocks,
     such as those used to define block statements in Python source code.
@@ -680,64 +716,52 @@ def indented_block(blockStatementExpr, indent=True):
 
      - blockStatementExpr - expression defining syntax of statement that
        is repeated within the indented block
-     - indentStack - list created by caller to manage indentation stack
-       (multiple statementWithIndentedBlock expressions within a single
-       grammar should share a common indentStack)
      - indent - boolean indicating whether block must be indented beyond
        the current level; set to False for block of left-most
        statements (default= ``True``)
 
+    The stack of indent columns is kept in the `ParseState`, so all
+    indented_block expressions within a single parse share it.
+
     A valid block must contain at least one ``blockStatement``.
     """
-    PEER = Forward()
-    DEDENT = Forward()
 
     def _reset_stack(t=None, i=None, s=None, c=None):
-        old_col, old_peer, old_dedent = _indent_stack.pop()
-        PEER << old_peer
-        DEDENT << old_dedent
-
-    def peer_stack(expected_col):
-        def output(t, l, s):
-            if l >= len(s):
-                return
-            cur_col = col(l, s)
-            if cur_col != expected_col:
-                if cur_col > expected_col:
-                    raise ParseException(t.type, l, s, "illegal nesting")
-                raise ParseException(t.type, l, s, "not a peer entry")
-
-        return output
-
-    def dedent_stack(expected_col):
-        def output(t, l, s):
-            if l >= len(s):
-                return
-            cur_col = col(l, s)
-            if cur_col not in (i for i, _, _ in _indent_stack):
-                raise ParseException(s, l, "not an unindent")
-            if cur_col < _indent_stack[-1][0]:
-                old_col, old_peer, old_dedent = _indent_stack.pop()
-                PEER << old_peer
-                DEDENT << old_dedent
-
-        return output
+        parse_state().indent_stack.pop()
+
+    def peer_stack(t, l, s):
+        if l >= len(s):
+            return
+        expected_col = parse_state().indent_stack[-1]
+        cur_col = col(l, s)
+        if cur_col != expected_col:
+            if cur_col > expected_col:
+                raise ParseException(t.type, l, s, "illegal nesting")
+            raise ParseException(t.type, l, s, "not a peer entry")
+
+    def dedent_stack(t, l, s):
+        if l >= len(s):
+            return
+        stack = parse_state().indent_stack
+        cur_col = col(l, s)
+        if cur_col not in stack:
+            raise ParseException(t.type, l, s, "not an unindent")
+        if cur_col < stack[-1]:
+            stack.pop()
 
     def indent_stack(t, l, s):
+        stack = parse_state().indent_stack
         cur_col = col(l, s)
-        if cur_col > _indent_stack[-1][0]:
-            PEER << Empty() / peer_stack(cur_col)
-            DEDENT << Empty() / dedent_stack(cur_col)
-            _indent_stack.append((cur_col, PEER, DEDENT))
+        if cur_col > stack[-1]:
+            stack.append(cur_col)
         else:
             raise ParseException(t.type, l, s, "not a subentry")
 
     def nodent_stack(t, l, s):
+        stack = parse_state().indent_stack
         cur_col = col(l, s)
-        if cur_col == _indent_stack[-1][0]:
-            PEER << Empty() / peer_stack(cur_col)
-            DEDENT << Empty() / dedent_stack(cur_col)
-            _indent_stack.append((cur_col, PEER, DEDENT))
+        if cur_col == stack[-1]:
+            stack.append(cur_col)
         else:
             raise ParseException(t.type, l, s, "not a subentry")
 
@@ -748,6 +772,8 @@ def indented_block(blockStatementExpr, indent=True):
         NL = OneOrMore(LineEnd().suppress())
         INDENT = Empty() / indent_stack
         NODENT = Empty() / nodent_stack
+        PEER = Empty() / peer_stack
+        DEDENT = Empty() / dedent_stack
 
         if indent:
             sm_expr = Group(
@@ -763,16 +789,27 @@ def indented_block(blockStatementExpr, indent=True):
                 + OneOrMore(PEER + Group(blockStatementExpr) + Optional(NL))
                 + DEDENT
             )
-    return sm_expr.setFailAction(_reset_stack).set_parser_name("indented block")
+    return (
+        sm_expr
+        .setFailAction(_reset_stack)
+        .set_parser_name("indented block")
+        .no_memo(inside=True)  # EVERYTHING INSIDE DEPENDS ON THE indent_stack
+    )
+
+
+@_lazy("anyOpenTag", "anyCloseTag")
+def _any_tags():
+    return makeHTMLTags(Word(alphas, alphanums + "_:").set_parser_name("any tag"))
 
 
-anyOpenTag, anyCloseTag = makeHTMLTags(
-    Word(alphas, alphanums + "_:").set_parser_name("any tag")
-)
 _htmlEntityMap = dict(zip("gt lt amp nbsp quot apos".split(), "><& \"'"))
-commonHTMLEntity = Regex(
-    "&(?P<entity>" + "|".join(_htmlEntityMap.keys()) + ");"
-).set_parser_name("common HTML entity")
+
+
+@_lazy("commonHTMLEntity")
+def _common_html_entity():
+    return Regex(
+        "&(?P<entity>" + "|".join(_htmlEntityMap.keys()) + ");"
+    ).set_parser_name("common HTML entity")
 
 
 def replaceHTMLEntity(t):
@@ -781,92 +818,117 @@ def replaceHTMLEntity(t):
 
 
 # it's easy to get these comment structures wrong - they're very common, so may as well make them available
-cStyleComment = Combine(
-    Regex(r"/\*(?:[^*]|\*(?!/))*") + "*/"
-).set_parser_name("C style comment")
+@_lazy("cStyleComment", "html_comment")
+def _comments():
+    cStyleComment = Combine(
+        Regex(r"/\*(?:[^*]|\*(?!/))*") + "*/"
+    ).set_parser_name("C style comment")
+
+    html_comment = Regex(r"<!--[\s\S]*?-->").set_parser_name("HTML comment")
+    return cStyleComment, html_comment
+
+
+@_lazy("restOfLine", "dblSlashComment", "cppStyleComment", "javaStyleComment", "pythonStyleComment")
+def _line_comments():
+    with NO_WHITESPACE:
+        restOfLine = Regex(r"[^\n]*").set_parser_name("rest of line")
 
-html_comment = Regex(r"<!--[\s\S]*?-->").set_parser_name("HTML comment")
+        dblSlashComment = Regex(r"//(?:\\\n|[^\n])*").set_parser_name("// comment")
 
-with NO_WHITESPACE:
-    restOfLine = Regex(r"[^\n]*").set_parser_name("rest of line")
+        cppStyleComment = Combine(
+            Regex(r"/\*(?:[^*]|\*(?!/))*") + "*/" | dblSlashComment
+        ).set_parser_name("C++ style comment")
 
-    dblSlashComment = Regex(r"//(?:\\\n|[^\n])*").set_parser_name("// comment")
+        javaStyleComment = cppStyleComment
 
-    cppStyleComment = Combine(
-        Regex(r"/\*(?:[^*]|\*(?!/))*") + "*/" | dblSlashComment
-    ).set_parser_name("C++ style comment")
+        pythonStyleComment = Regex(r"#[^\n]*").set_parser_name("Python style comment")
+    return restOfLine, dblSlashComment, cppStyleComment, javaStyleComment, pythonStyleComment
 
-    javaStyleComment = cppStyleComment
 
-    pythonStyleComment = Regex(r"#[^\n]*").set_parser_name("Python style comment")
+@_lazy("commaSeparatedList")
+def _comma_separated_list():
+    _commasepitem = Combine(OneOrMore(
+        Word(printables, exclude=",") + Optional(Word(" \t") + ~Literal(",") + ~LineEnd())
+    )).set_parser_name("comma_item") / (lambda t: text(t).strip())
+    return delimited_list(Optional(
+        __getattr__("quoted_string") | _commasepitem, default=""
+    )).set_parser_name("commaSeparatedList")
 
-_commasepitem = Combine(OneOrMore(
-    Word(printables, exclude=",") + Optional(Word(" \t") + ~Literal(",") + ~LineEnd())
-)).set_parser_name("comma_item") / (lambda t: text(t).strip())
-commaSeparatedList = delimited_list(Optional(
-    quoted_string | _commasepitem, default=""
-)).set_parser_name("commaSeparatedList")
 
 convertToInteger = token_map(int)
 convertToFloat = token_map(float)
 
-integer = Word(nums).set_parser_name("integer") / convertToInteger
 
-hex_integer = Word(hexnums).set_parser_name("hex integer") / token_map(int, 16)
+@_lazy("integer", "hex_integer", "signed_integer", "fraction", "mixed_integer", "real", "sci_real", "number", "fnumber")
+def _numbers():
+    integer = Word(nums).set_parser_name("integer") / convertToInteger
 
-signed_integer = Regex(r"[+-]?\d+").set_parser_name("signed integer") / convertToInteger
+    hex_integer = Word(hexnums).set_parser_name("hex integer") / token_map(int, 16)
 
-fraction = (
-    signed_integer / convertToFloat + "/" + signed_integer / convertToFloat
-).set_parser_name("fraction") / (lambda t: t[0] / t[2])
+    signed_integer = Regex(r"[+-]?\d+").set_parser_name("signed integer") / convertToInteger
 
-mixed_integer = (
-    fraction | signed_integer + Optional(Optional("-").suppress() + fraction)
-).set_parser_name("fraction or mixed integer-fraction") / sum
+    fraction = (
+        signed_integer / convertToFloat + "/" + signed_integer / convertToFloat
+    ).set_parser_name("fraction") / (lambda t: t[0] / t[2])
 
-real = Regex(r"[+-]?(?:\d+\.\d*|\.\d+)").set_parser_name("real number") / convertToFloat
+    mixed_integer = (
+        fraction | signed_integer + Optional(Optional("-").suppress() + fraction)
+    ).set_parser_name("fraction or mixed integer-fraction") / sum
 
-sci_real = (
-    Regex(r"[+-]?(?:\d+(?:[eE][+-]?\d+)|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)").set_parser_name("real number with scientific notation")
-    / convertToFloat
-)
+    real = Regex(r"[+-]?(?:\d+\.\d*|\.\d+)").set_parser_name("real number") / convertToFloat
 
-number = (sci_real | real | signed_integer).streamline()
+    sci_real = (
+        Regex(r"[+-]?(?:\d+(?:[eE][+-]?\d+)|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)").set_parser_name("real number with scientific notation")
+        / convertToFloat
+    )
 
-fnumber = (
-    Regex(r"[+-]?\d+\.?\d*([eE][+-]?\d+)?").set_parser_name("fnumber") / convertToFloat
-)
+    number = (sci_real | real | signed_integer).streamline()
 
-identifier = Word(alphas + "_", alphanums + "_").set_parser_name("identifier")
-
-ipv4_address = Regex(
-    r"(25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})(\.(25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3}"
-).set_parser_name("IPv4 address")
-
-_ipv6_part = Regex(r"[0-9a-fA-F]{1,4}").set_parser_name("hex_integer")
-_full_ipv6_address = (
-    _ipv6_part + (":" + _ipv6_part) * 7
-).set_parser_name("full IPv6 address")
-_short_ipv6_address = (
-    Optional(_ipv6_part + (":" + _ipv6_part) * (0, 6))
-    + "::"
-    + Optional(_ipv6_part + (":" + _ipv6_part) * (0, 6))
-).set_parser_name("short IPv6 address")
-_short_ipv6_address.add_condition(lambda t: sum(
-    1 for tt in t if _ipv6_part.matches(tt)
-) < 8)
-_mixed_ipv6_address = ("::ffff:" + ipv4_address).set_parser_name("mixed IPv6 address")
-ipv6_address = Combine(
-    (
-        _full_ipv6_address | _mixed_ipv6_address | _short_ipv6_address
+    fnumber = (
+        Regex(r"[+-]?\d+\.?\d*([eE][+-]?\d+)?").set_parser_name("fnumber") / convertToFloat
+    )
+    return integer, hex_integer, signed_integer, fraction, mixed_integer, real, sci_real, number, fnumber
+
+
+@_lazy("identifier")
+def _identifier():
+    return Word(alphas + "_", alphanums + "_").set_parser_name("identifier")
+
+
+@_lazy("ipv4_address", "ipv6_address")
+def _ip_addresses():
+    ipv4_address = Regex(
+        r"(25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})(\.(25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3}"
+    ).set_parser_name("IPv4 address")
+
+    _ipv6_part = Regex(r"[0-9a-fA-F]{1,4}").set_parser_name("hex_integer")
+    _full_ipv6_address = (
+        _ipv6_part + (":" + _ipv6_part) * 7
+    ).set_parser_name("full IPv6 address")
+    _short_ipv6_address = (
+        Optional(_ipv6_part + (":" + _ipv6_part) * (0, 6))
+        + "::"
+        + Optional(_ipv6_part + (":" + _ipv6_part) * (0, 6))
+    ).set_parser_name("short IPv6 address")
+    _short_ipv6_address.add_condition(lambda t: sum(
+        1 for tt in t if _ipv6_part.matches(tt)
+    ) < 8)
+    _mixed_ipv6_address = ("::ffff:" + ipv4_address).set_parser_name("mixed IPv6 address")
+    ipv6_address = Combine(
+        (
+            _full_ipv6_address | _mixed_ipv6_address | _short_ipv6_address
+        ).set_parser_name("IPv6 address")
     ).set_parser_name("IPv6 address")
-).set_parser_name("IPv6 address")
-"IPv6 address (long, short, or mixed form)"
+    "IPv6 address (long, short, or mixed form)"
+    return ipv4_address, ipv6_address
 
-mac_address = (
-    Regex(r"[0-9a-fA-F]{2}([:.-])[0-9a-fA-F]{2}(?:\1[0-9a-fA-F]{2}){4}").set_parser_name("MAC address")
-)
-"MAC address xx:xx:xx:xx:xx (may also have '-' or '.' delimiters)"
+
+@_lazy("mac_address")
+def _mac_address():
+    "MAC address xx:xx:xx:xx:xx (may also have '-' or '.' delimiters)"
+    return (
+        Regex(r"[0-9a-fA-F]{2}([:.-])[0-9a-fA-F]{2}(?:\1[0-9a-fA-F]{2}){4}").set_parser_name("MAC address")
+    )
 
 
 def convertToDate(fmt="%Y-%m-%d"):
@@ -923,26 +985,35 @@ def convertToDatetime(fmt="%Y-%m-%dT%H:%M:%S.%f"):
     return cvt_fn
 
 
-iso8601_date = (
-    Regex(r"(?P<year>\d{4})(?:-(?P<month>\d\d)(?:-(?P<day>\d\d))?)?")
-    .capture_groups()
-    .set_parser_name("ISO8601 date")
-)
+@_lazy("iso8601_date", "iso8601_datetime")
+def _iso8601():
+    iso8601_date = (
+        Regex(r"(?P<year>\d{4})(?:-(?P<month>\d\d)(?:-(?P<day>\d\d))?)?")
+        .capture_groups()
+        .set_parser_name("ISO8601 date")
+    )
 
-iso8601_datetime = (
-    Regex(
-        r"(?P<year>\d{4})-(?P<month>\d\d)-(?P<day>\d\d)[T"
-        r" ](?P<hour>\d\d):(?P<minute>\d\d)(:(?P<second>\d\d(\.\d*)?)?)?(?P<tz>Z|[+-]\d\d:?\d\d)?"
+    iso8601_datetime = (
+        Regex(
+            r"(?P<year>\d{4})-(?P<month>\d\d)-(?P<day>\d\d)[T"
+            r" ](?P<hour>\d\d):(?P<minute>\d\d)(:(?P<second>\d\d(\.\d*)?)?)?(?P<tz>Z|[+-]\d\d:?\d\d)?"
+        )
+        .capture_groups()
+        .set_parser_name("ISO8601 datetime")
     )
-    .capture_groups()
-    .set_parser_name("ISO8601 datetime")
-)
+    return iso8601_date, iso8601_datetime
 
-uuid = (
-    Regex(r"[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}").set_parser_name("UUID")
-)
 
-_html_stripper = anyOpenTag.suppress() | anyCloseTag.suppress()
+@_lazy("uuid")
+def _uuid():
+    return (
+        Regex(r"[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}").set_parser_name("UUID")
+    )
+
+
+@_lazy("_html_stripper")
+def _make_html_stripper():
+    return __getattr__("anyOpenTag").suppress() | __getattr__("anyCloseTag").suppress()
 
 
 def stripHTMLTags(tokens, l, s):
@@ -960,16 +1031,22 @@ def stripHTMLTags(tokens, l, s):
 
         More info at the mo_parsing wiki page
     """
-    return _html_stripper.transform_string(tokens[0])
+    return __getattr__("_html_stripper").transform_string(tokens[0])
 
 
 def _strip(tok):
     return "".join(tok).strip()
 
 
-_commasepitem = (
-    Word(printables + " \t", exclude=",").set_parser_name("comma_item") / _strip
-)
-comma_separated_list = delimited_list(Optional(
-    quoted_string | _commasepitem, default=""
-)).set_parser_name("comma separated list")
+@_lazy("comma_separated_list")
+def _make_comma_separated_list():
+    _commasepitem = (
+        Word(printables + " \t", exclude=",").set_parser_name("comma_item") / _strip
+    )
+    return delimited_list(Optional(
+        __getattr__("quoted_string") | _commasepitem, default=""
+    )).set_parser_name("comma separated list")
+
+
+# from mo_parsing.helpers import * ALSO BUILDS THE LAZY HELPER GRAMMARS
+__all__ = [name for name in __dir__() if not name.startswith("_")]
@@ -123,6 +123,7 @@ def one_of(strs, caseless=False, as_keyword=False):
 LEFT_ASSOC = object()
 RIGHT_ASSOC = object()
 _no_op = Empty().suppress()
+_open = object()  # MARKS A TERNARY THAT HAS NOT SEEN ITS SECOND OPERATOR
 
 
 def infix_notation(
@@ -228,138 +229,133 @@ def infix_notation(
             ))
     op_list = tuple(op_list)
 
+    # ROLE OF EACH RECORDED TOKEN, AS SEEN BY THE flat GRAMMAR
+    prefix_level, suffix_level, infix_level, ternary_level = {}, {}, {}, {}
+    for level, (expr, op, is_suppressed, arity, assoc, pa) in enumerate(op_list):
+        if arity == 1:
+            (prefix_level if assoc == RIGHT_ASSOC else suffix_level).setdefault(op, level)
+        elif arity == 2:
+            infix_level.setdefault(op, level)
+        else:
+            infix_level.setdefault(op[0], level)
+            ternary_level.setdefault(op, level)
+
     def record_op(op):
         def output(tokens):
             return ParseResults(NO_PARSER, tokens.start, tokens.end, [(tokens, op)], [])
 
         return output
 
-    prefix_ops = MatchFirst([
-        op / record_op(op)
-        for expr, op, is_suppressed, arity, assoc, pa in op_list
-        if arity == 1 and assoc == RIGHT_ASSOC
-    ])
-    suffix_ops = MatchFirst([
-        op / record_op(op)
-        for expr, op, is_suppressed, arity, assoc, pa in op_list
-        if arity == 1 and assoc == LEFT_ASSOC
-    ])
-    ops = Or([
-        op_part / record_op(op_part)
-        for op_part in set(
-            op_part
-            for expr, op, is_suppressed, arity, assoc, pa in op_list
-            if arity > 1
-            for op_part in (op if isinstance(op, tuple) else [op])
-        )
-    ])
+    prefix_ops = MatchFirst([op / record_op(op) for op in prefix_level])
+    suffix_ops = MatchFirst([op / record_op(op) for op in suffix_level])
+
+    # THE TOKENS OF AN EXPRESSION, NOT YET A TREE; LIKE A PARENTHESIS, A
+    # TERNARY IS ONLY MATCHED WITH BOTH OPERATORS, SO AN INCOMPLETE ONE IS NOT CONSUMED
+    chain = Forward()
+    ops = Or(
+        [op / record_op(op) for op, level in infix_level.items() if op_list[level][3] == 2]
+        + [op0 / record_op(op0) + chain + op1 / record_op(op1) for op0, op1 in ternary_level]
+    )
+
+    def reduce(operators, operands, string):
+        """
+        APPLY THE OPERATOR ON TOP OF operators TO THE operands IT TAKES
+        """
+        level, r, r1 = operators.pop()
+        expr, op, is_suppressed, arity, assoc, parse_actions = op_list[level]
+        if arity == 1:
+            tok = operands.pop()
+            if is_suppressed:
+                result = ParseResults(expr, tok.start, tok.end, (tok,), [])
+            elif assoc == RIGHT_ASSOC:
+                result = ParseResults(expr, r.start, tok.end, (r, tok), [])
+            else:
+                result = ParseResults(expr, tok.start, r.end, (tok, r), [])
+        elif arity == 2:
+            right = operands.pop()
+            left = operands.pop()
+            if is_suppressed:
+                seq = (left, right)
+            else:
+                seq = (left, r, right)
+            result = ParseResults(expr, left.start, right.end, seq, [])
+        else:
+            right = operands.pop()
+            middle = operands.pop()
+            left = operands.pop()
+            seq = [left, middle, right]
+            s0, s1 = is_suppressed
+            if not s1:
+                seq.insert(2, r1)
+            if not s0:
+                seq.insert(1, r)
+            result = ParseResults(expr, left.start, right.end, seq, [])
+
+        for p in parse_actions:
+            result = p(result, -1, string)
+        operands.append(result)
+
+    def binds_first(top, level):
+        """
+        RETURN True IF THE OPERATOR ON top IS APPLIED BEFORE AN OPERATOR AT level
+        """
+        top_level, _, r1 = top
+        if r1 is _open:
+            # TERNARY WAITING FOR ITS SECOND OPERATOR, LIKE AN OPEN PARENTHESIS
+            return False
+        return top_level < level or (top_level == level and op_list[level][4] != RIGHT_ASSOC)
 
     def make_tree(tokens, loc, string):
-        flat_tokens = list(tokens)
-        num = len(op_list)
-        op_index = 0
-        while len(flat_tokens) > 1 and op_index < num:
-            expr, op, is_suppressed, arity, assoc, parse_actions = op_list[op_index]
-            if arity == 1:
-                if assoc == RIGHT_ASSOC:
-                    # PREFIX OPERATOR -3
-                    todo = list(reversed(list(enumerate(flat_tokens[:-1]))))
-                    for i, (r, o) in todo:
-                        if o == op:
-                            tok = flat_tokens[i + 1][0]
-                            if is_suppressed:
-                                result = ParseResults(
-                                    expr, tok.start, tok.end, (tok,), []
-                                )
-                            else:
-                                result = ParseResults(
-                                    expr, r.start, tok.end, (r, tok), []
-                                )
-                            break
-                    else:
-                        op_index += 1
-                        continue
-                else:
-                    # SUFFIX OPERATOR 3!
-                    todo = list(enumerate(flat_tokens[1:]))
-                    for i, (r, o) in todo:
-                        if o == op:
-                            tok = flat_tokens[i][0]
-                            if is_suppressed:
-                                result = ParseResults(
-                                    expr, tok.start, tok.end, (tok,), []
-                                )
-                            else:
-                                result = ParseResults(
-                                    expr, tok.start, r.end, (tok, r,), []
-                                )
-                            break
-                    else:
-                        op_index += 1
-                        continue
-            elif arity == 2:
-                todo = list(enumerate(flat_tokens[1:-1]))
-                if assoc == RIGHT_ASSOC:
-                    todo = list(reversed(todo))
-
-                for i, (r, o) in todo:
-                    if o == op:
-                        if is_suppressed:
-                            result = ParseResults(
-                                expr,
-                                flat_tokens[i][0].start,
-                                flat_tokens[i + 2][0].end,
-                                (flat_tokens[i][0], flat_tokens[i + 2][0]),
-                                [],
-                            )
-                        else:
-                            result = ParseResults(
-                                expr,
-                                flat_tokens[i][0].start,
-                                flat_tokens[i + 2][0].end,
-                                (flat_tokens[i][0], r, flat_tokens[i + 2][0]),
-                                [],
-                            )
-                        break
+        """
+        PRECEDENCE CLIMBING WITH AN EXPLICIT STACK, ONE PASS OVER THE TOKENS
+        THE LOWER THE level (INDEX INTO spec) THE TIGHTER THE OPERATOR BINDS
+        """
+        operands = []
+        operators = []  # STACK OF (level, op_token, second_op_token)
+        opened = []  # level OF EACH TERNARY WAITING FOR ITS SECOND OPERATOR
+        expect_operand = True
+        for r, o in tokens:
+            if expect_operand:
+                level = prefix_level.get(o)
+                if level is None:
+                    operands.append(r)
+                    expect_operand = False
                 else:
-                    op_index += 1
-                    continue
-
-            else:  # arity==3
-                todo = list(enumerate(flat_tokens[1:-3]))
-                if assoc == RIGHT_ASSOC:
-                    todo = list(reversed(todo))
-
-                for i, (r0, o0) in todo:
-                    if o0 == op[0]:
-                        r1, o1 = flat_tokens[i + 3]
-                        if o1 == op[1]:
-                            seq = [
-                                flat_tokens[i][0],
-                                flat_tokens[i + 2][0],
-                                flat_tokens[i + 4][0],
-                            ]
-                            s0, s1 = is_suppressed
-                            if not s1:
-                                seq.insert(2, r1)
-                            if not s0:
-                                seq.insert(1, r0)
-
-                            result = ParseResults(
-                                expr, seq[0].start, seq[-1].end, seq, []
-                            )
-                            break
-                else:
-                    op_index += 1
-                    continue
+                    operators.append((level, r, None))
+                continue
+
+            level = suffix_level.get(o)
+            if level is not None:
+                while operators and binds_first(operators[-1], level):
+                    reduce(operators, operands, string)
+                operators.append((level, r, None))
+                reduce(operators, operands, string)
+                continue
+
+            if opened and op_list[opened[-1]][1][1] is o:
+                # SECOND OPERATOR OF A TERNARY, LIKE A CLOSING PARENTHESIS
+                while operators[-1][2] is not _open:
+                    reduce(operators, operands, string)
+                level, r0, _ = operators.pop()
+                operators.append((level, r0, r))
+                opened.pop()
+                expect_operand = True
+                continue
+
+            level = infix_level[o]
+            while operators and binds_first(operators[-1], level):
+                reduce(operators, operands, string)
+            if op_list[level][3] == 3:
+                operators.append((level, r, _open))
+                opened.append(level)
+            else:
+                operators.append((level, r, None))
+            expect_operand = True
 
-            for p in parse_actions:
-                result = p(result, -1, string)
-            offset = (0, 2, 3, 5)[arity]
-            flat_tokens[i : i + offset] = [(result, (expr,))]
-            op_index = 0
+        while operators:
+            reduce(operators, operands, string)
 
-        result = flat_tokens[0][0]
+        result = operands[0]
         result.end = tokens.end
         result.failures = tokens.failures
         return result
@@ -368,6 +364,8 @@ def infix_notation(
     iso = lpar.suppress() + flat + rpar.suppress()
     atom = (base_expr | iso) / record_op(base_expr)
     decorated = ZeroOrMore(prefix_ops) + atom + ZeroOrMore(suffix_ops)
-    flat << ((decorated + ZeroOrMore(ops + decorated)) / make_tree).streamline()
+    tokens = decorated + ZeroOrMore(ops + decorated)
+    chain << tokens
+    flat << (tokens / make_tree).streamline()
 
     return flat.streamline()
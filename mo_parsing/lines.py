@@ -0,0 +1,90 @@
+# encoding: utf-8
+"""
+NEWLINE OFFSETS OF A STRING, SO lineno(), col() AND line() ARE A bisect,
+NOT A SCAN OF THE STRING UP TO loc
+
+THE INDEX IS BUILT THE FIRST TIME A POSITION IN THE STRING IS NEEDED, AND
+KEPT ON THE ParseState, SO IT IS DROPPED WHEN THE PARSE ENDS. OUTSIDE A
+PARSE EACH LOOKUP SCANS THE STRING; MAKE A LineIndex TO LOOK UP MANY
+"""
+from array import array
+from bisect import bisect_left
+
+from mo_imports import expect
+
+parse_state = expect("parse_state")
+
+
+class LineIndex(object):
+    """
+    THE POSITION OF EVERY "\\n" IN A STRING
+    """
+
+    __slots__ = ["string", "newlines"]
+
+    def __init__(self, string):
+        self.string = string
+        newlines = self.newlines = array("l")
+        find = string.find
+        i = find("\n")
+        while i != -1:
+            newlines.append(i)
+            i = find("\n", i + 1)
+
+    def lineno(self, loc):
+        return bisect_left(self.newlines, loc) + 1
+
+    def col(self, loc):
+        i = bisect_left(self.newlines, loc)
+        if i:
+            return loc - self.newlines[i - 1]
+        return loc + 1
+
+    def line(self, loc):
+        newlines = self.newlines
+        i = bisect_left(newlines, loc)
+        begin = newlines[i - 1] + 1 if i else 0
+        if i < len(newlines):
+            return self.string[begin : newlines[i]]
+        return self.string[begin:]
+
+
+class _LineScan(object):
+    """
+    SAME AS LineIndex, WITHOUT THE INDEX: ONE SCAN OF THE STRING PER LOOKUP
+    """
+
+    __slots__ = ["string"]
+
+    def __init__(self, string):
+        self.string = string
+
+    def lineno(self, loc):
+        return self.string.count("\n", 0, loc) + 1
+
+    def col(self, loc):
+        return loc - self.string.rfind("\n", 0, loc)
+
+    def line(self, loc):
+        string = self.string
+        begin = string.rfind("\n", 0, loc) + 1
+        end = string.find("\n", loc)
+        if end == -1:
+            return string[begin:]
+        return string[begin:end]
+
+
+def line_index(string):
+    """
+    :return: LineIndex FOR THE GIVEN string, OR A _LineScan WHEN NO PARSE IS RUNNING
+    """
+    state = parse_state()
+    found = state.lines
+    if found is not None and found.string is string:
+        return found
+
+    if state.previous is None:
+        # THE IDLE ParseState OF THE THREAD WOULD KEEP THE INDEX FOREVER
+        return _LineScan(string)
+    output = state.lines = LineIndex(string)
+    return output
@@ -0,0 +1,191 @@
+# encoding: utf-8
+from collections import OrderedDict
+
+from mo_parsing.exceptions import ParseException
+from mo_parsing.utils import Log, MAX_INT
+
+
+FAILED = object()  # CACHED FAILURE OF _try()
+
+
+class Memo(object):
+    """
+    PACKRAT MEMOIZATION SETTINGS, AND HIT/MISS COUNTERS, FOR A Parser
+
+    EACH PARSE GETS ITS OWN MemoTable, SO THE CACHE IS NEVER SHARED BETWEEN
+    STRINGS OR THREADS; THE COUNTERS ACCUMULATE OVER ALL PARSES
+    """
+
+    __slots__ = ["size", "window", "hits", "misses", "evictions"]
+
+    def __init__(self, size=100_000, window=None):
+        """
+        :param size: MAXIMUM NUMBER OF CACHED ATTEMPTS, LEAST RECENTLY USED ARE EVICTED
+        :param window: IF SET, EVICT ATTEMPTS STARTING MORE THAN window CHARACTERS BEHIND THE FURTHEST ATTEMPT
+        """
+        if size < 1:
+            Log.error("memo size must be positive")
+        if window is not None and window < 0:
+            Log.error("memo window can not be negative")
+        self.size = size
+        self.window = window
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def normalize(cls, memo):
+        """
+        :param memo: None, False, True, A SIZE, OR A Memo
+        :return: Memo, OR None IF MEMOIZATION IS OFF
+        """
+        if memo is None or memo is False:
+            return None
+        if memo is True:
+            return Memo()
+        if isinstance(memo, Memo):
+            return memo
+        if isinstance(memo, int):
+            return Memo(size=memo)
+        Log.error("expecting Memo, size, or True")
+
+    def table(self):
+        return MemoTable(self)
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __data__(self):
+        return {
+            "size": self.size,
+            "window": self.window,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __str__(self):
+        return f"Memo(hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+
+class MemoTable(object):
+    """
+    THE PACKRAT CACHE FOR ONE PARSE
+    MAPS (element, start, do_actions) TO ParseResults, ParseException, OR FAILED
+    """
+
+    __slots__ = ["memo", "cache", "size", "window", "positions", "horizon", "low"]
+
+    def __init__(self, memo):
+        self.memo = memo
+        self.cache = OrderedDict()
+        self.size = memo.size
+        self.window = memo.window
+        self.positions = {}  # MAP FROM start TO KEYS, ONLY FOR window EVICTION
+        self.horizon = 0  # FURTHEST start SEEN
+        self.low = 0  # ALL start < low HAVE BEEN EVICTED
+
+    def parse(self, element, string, start, do_actions):
+        key = (id(element), start, do_actions)
+        cache = self.cache
+        found = cache.get(key)
+        if found is not None:
+            self.memo.hits += 1
+            if self.size != MAX_INT:
+                cache.move_to_end(key)
+            if found is FAILED:
+                raise ParseException(element, start, string)
+            if isinstance(found, ParseException):
+                raise found.with_traceback(None)
+            return copy_result(found)
+
+        self.memo.misses += 1
+        try:
+            result = element._parse_uncached(string, start, do_actions)
+        except ParseException as cause:
+            self.add(key, start, cause)
+            raise
+        self.add(key, start, copy_result(result))
+        return result
+
+    def try_parse(self, element, string, start, do_actions):
+        """
+        SAME AS parse(), FOR _try(): None IS A FAILURE
+        """
+        return self.call(element, element._try_uncached, string, start, do_actions)
+
+    def call(self, element, function, string, start, do_actions):
+        """
+        SAME AS try_parse(), BUT function(string, start, do_actions) DOES THE WORK
+        """
+        key = (id(element), start, do_actions)
+        found = self.get(key)
+        if found is not None:
+            if found is FAILED or isinstance(found, ParseException):
+                return None
+            return copy_result(found)
+
+        result = function(string, start, do_actions)
+        if result is None:
+            self.add(key, start, FAILED)
+            return None
+        self.add(key, start, copy_result(result))
+        return result
+
+    def get(self, key):
+        """
+        :return: THE CACHED ParseResults, ParseException, OR FAILED FOR key; None IF NOT CACHED
+        """
+        cache = self.cache
+        found = cache.get(key)
+        if found is None:
+            self.memo.misses += 1
+            return None
+        self.memo.hits += 1
+        if self.size != MAX_INT:
+            cache.move_to_end(key)
+        return found
+
+    def add(self, key, start, value):
+        window = self.window
+        if window is not None and start < self.low:
+            # BEHIND THE WINDOW, DO NOT BOTHER
+            return
+
+        cache = self.cache
+        cache[key] = value
+        if len(cache) > self.size:
+            cache.popitem(last=False)
+            self.memo.evictions += 1
+
+        if window is None:
+            return
+        self.positions.setdefault(start, []).append(key)
+        if start <= self.horizon:
+            return
+        self.horizon = start
+        positions = self.positions
+        limit = start - window
+        low = self.low
+        while low < limit:
+            for k in positions.pop(low, ()):
+                if cache.pop(k, None) is not None:
+                    self.memo.evictions += 1
+            low += 1
+        self.low = low
+
+
+def copy_result(result):
+    """
+    SHALLOW COPY, SO PARSE ACTIONS OF ONE CONSUMER DO NOT CHANGE WHAT ANOTHER SEES
+    """
+    output = object.__new__(result.__class__)
+    output._type = result._type
+    output.start = result.start
+    output.end = result.end
+    output.tokens = list(result.tokens)
+    output.timing = result.timing
+    output.failures = list(result.failures)
+    return output
@@ -0,0 +1,111 @@
+# encoding: utf-8
+"""
+PARSE MANY INDEPENDENT STRINGS ON A POOL OF PROCESSES
+
+EACH WORKER GETS THE GRAMMAR ONCE: BUILT WITH AN IMPORTABLE factory, OR
+PICKLED FROM THIS PROCESS. IT SENDS BACK PLAIN DATA: THE as_list() OF EACH
+RESULT (OR WHAT convert MAKES OF IT), OR THE ParseException, WITH ITS
+ParserElement REPLACED BY ITS DESCRIPTION
+"""
+import os
+from collections import deque
+
+from mo_imports import export
+
+from mo_parsing.core import Parser
+from mo_parsing.exceptions import ParseException
+
+START_METHOD = "spawn"  # A fork OF A PROCESS WITH THREADS (LIKE mo_threads) CAN HANG; THE factory IS IMPORTABLE ANYWAY
+_parser = None  # THE Parser OF THIS WORKER PROCESS
+
+
+def parse_many(parser, strings, factory, workers, chunksize, ordered, parse_all, convert):
+    """
+    SEE Parser.parse_many()
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return (_parse_one(parser, string, parse_all, convert) for string in strings)
+    return _on_pool(parser, strings, factory, workers, chunksize, ordered, parse_all, convert)
+
+
+def _on_pool(parser, strings, factory, workers, chunksize, ordered, parse_all, convert):
+    # THE PROCESS MACHINERY IS SLOW TO IMPORT, AND RARELY NEEDED
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from multiprocessing import get_context
+
+    limit = 2 * workers  # CHUNKS IN FLIGHT, SO THE INPUT IS STREAMED
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=get_context(START_METHOD),
+        initializer=_start,
+        initargs=(factory, parser if factory is None else None, parser.memo, parser.farthest),
+    ) as pool:
+        if ordered:
+            pending = deque()
+            for chunk in _chunks(strings, chunksize):
+                pending.append(pool.submit(_parse_chunk, chunk, parse_all, convert))
+                if len(pending) >= limit:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            pending = set()
+            for chunk in _chunks(strings, chunksize):
+                pending.add(pool.submit(_parse_chunk, chunk, parse_all, convert))
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+
+def _chunks(strings, chunksize):
+    chunk = []
+    for string in strings:
+        chunk.append(string)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _start(factory, parser, memo, farthest):
+    """
+    BUILD THE GRAMMAR OF THIS WORKER, OR USE THE ONE PICKLED
+    """
+    global _parser
+    if factory is None:
+        _parser = parser
+        return
+    grammar = factory()
+    _parser = grammar if isinstance(grammar, Parser) else Parser(grammar, memo=memo, farthest=farthest)
+
+
+def _parse_chunk(strings, parse_all, convert):
+    return [_parse_one(_parser, string, parse_all, convert) for string in strings]
+
+
+def _parse_one(parser, string, parse_all, convert):
+    try:
+        result = parser.parse(string, parse_all=parse_all)
+    except ParseException as cause:
+        return plain_exception(cause)
+    if convert is None:
+        return result.as_list()
+    return convert(result)
+
+
+def plain_exception(cause):
+    """
+    :return: THE best_cause OF cause, WITH ITS ParserElement AS TEXT, SO IT CAN BE PICKLED
+    """
+    best = cause.best_cause
+    return best.__class__(str(best.expr), best.loc, best.string, best._msg)
+
+
+export("mo_parsing.core", parse_many)
@@ -74,8 +74,9 @@ def _profile_parse(self, string, start, do_actions=True):
             )
             raise
 
-        if self.parse_action and (do_actions or self.parser_config.callDuringTry):
-            for fn in self.parse_action:
+        actions = self._actions(do_actions) if self.parse_action else None
+        if actions:
+            for fn in actions:
                 tokens = fn(tokens, start, string)
 
         return tokens
@@ -7,9 +7,9 @@ from collections import OrderedDict
 from string import whitespace
 
 from mo_future import unichr, is_text
-from mo_imports import export
+from mo_imports import export, expect
 
-from mo_parsing.core import add_reset_action
+from mo_parsing.core import ParserElement, parse_state, no_match
 from mo_parsing.enhancement import (
     Char,
     NotAny,
@@ -45,11 +45,14 @@ from mo_parsing.utils import (
     enlist,
     regex_compile,
     ParseException,
+    empty_tuple,
 )
 from mo_parsing.whitespaces import Whitespace, NO_WHITESPACE
 
 __all__ = ["Regex"]
 
+regex_expecting, regex_min_length = expect("regex_expecting", "regex_min_length")
+
 
 def hex_to_char(t):
     return Literal(unichr(int(t.value().lower().split("x")[1], 16)))
@@ -76,25 +79,12 @@ def to_bracket(tokens):
         return Char(acc)
 
 
-num_captures = 0
-
-
-def _reset():
-    global num_captures
-    num_captures = 0
-
-
-add_reset_action(_reset)
-
-
 def INC():
-    global num_captures
-    num_captures += 1
+    parse_state().num_captures += 1
 
 
 def DEC():
-    global num_captures
-    num_captures -= 1
+    parse_state().num_captures -= 1
 
 
 def name_token(tokens):
@@ -102,7 +92,7 @@ def name_token(tokens):
         n = tokens["name"]
         v = tokens["value"]
         if not n:
-            n = str(num_captures)
+            n = str(parse_state().num_captures)
         return Combine(v).set_token_name(n)
 
 
@@ -276,14 +266,36 @@ class Regex(ParseEnhancement):
         :param pattern:  THE REGEX PATTERN
         :param asGroupList: RETURN A LIST OF CAPTURED GROUPS /1, /2, /3, ...
         """
-        parsed = regex.parse_string(pattern)
-        ParseEnhancement.__init__(self, parsed.value().streamline())
+        if not pattern:
+            Log.error("Expecting a regex pattern")
+        ParseEnhancement.__init__(self, None)
         # WE ASSUME IT IS SAFE TO ASSIGN regex (NO SERIOUS BACKTRACKING PROBLEMS)
         self.streamlined = True
         self.regex = regex_compile(pattern)
 
+    @property
+    def expr(self):
+        """
+        THE PATTERN AS A GRAMMAR; ONLY MADE WHEN ASKED FOR, BECAUSE ONLY THE
+        regex IS NEEDED TO MATCH
+        """
+        expr = _expr_slot.__get__(self)
+        if expr is None:
+            expr = regex.parse_string(self.regex.pattern).value().streamline()
+            _expr_slot.__set__(self, expr)
+        return expr
+
+    @expr.setter
+    def expr(self, expr):
+        _expr_slot.__set__(self, expr)
+
+    @property
+    def whitespace(self):
+        return None
+
     def copy(self):
-        output = ParseEnhancement.copy(self)
+        output = ParserElement.copy(self)
+        _expr_slot.__set__(output, _expr_slot.__get__(self))
         output.regex = self.regex
         return output
 
@@ -341,6 +353,12 @@ class Regex(ParseEnhancement):
         else:
             raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        found = self.regex.match(string, start)
+        if found:
+            return ParseResults(self, start, found.end(), [found[0]], [])
+        return no_match(self, start)
+
     def streamline(self):
         # WE RUN THE DANGER OF MAKING PATHELOGICAL REGEX, SO WE DO NOT TRY
         if self.streamlined:
@@ -356,10 +374,14 @@ class Regex(ParseEnhancement):
         return output
 
     def expecting(self):
-        return OrderedDict((k, [self]) for k in self.expr.expecting().keys())
+        return OrderedDict((k, [self]) for k in regex_expecting(self.regex))
 
     def min_length(self):
-        return self.expr.min_length()
+        return regex_min_length(self.regex)
+
+    def check_recursion(self, seen=empty_tuple):
+        # THE expr ONLY DESCRIBES THE PATTERN
+        pass
 
     def __regex__(self):
         if self.regex:
@@ -369,6 +391,7 @@ class Regex(ParseEnhancement):
 
 
 _plain_group = Group(None)
+_expr_slot = ParseEnhancement.expr  # THE SLOT, UNDER THE Regex.expr PROPERTY
 
 export("mo_parsing.core", "regex_parameters", parameters)
 export("mo_parsing.tokens", Regex)
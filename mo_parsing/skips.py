@@ -0,0 +1,121 @@
+# encoding: utf-8
+"""
+CACHE OF Whitespace.skip() RESULTS, FOR EACH STRING AND Whitespace
+
+A BACKEND MAPS start TO THE END OF THE WHITESPACE; IT ONLY NEEDS get() AND
+__setitem__, SO A PLAIN dict IS THE "sparse" BACKEND
+
+THE BACKENDS ARE KEPT ON THE ParseState, LIKE THE memo TABLE, SO THEY, AND
+THE STRING, ARE DROPPED WHEN THE PARSE ENDS
+"""
+from array import array
+from bisect import bisect_right
+
+from mo_imports import expect
+
+from mo_parsing.utils import Log
+
+parse_state = expect("parse_state")
+
+PAGE_BITS = 10
+PAGE_SIZE = 1 << PAGE_BITS
+PAGE_MASK = PAGE_SIZE - 1
+EMPTY_PAGE = array("l", [-1]) * PAGE_SIZE
+
+
+class ArraySkips(object):
+    """
+    PAGES OF array("l"), ALLOCATED ONLY FOR THE POSITIONS TOUCHED
+    8 BYTES PER POSITION, AND NO int OBJECTS
+    """
+
+    __slots__ = ["pages"]
+
+    def __init__(self):
+        self.pages = {}
+
+    def get(self, start):
+        page = self.pages.get(start >> PAGE_BITS)
+        if page is None:
+            return None
+        end = page[start & PAGE_MASK]
+        if end == -1:
+            return None
+        return end
+
+    def __setitem__(self, start, end):
+        index = start >> PAGE_BITS
+        page = self.pages.get(index)
+        if page is None:
+            page = self.pages[index] = array("l", EMPTY_PAGE)
+        page[start & PAGE_MASK] = end
+
+
+class EagerSkips(object):
+    """
+    EVERY WHITESPACE RUN IN THE STRING, FOUND WITH ONE finditer() PASS
+    skip() BECOMES A bisect OVER THE RUN STARTS
+    """
+
+    __slots__ = ["starts", "ends", "exact", "others"]
+
+    def __init__(self, regex, string, exact):
+        """
+        :param regex: THE Whitespace REGEX
+        :param string: THE WHOLE STRING TO SCAN
+        :param exact: True IF A POSITION INSIDE A RUN ALSO SKIPS TO THE END OF THE RUN (NO ignore_list)
+        """
+        starts = self.starts = array("l")
+        ends = self.ends = array("l")
+        for found in regex.finditer(string):
+            start, end = found.span()
+            if start != end:
+                starts.append(start)
+                ends.append(end)
+        self.exact = exact
+        self.others = {}  # INSIDE A RUN, WHEN NOT exact
+
+    def get(self, start):
+        i = bisect_right(self.starts, start) - 1
+        if i < 0:
+            return start
+        end = self.ends[i]
+        if end <= start:
+            # NOT IN A RUN
+            return start
+        if self.exact or self.starts[i] == start:
+            return end
+        # INSIDE AN IGNORED EXPRESSION, LIKE A COMMENT
+        return self.others.get(start)
+
+    def __setitem__(self, start, end):
+        self.others[start] = end
+
+
+BACKENDS = {"sparse": dict, "array": ArraySkips}
+
+_backend = dict
+
+
+def set_skip_cache(backend="sparse"):
+    """
+    :param backend: "sparse" (A dict), "array" (PAGES OF array("l")), OR A CLASS WITH get() AND __setitem__
+    """
+    global _backend
+    _backend = BACKENDS.get(backend, backend)
+    if not callable(_backend):
+        Log.error("unknown skip cache backend {{backend}}", backend=backend)
+    clear_skip_cache()
+
+
+def new_skips():
+    return _backend()
+
+
+def clear_skip_cache():
+    """
+    FORGET THE SKIPS OF THE PARSE RUNNING ON THIS THREAD
+    """
+    state = parse_state()
+    state.content = None
+    state.skips = {}
@@ -0,0 +1,75 @@
+# encoding: utf-8
+"""
+KEEP A FINALIZED Parser ON DISK, SO A NEW PROCESS LOADS IT RATHER THAN
+BUILDING THE GRAMMAR AGAIN
+
+THE SNAPSHOT IS ONE LINE WITH THE KEY, THEN THE PICKLED Parser. THE KEY IS A
+HASH OF THE SOURCE OF THE factory's MODULE, THE SOURCE OF mo_parsing, THE
+PYTHON VERSION, AND THE Parser SETTINGS; ANY CHANGE BUILDS IT AGAIN
+"""
+import os
+import sys
+
+from mo_imports import export
+
+from mo_parsing.core import Parser
+from mo_parsing.memo import Memo
+from mo_parsing.utils import Log
+
+
+def load_or_build(cache_path, factory, memo, farthest):
+    """
+    SEE Parser.load_or_build()
+    """
+    # pickle AND hashlib ARE ONLY NEEDED HERE
+    import pickle
+
+    key = snapshot_key(factory, memo, farthest)
+    try:
+        with open(cache_path, "rb") as file:
+            if file.readline().rstrip(b"\n") == key:
+                return pickle.load(file)
+    except Exception:
+        pass  # MISSING OR UNREADABLE, SO BUILD IT
+
+    grammar = factory()
+    parser = grammar if isinstance(grammar, Parser) else Parser(grammar, memo=memo, farthest=farthest)
+    # THE REGEXES MADE ON FIRST USE ARE MADE NOW, TO BE IN THE SNAPSHOT
+    parser._scanner()
+    parser._regular()
+    parser._exact()
+
+    temp = f"{cache_path}.{os.getpid()}"
+    with open(temp, "wb") as file:
+        file.write(key + b"\n")
+        pickle.dump(parser, file, pickle.HIGHEST_PROTOCOL)
+    os.replace(temp, cache_path)  # OTHER PROCESSES NEVER SEE HALF A SNAPSHOT
+    return parser
+
+
+def snapshot_key(factory, memo, farthest):
+    """
+    :return: HEX DIGEST OF WHAT THE SNAPSHOT DEPENDS ON
+    """
+    import hashlib
+    import inspect
+
+    try:
+        source = inspect.getsource(sys.modules[factory.__module__])
+    except Exception as cause:
+        Log.error("can not find the source of {{name}}", name=factory.__qualname__, cause=cause)
+
+    memo = Memo.normalize(memo)
+    digest = hashlib.sha256()
+    digest.update(f"{sys.version}\n{factory.__module__}.{factory.__qualname__}\n".encode("utf8"))
+    digest.update(f"{memo and (memo.size, memo.window)}\n{farthest}\n".encode("utf8"))
+    digest.update(source.encode("utf8"))
+    package = os.path.dirname(__file__)
+    for name in sorted(os.listdir(package)):
+        if name.endswith(".py"):
+            with open(os.path.join(package, name), "rb") as file:
+                digest.update(file.read())
+    return digest.hexdigest().encode("ascii")
+
+
+export("mo_parsing.core", load_or_build)
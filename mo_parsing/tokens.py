@@ -4,7 +4,7 @@ from mo_future import is_text
 from mo_imports import export
 
 from mo_parsing import whitespaces
-from mo_parsing.core import ParserElement
+from mo_parsing.core import ParserElement, no_match
 from mo_parsing.exceptions import ParseException
 from mo_parsing.results import ParseResults
 from mo_parsing.utils import *
@@ -23,6 +23,7 @@ class Token(ParserElement):
 
     def __init__(self):
         ParserElement.__init__(self)
+        self.set_config(memoize=False)  # CHEAPER TO MATCH THAN TO LOOKUP
         self.streamlined = True
 
 
@@ -135,6 +136,12 @@ class Literal(Token):
             return ParseResults(self, start, end, [match], [])
         raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        match = self.parser_config.match
+        if string.startswith(match, start):
+            return ParseResults(self, start, start + len(match), [match], [])
+        return no_match(self, start)
+
     def expecting(self):
         return {self.parser_config.match.lower(): [self]}
 
@@ -167,6 +174,12 @@ class SingleCharLiteral(Literal):
 
         raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        match = self.parser_config.match
+        if string[start : start + 1] == match:
+            return ParseResults(self, start, start + 1, [match], [])
+        return no_match(self, start)
+
     def min_length(self):
         return 1
 
@@ -219,6 +232,14 @@ class Keyword(Token):
             )
         raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        found = self.parser_config.regex.match(string, start)
+        if found:
+            return ParseResults(
+                self, start, found.end(), [self.parser_config.match], []
+            )
+        return no_match(self, start)
+
     def expecting(self):
         return {self.parser_config.match.lower(): [self]}
 
@@ -274,6 +295,14 @@ class CaselessLiteral(Literal):
             )
         raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        found = self.parser_config.regex.match(string, start)
+        if found:
+            return ParseResults(
+                self, start, found.end(), [self.parser_config.match], []
+            )
+        return no_match(self, start)
+
     def reverse(self):
         return CaselessLiteral(self.parser_config.match[::-1])
 
@@ -404,6 +433,12 @@ class Word(Token):
         else:
             raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        found = self.regex.match(string, start)
+        if found:
+            return ParseResults(self, start, found.end(), [found.group()], [])
+        return no_match(self, start)
+
     def min_length(self):
         return self.parser_config.min
 
@@ -457,6 +492,12 @@ class Char(Token):
 
         raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        found = self.parser_config.regex.match(string, start)
+        if found:
+            return ParseResults(self, start, found.end(), [found.group()], [])
+        return no_match(self, start)
+
     def expecting(self):
         return {c: [self] for c in self.parser_config.include}
 
@@ -535,6 +576,12 @@ class CharsNotIn(Token):
 
         raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        found = self.parser_config.regex.match(string, start)
+        if found:
+            return ParseResults(self, start, found.end(), [found.group()], [])
+        return no_match(self, start)
+
     def min_length(self):
         return self.parser_config.min_len
 
@@ -729,6 +776,16 @@ class StringEnd(Token):
             return ParseResults(self, start, found.end(), [], [])
         raise ParseException(self, start, string)
 
+    def try_impl(self, string, start, do_actions=True):
+        end = len(string)
+        if start >= end:
+            return ParseResults(self, end, end, [], [])
+
+        found = self.parser_config.regex.match(string, start)
+        if found:
+            return ParseResults(self, start, found.end(), [], [])
+        return no_match(self, start)
+
     def min_length(self):
         return 0
 
@@ -1,20 +1,24 @@
 # encoding: utf-8
 from __future__ import absolute_import, division, unicode_literals
 
+import importlib
 import inspect
 import json
+import marshal
 import re
 import string
 import sys
 import warnings
 from collections import namedtuple
 from math import isnan
-from types import FunctionType
+from types import CellType, FunctionType
 
 from mo_dots import is_null, Null, is_many
 from mo_future import unichr, text, generator_types, get_function_name
 from mo_imports import expect
 
+from mo_parsing.lines import line_index
+
 ParseResults, ParseException, Many = expect("ParseResults", "ParseException", "Many")
 
 
@@ -274,8 +278,7 @@ def col(loc, string):
     methods to maintain a consistent view of the parsed string, the parse
     location, and line and column positions within the parsed string.
     """
-    s = string
-    return 1 if 0 < loc < len(s) and s[loc - 1] == "\n" else loc - s.rfind("\n", 0, loc)
+    return line_index(string).col(loc)
 
 
 def lineno(loc, string):
@@ -288,23 +291,19 @@ def lineno(loc, string):
     suggested methods to maintain a consistent view of the parsed string, the
     parse location, and line and column positions within the parsed string.
     """
-    return string.count("\n", 0, loc) + 1
+    return line_index(string).lineno(loc)
 
 
 def line(loc, string):
     """Returns the line of text containing loc within a string, counting newlines as line separators."""
-    lastCR = string.rfind("\n", 0, loc)
-    nextCR = string.find("\n", loc)
-    if nextCR >= 0:
-        return string[lastCR + 1 : nextCR]
-    else:
-        return string[lastCR + 1 :]
+    return line_index(string).line(loc)
 
 
 "decorator to trim function calls to match the arity of the target"
 
 
 def wrap_parse_action(func):
+    original = func
     if func in singleArgBuiltins:
         spec = inspect.getfullargspec(func)
     elif func.__class__.__name__ == "staticmethod":
@@ -360,10 +359,64 @@ def wrap_parse_action(func):
     except Exception:
         func_name = str(func)
     wrapper.__name__ = func_name
+    wrapper.action = original  # WHAT IS PICKLED, SEE ParserElement.__getstate__()
 
     return wrapper
 
 
+def portable(func):
+    """
+    :return: func, IF pickle CAN FIND IT BY ITS QUALIFIED NAME, OTHERWISE ITS
+    CODE (marshal), DEFAULTS AND CLOSURE, SO LAMBDAS CAN BE PICKLED TOO
+    """
+    if not isinstance(func, FunctionType):
+        return func
+    found = sys.modules.get(func.__module__)
+    for name in func.__qualname__.split("."):
+        found = getattr(found, name, None)
+    if found is func:
+        return func
+    return _Code(func)
+
+
+class _Code(object):
+    """
+    A FUNCTION THAT CAN NOT BE IMPORTED; ITS GLOBALS ARE THOSE OF ITS MODULE,
+    AND THE CODE ONLY LOADS ON THE SAME VERSION OF PYTHON
+    """
+
+    __slots__ = ["func"]
+
+    def __init__(self, func):
+        self.func = func
+
+    def __reduce__(self):
+        func = self.func
+        return (
+            _load_code,
+            (
+                marshal.dumps(func.__code__),
+                func.__module__,
+                func.__name__,
+                tuple(portable(d) for d in func.__defaults__ or ()),
+                func.__kwdefaults__,
+                tuple(portable(c.cell_contents) for c in func.__closure__ or ()),
+            ),
+        )
+
+
+def _load_code(code, module, name, defaults, kwdefaults, closure):
+    func = FunctionType(
+        marshal.loads(code),
+        importlib.import_module(module).__dict__,
+        name,
+        defaults or None,
+        tuple(CellType(c) for c in closure) or None,
+    )
+    func.__kwdefaults__ = kwdefaults
+    return func
+
+
 def _xml_escape(data):
     """Escape &, <, >, ", ', etc. in a string of data."""
 
@@ -0,0 +1,751 @@
+# encoding: utf-8
+"""
+LOWER A Parser TO INSTRUCTIONS FOR A BACKTRACKING STACK MACHINE (LIKE LPeg)
+
+EACH ParserElement IS A ROUTINE: TESTS FOR CHARACTERS AND REGEXES, CHOICE
+AND COMMIT FOR ALTERNATIVES, CALL AND RETURN FOR SUB-EXPRESSIONS, AND
+CLOSE INSTRUCTIONS THAT CAPTURE THE ParseResults. THE MACHINE RUNS IN ONE
+LOOP, WITH ITS OWN STACK, SO NESTING DEPTH IS NOT LIMITED BY THE PYTHON
+RECURSION LIMIT
+
+A FAILURE POPS THE STACK TO THE LAST CHOICE; WHEN THERE IS NONE, THE
+INPUT IS PARSED AGAIN BY THE Parser, WITHOUT THE PARSE ACTIONS, TO MAKE
+THE SAME ParseException
+"""
+from mo_dots import is_null
+from mo_imports import export
+
+from mo_parsing.codegen import STRING_END, run_actions
+from mo_parsing.collapse import Collapsed
+from mo_parsing.core import ParseState, _reachable_forwards, _reset, _state
+from mo_parsing.enhancement import (
+    Combine,
+    Forward,
+    LookAhead,
+    LookBehind,
+    Many,
+    NotAny,
+    OneOrMore,
+    Optional,
+    ParseEnhancement,
+    ZeroOrMore,
+    _suppress_post_parse,
+)
+from mo_parsing.exceptions import ParseException
+from mo_parsing.expressions import And, Fast, MatchFirst, Or
+from mo_parsing.memo import FAILED, copy_result
+from mo_parsing.regex import Regex
+from mo_parsing.results import Annotation, ForwardResults, ParseResults
+from mo_parsing.tokens import (
+    CaselessKeyword,
+    CaselessLiteral,
+    Char,
+    CharsNotIn,
+    Empty,
+    Keyword,
+    Literal,
+    SingleCharLiteral,
+    StringEnd,
+    Word,
+)
+
+# OPCODES, IN THE ORDER THEY ARE TESTED
+CALL = 0  # a=ROUTINE
+RET = 1
+CHOICE = 2  # a=ALTERNATIVE
+COMMIT = 3  # a=TARGET
+REGEX = 4  # a=ELEMENT, b=REGEX MATCH
+LITERAL = 5  # a=ELEMENT, b=STRING
+CHAR = 6  # a=ELEMENT, b=CHARACTER
+TOKEN = 7  # a=ELEMENT, b=REGEX MATCH, c=TOKEN
+OPEN = 8
+AND_SKIP = 9  # a=WHITESPACE MATCH
+AND_APPEND = 10
+AND_KEEP = 11
+AND_CLOSE = 12  # a=ELEMENT
+WRAP = 13  # a=ELEMENT
+FORWARD = 14  # a=ELEMENT
+MANY_TEST = 15  # a=WHITESPACE MATCH, b=STOPPER MATCH, c=EXIT
+MANY_APPEND = 16  # a=MAXIMUM, b=LOOP, c=EXIT
+MANY_CLOSE = 17  # a=ELEMENT, b=MINIMUM
+FIRST = 18  # a=REGEX MATCH, b=TABLE, c=NEXT ALTERNATIVE
+FIRST_NEXT = 19  # a=NEXT ALTERNATIVE
+FIRST_DONE = 20  # a=TARGET
+ACTIONS = 21  # a=PARSE ACTIONS
+DEFAULT = 22  # a=ELEMENT, b=DEFAULT VALUE
+SUPPRESS = 23  # a=ELEMENT
+JUMP = 24  # a=TARGET
+FAIL = 25
+COLLAPSED = 26  # a=ELEMENT, b=REGEX MATCH
+EMPTY = 27  # a=ELEMENT
+END = 28  # a=ELEMENT, b=REGEX MATCH
+NOT = 29  # a=ELEMENT, b=REGEX MATCH
+BEHIND = 30
+COMBINE = 31  # a=ELEMENT, b=SEPARATOR
+LOOK = 32  # a=ELEMENT
+LONGEST = 33
+LONGEST_FAST = 34  # a=REGEX MATCH, b=TABLE, c=NEXT ALTERNATIVE
+LONGEST_NEXT = 35  # a=NEXT ALTERNATIVE
+LONGEST_MATCH = 36
+LONGEST_CLOSE = 37  # a=ELEMENT
+ELEMENT = 38  # a=ELEMENT
+MEMO = 39  # a=ELEMENT
+MEMO_STORE = 40
+HALT = 41
+
+NAMES = {v: k for k, v in list(globals().items()) if k.isupper() and isinstance(v, int)}
+
+# FRAME FIELDS
+START, ACC, LAST, INDEX, COUNT = range(5)
+
+
+class Program(object):
+    """
+    SAME AS THE Parser IT WAS MADE FROM, BUT WITHOUT RECURSION
+    """
+
+    __slots__ = ["parser", "code", "forwards"]
+
+    def __init__(self, parser):
+        self.parser = parser
+        self._build()
+
+    def _build(self):
+        self.forwards = _reachable_forwards(self.parser.original)
+        self.code = _Assembler(self.parser.memo is not None).assemble(self.parser.element)
+
+    def parse(self, string, parse_all=False):
+        """
+        :param string: THE STRING TO PARSE
+        :param parse_all: TRUE IF THE WHOLE STRING MUST MATCH
+        :return: SAME AS Parser.parse()
+
+        A FAILURE IS EXPLAINED LIKE CompiledParser.parse() DOES: BY THE Parser,
+        WITH do_actions=False, SO NO PARSE ACTION RUNS TWICE, UNLESS A PARSE
+        ACTION (OR CONDITION) MADE THE FAILURE
+        """
+        if any(f.expr is not e for f, e in self.forwards):
+            # A Forward WAS ASSIGNED SINCE THE PROGRAM WAS MADE
+            self.parser._check_forwards()
+            self._build()
+        parser = self.parser
+        _reset()
+        with ParseState(parser.memo):
+            start = parser.whitespace.skip(string, 0)
+            tokens, farthest = run(self.code, string, start, _state.current.memo)
+            if tokens is not None and parse_all:
+                end = parser.whitespace.skip(string, tokens.end)
+                if end < len(string) and not STRING_END.match(string, end):
+                    farthest = max(farthest, end)
+                    tokens = None
+        if tokens is None:
+            # THE Parser MAKES THE SAME ParseException
+            try:
+                failure = parser._explain(string, parse_all)
+                if failure is None:
+                    return parser.parse(string, parse_all)
+            except RecursionError:
+                raise ParseException(parser.element, farthest, string, "too deep to explain") from None
+            raise failure
+        if parser.named:
+            return tokens
+        return tokens.tokens[0]
+
+    parse_string = parse
+
+    def __str__(self):
+        """
+        :return: ONE LINE PER INSTRUCTION
+        """
+        lines = []
+        for pc, (op, a, b, c) in enumerate(self.code):
+            args = ", ".join(_show(v) for v in (a, b, c) if v is not None)
+            lines.append(f"{pc:5} {NAMES[op]} {args}".rstrip())
+        return "\n".join(lines)
+
+
+def assemble(parser):
+    """
+    :return: Program FOR THE GIVEN Parser
+    """
+    return Program(parser)
+
+
+def _show(value):
+    if isinstance(value, (str, int)):
+        return repr(value)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k!r}: {list(v)}" for k, v in value.items()) + "}"
+    pattern = getattr(getattr(value, "__self__", None), "pattern", None)
+    if pattern is not None:
+        return f"/{pattern}/"
+    text = str(value)
+    if len(text) > 40:
+        return text[:37] + "..."
+    return text
+
+
+def run(code, string, pos, table=None):
+    """
+    RUN THE MACHINE
+    :param table: THE MemoTable, IF THE code HAS MEMO INSTRUCTIONS
+    :return: (ParseResults OR None, FARTHEST FAILED POSITION)
+    """
+    length = len(string)
+    stack = []  # RETURN ADDRESSES (int), CHOICES (pc, pos, len(frames)), AND MEMO MISSES [key, pos]
+    frames = []  # ONE FOR EACH OPEN ELEMENT, THAT COLLECTS ITS TOKENS
+    farthest = pos
+    r = None
+    pc = 0
+    while True:
+        op, a, b, c = code[pc]
+        if op == CALL:
+            stack.append(pc + 1)
+            pc = a
+            continue
+        elif op == RET:
+            pc = stack.pop()
+            continue
+        elif op == CHOICE:
+            stack.append((a, pos, len(frames)))
+            pc += 1
+            continue
+        elif op == COMMIT:
+            stack.pop()
+            pc = a
+            continue
+        elif op == REGEX:
+            found = b(string, pos)
+            if found:
+                r = ParseResults(a, pos, found.end(), [found.group()], [])
+                pc += 1
+                continue
+        elif op == LITERAL:
+            if string.startswith(b, pos):
+                r = ParseResults(a, pos, pos + len(b), [b], [])
+                pc += 1
+                continue
+        elif op == CHAR:
+            if string[pos : pos + 1] == b:
+                r = ParseResults(a, pos, pos + 1, [b], [])
+                pc += 1
+                continue
+        elif op == TOKEN:
+            found = b(string, pos)
+            if found:
+                r = ParseResults(a, pos, found.end(), [c], [])
+                pc += 1
+                continue
+        elif op == OPEN:
+            frames.append([pos, [], pos, pos, 0])
+            pc += 1
+            continue
+        elif op == AND_SKIP:
+            f = frames[-1]
+            last = f[LAST]
+            if last > f[INDEX]:
+                if a:
+                    found = a(string, last)
+                    f[INDEX] = found.end() if found else last
+                else:
+                    f[INDEX] = last
+            pos = f[INDEX]
+            pc += 1
+            continue
+        elif op == AND_APPEND:
+            f = frames[-1]
+            f[ACC].append(r)
+            f[LAST] = r.end
+            pc += 1
+            continue
+        elif op == AND_KEEP:
+            f = frames[-1]
+            if f[INDEX] != r.end or not isinstance(r.type, Many) or r.type.parser_config.min_match or r:
+                f[ACC].append(r)
+                f[LAST] = r.end
+            # OTHERWISE, AN EMPTY ZeroOrMore IS DROPPED
+            pc += 1
+            continue
+        elif op == AND_CLOSE:
+            f = frames.pop()
+            r = ParseResults(a, f[START], f[LAST], f[ACC], [])
+            pc += 1
+            continue
+        elif op == WRAP:
+            r = ParseResults(a, r.start, r.end, [r], [])
+            pc += 1
+            continue
+        elif op == FORWARD:
+            r = ForwardResults(a, r.start, r.end, [r], [])
+            pc += 1
+            continue
+        elif op == MANY_TEST:
+            f = frames[-1]
+            last = f[LAST]
+            if last < length:
+                if a:
+                    found = a(string, last)
+                    pos = found.end() if found else last
+                else:
+                    pos = last
+                if not b or not b(string, pos):
+                    pc += 1
+                    continue
+            pc = c
+            continue
+        elif op == MANY_APPEND:
+            f = frames[-1]
+            f[LAST] = r.end
+            if r.end - r.start:
+                f[ACC].append(r)
+                f[COUNT] += 1
+                if f[COUNT] >= a:
+                    pc = c
+                    continue
+            pc = b
+            continue
+        elif op == MANY_CLOSE:
+            f = frames[-1]
+            if f[COUNT] >= b:
+                frames.pop()
+                acc = f[ACC]
+                if acc:
+                    r = ParseResults(a, acc[0].start, acc[-1].end, acc, [])
+                else:
+                    r = ParseResults(a, f[START], f[LAST], acc, [])
+                pc += 1
+                continue
+        elif op == FIRST:
+            found = a(string, pos)
+            routines = found and b.get(found.group(0).lower())
+            if routines:
+                frames.append([iter(routines)])
+                pc += 1
+            else:
+                pc = c
+            continue
+        elif op == FIRST_NEXT:
+            routine = next(frames[-1][0], None)
+            if routine is None:
+                frames.pop()
+                pc = a
+            else:
+                stack.append((pc, pos, len(frames)))
+                stack.append(pc + 1)
+                pc = routine
+            continue
+        elif op == FIRST_DONE:
+            stack.pop()
+            frames.pop()
+            pc = a
+            continue
+        elif op == ACTIONS:
+            r = run_actions(r, string, a)
+            if r is not None:
+                pc += 1
+                continue
+        elif op == DEFAULT:
+            r = ParseResults(a, pos, pos, b, [])
+            pc += 1
+            continue
+        elif op == SUPPRESS:
+            r = ParseResults(a, r.start, r.end, [], [])
+            pc += 1
+            continue
+        elif op == JUMP:
+            pc = a
+            continue
+        elif op == FAIL:
+            pass
+        elif op == COLLAPSED:
+            found = b(string, pos)
+            if found:
+                r = ParseResults(a, pos, found.end(), a._tokens(found), [])
+                pc += 1
+                continue
+        elif op == EMPTY:
+            r = ParseResults(a, pos, pos, [], [])
+            pc += 1
+            continue
+        elif op == END:
+            if pos >= length:
+                r = ParseResults(a, length, length, [], [])
+                pc += 1
+                continue
+            found = b(string, pos)
+            if found:
+                r = ParseResults(a, pos, found.end(), [], [])
+                pc += 1
+                continue
+        elif op == NOT:
+            if b(string, pos):
+                r = ParseResults(a, pos, pos, [], [])
+                pc += 1
+                continue
+        elif op == BEHIND:
+            f = frames[-1]
+            if f[LAST] > f[INDEX]:
+                f[INDEX] = f[LAST]
+            pos = f[INDEX]
+            pc += 1
+            continue
+        elif op == COMBINE:
+            f = frames.pop()
+            r = ParseResults(a, f[START], r.end, [r.as_string(sep=b)], [])
+            pc += 1
+            continue
+        elif op == LOOK:
+            f = frames.pop()
+            r.__class__ = Annotation
+            r = ParseResults(a, f[START], f[START], [r], [])
+            pc += 1
+            continue
+        elif op == LONGEST:
+            frames[-1][ACC].append(r)
+            # BACKTRACK, TO TRY THE NEXT ALTERNATIVE
+        elif op == LONGEST_FAST:
+            found = a(string, pos)
+            routines = found and b.get(found.group(0).lower())
+            if routines:
+                frames.append([iter(routines)])
+                pc += 1
+            else:
+                pc = c
+            continue
+        elif op == LONGEST_NEXT:
+            routine = next(frames[-1][0], None)
+            if routine is None:
+                frames.pop()
+                pc = a
+            else:
+                stack.append((pc, pos, len(frames)))
+                stack.append(pc + 1)
+                pc = routine
+            continue
+        elif op == LONGEST_MATCH:
+            frames[-2][ACC].append(r)
+            # BACKTRACK, TO TRY THE NEXT CANDIDATE
+        elif op == LONGEST_CLOSE:
+            matches = frames.pop()[ACC]
+            if matches:
+                # THE TRIALS RAN THE PARSE ACTIONS, SO THE LONGEST TRIAL IS THE RESULT
+                # max() KEEPS THE FIRST OF EQUAL LENGTH, SO THE FIRST LISTED WINS A TIE
+                r = max(matches, key=_end)
+                r = ParseResults(a, r.start, r.end, [r], [])
+                pc += 1
+                continue
+        elif op == ELEMENT:
+            try:
+                r = a._parse(string, pos)
+                pc += 1
+                continue
+            except ParseException:
+                pass
+        elif op == MEMO:
+            key = (id(a), pos, True)
+            found = table.get(key)
+            if found is None:
+                stack.append([key, pos])
+                pc += 1
+                continue
+            if found is not FAILED and not isinstance(found, ParseException):
+                r = copy_result(found)
+                pc = stack.pop()
+                continue
+        elif op == MEMO_STORE:
+            key, start = stack.pop()
+            table.add(key, start, copy_result(r))
+            pc += 1
+            continue
+        elif op == HALT:
+            return r, farthest
+
+        # FAILURE: BACKTRACK TO THE LAST CHOICE
+        if pos > farthest:
+            farthest = pos
+        while stack:
+            entry = stack.pop()
+            if entry.__class__ is tuple:
+                pc, pos, depth = entry
+                del frames[depth:]
+                break
+            elif entry.__class__ is list:
+                table.add(entry[0], entry[1], FAILED)
+        else:
+            return None, farthest
+
+
+class _Assembler(object):
+    __slots__ = ["memo", "code", "routines", "todo", "fixes"]
+
+    def __init__(self, memo):
+        """
+        :param memo: True IF THE Parser HAS A PACKRAT MEMO
+        """
+        self.memo = memo
+        self.code = []
+        self.routines = {}  # MAP FROM id(element) TO ITS ADDRESS
+        self.todo = []  # (element, [INSTRUCTIONS WAITING FOR ITS ADDRESS])
+        self.fixes = {}  # MAP FROM id(element) TO INSTRUCTIONS WAITING FOR ITS ADDRESS
+
+    def assemble(self, root):
+        """
+        :return: THE INSTRUCTIONS; THE FIRST CALLS THE root ROUTINE
+        """
+        self.call(root)
+        self.emit(HALT)
+        while self.todo:
+            element = self.todo.pop()
+            self.routines[id(element)] = len(self.code)
+            self.routine(element)
+        for key, waiting in self.fixes.items():
+            address = self.routines[key]
+            for patch in waiting:
+                patch(address)
+        return [tuple(i) for i in self.code]
+
+    def emit(self, op, a=None, b=None, c=None):
+        self.code.append([op, a, b, c])
+        return self.code[-1]
+
+    def here(self):
+        return len(self.code)
+
+    def address(self, element, patch):
+        """
+        CALL patch(ADDRESS) WITH THE ADDRESS OF THE ROUTINE FOR element
+        """
+        key = id(element)
+        waiting = self.fixes.get(key)
+        if waiting is None:
+            waiting = self.fixes[key] = []
+            self.todo.append(element)
+        waiting.append(patch)
+
+    def call(self, element):
+        instruction = self.emit(CALL)
+        self.address(element, lambda a: instruction.__setitem__(1, a))
+
+    def table(self, fast):
+        """
+        :return: MAP FROM KEY TO TUPLE OF ROUTINE ADDRESSES (FILLED IN LATER)
+        """
+        table = {}
+        for key, elements in fast.lookup.items():
+            addresses = table[key] = [None] * len(elements)
+            for i, element in enumerate(elements):
+                self.address(element, lambda a, addresses=addresses, i=i: addresses.__setitem__(i, a))
+        return table
+
+    def inline(self, element):
+        """
+        EMIT CODE THAT SETS r TO THE RESULT OF element
+        """
+        if self.memo and element.parser_config.memoize:
+            # THE ROUTINE CHECKS THE MEMO
+            self.call(element)
+        elif not self.leaf(element):
+            self.call(element)
+
+    def leaf(self, element):
+        """
+        EMIT THE INSTRUCTION FOR A LEAF, AND ITS PARSE ACTIONS
+        :return: None IF element IS NOT A LEAF, ELEMENT IF element IS NOT TRANSLATED
+        """
+        config = element.parser_config
+        clazz = element.__class__
+        if (
+            config.fail_action
+            or (self.memo and config.memoize is None)
+            or (clazz is Forward and (config.left_recursion or is_null(element.expr)))
+        ):
+            # NO TRANSLATION; ELEMENT RUNS THE PARSE ACTIONS (AND TURNS OFF THE MEMO INSIDE)
+            self.emit(ELEMENT, element)
+            return ELEMENT
+        elif clazz is Literal:
+            self.emit(LITERAL, element, config.match)
+        elif clazz is SingleCharLiteral:
+            self.emit(CHAR, element, config.match)
+        elif clazz in (Keyword, CaselessKeyword, CaselessLiteral):
+            self.emit(TOKEN, element, config.regex.match, config.match)
+        elif clazz in (Word, Regex):
+            self.emit(REGEX, element, element.regex.match)
+        elif clazz in (Char, CharsNotIn):
+            self.emit(REGEX, element, config.regex.match)
+        elif clazz is Collapsed:
+            self.emit(COLLAPSED, element, element.regex.match)
+        elif clazz is Empty:
+            self.emit(EMPTY, element)
+        elif clazz is StringEnd:
+            self.emit(END, element, config.regex.match)
+        elif clazz is NotAny and element.regex:
+            self.emit(NOT, element, element.regex.match)
+        elif clazz in _COMPOSITE or (
+            isinstance(element, ParseEnhancement) and clazz.parse_impl is ParseEnhancement.parse_impl
+        ):
+            return None
+        else:
+            self.emit(ELEMENT, element)
+            return ELEMENT
+        self.actions(element)
+        return clazz
+
+    def actions(self, element):
+        if element.parse_action:
+            self.emit(ACTIONS, element.parse_action)
+
+    def routine(self, element):
+        """
+        EMIT THE ROUTINE FOR element: CODE THAT SETS r, THEN RETURNS
+        """
+        config = element.parser_config
+        memo = None
+        if self.memo and config.memoize:
+            memo = self.emit(MEMO, element)
+        kind = self.leaf(element)
+        if kind:
+            if kind == ELEMENT and memo:
+                # _parse() USES THE MEMO
+                del self.code[-2]
+            else:
+                self.remember(memo)
+            self.emit(RET)
+            return
+        clazz = element.__class__
+        if clazz is And:
+            self.sequence(element)
+        elif clazz is MatchFirst:
+            self.first(element)
+        elif clazz is Or:
+            self.longest(element)
+        elif clazz in (Many, OneOrMore, ZeroOrMore):
+            self.many(element)
+        elif clazz is Optional:
+            choice = self.emit(CHOICE)
+            self.inline(element.expr)
+            commit = self.emit(COMMIT)
+            choice[1] = self.here()
+            self.emit(DEFAULT, element, config.default_value)
+            jump = self.emit(JUMP)
+            commit[1] = self.here()
+            self.emit(WRAP, element)
+            jump[1] = self.here()
+        elif clazz is Forward:
+            self.inline(element.expr)
+            self.emit(FORWARD, element)
+        elif clazz is Combine:
+            self.emit(OPEN)
+            self.inline(element.expr)
+            self.emit(COMBINE, element, config.separator)
+        elif clazz is LookAhead:
+            self.emit(OPEN)
+            self.inline(element.expr)
+            self.emit(LOOK, element)
+        else:
+            # Group, Dict, Suppress, AND OTHER CONVERTERS THAT ONLY HAVE PARSE ACTIONS
+            self.inline(element.expr)
+            if element.parse_action == [_suppress_post_parse]:
+                self.emit(SUPPRESS, element)
+                self.remember(memo)
+                self.emit(RET)
+                return
+            self.emit(WRAP, element)
+        self.actions(element)
+        self.remember(memo)
+        self.emit(RET)
+
+    def remember(self, memo):
+        if memo:
+            self.emit(MEMO_STORE)
+
+    def sequence(self, element):
+        """
+        SAME AS And.try_impl()
+        """
+        whitespace = _skipper(element.parser_config.whitespace)
+        self.emit(OPEN)
+        for i, expr in enumerate(element.exprs):
+            if isinstance(expr, And.SyntaxErrorGuard):
+                continue
+            if i:
+                if isinstance(expr, LookBehind):
+                    self.emit(BEHIND)
+                else:
+                    self.emit(AND_SKIP, whitespace)
+            self.inline(expr)
+            self.emit(AND_APPEND if expr.min_length() else AND_KEEP)
+        self.emit(AND_CLOSE, element)
+
+    def first(self, element):
+        """
+        SAME AS MatchFirst.try_impl(), WITH THE Fast LOOKUP
+        """
+        commits = []
+        for alternative in element.alternate:
+            if alternative.__class__ is Fast:
+                test = self.emit(FIRST, alternative.regex.match, self.table(alternative))
+                next_ = self.emit(FIRST_NEXT)
+                commits.append(self.emit(FIRST_DONE))
+                test[3] = next_[1] = self.here()
+            else:
+                choice = self.emit(CHOICE)
+                self.inline(alternative)
+                commits.append(self.emit(COMMIT))
+                choice[1] = self.here()
+        self.emit(FAIL)
+        for commit in commits:
+            commit[1] = self.here()
+        self.emit(WRAP, element)
+
+    def longest(self, element):
+        """
+        SAME AS Or.parse_impl(): TRY EVERY ALTERNATIVE, AND KEEP THE LONGEST RESULT
+        """
+        self.emit(OPEN)
+        for alternative in element.alternate:
+            if alternative.__class__ is Fast:
+                test = self.emit(LONGEST_FAST, alternative.regex.match, self.table(alternative))
+                next_ = self.emit(LONGEST_NEXT)
+                self.emit(LONGEST_MATCH)
+                test[3] = next_[1] = self.here()
+            else:
+                choice = self.emit(CHOICE)
+                self.call(alternative)
+                self.emit(LONGEST)
+                choice[1] = self.here()
+        self.emit(LONGEST_CLOSE, element)
+
+    def many(self, element):
+        """
+        SAME AS Many.try_impl()
+        """
+        config = element.parser_config
+        stopper = config.end.match if config.end else None
+        self.emit(OPEN)
+        loop = self.here()
+        test = self.emit(MANY_TEST, _skipper(config.whitespace), stopper)
+        choice = self.emit(CHOICE)
+        self.inline(element.expr)
+        self.emit(COMMIT, self.here() + 1)
+        append = self.emit(MANY_APPEND, config.max_match, loop)
+        test[3] = append[3] = choice[1] = self.here()
+        self.emit(MANY_CLOSE, element, config.min_match)
+
+
+_COMPOSITE = (And, MatchFirst, Or, Many, OneOrMore, ZeroOrMore, Optional, Forward, Combine, LookAhead)
+
+
+def _end(result):
+    return result.end
+
+
+def _skipper(whitespace):
+    """
+    :return: THE REGEX MATCH FOR whitespace, OR None IF IT SKIPS NOTHING
+    """
+    if not whitespace.white_chars and not whitespace.ignore_list:
+        return None
+    return whitespace.regex.match
+
+
+export("mo_parsing.core", assemble)
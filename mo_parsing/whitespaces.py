@@ -1,20 +1,51 @@
 # encoding: utf-8
 import re
 from collections import namedtuple
+from threading import local, current_thread, main_thread
 
 from mo_future import is_text
 from mo_imports import expect, Expecting
 
-from mo_parsing.core import ParserElement
+from mo_parsing.core import ParserElement, parse_state
 from mo_parsing.results import ParseResults
+from mo_parsing.skips import new_skips, clear_skip_cache, EagerSkips
 from mo_parsing.utils import Log, indent, quote, regex_range, alphanums, regex_iso
 
 Literal, Token, Empty = expect("Literal", "Token", "Empty")
 
-CURRENT = None  # THE CURRENT DEFINED WHITESPACE
 NO_WHITESPACE = None  # NOTHING IS WHITESPACE ENGINE
 STANDARD_WHITESPACE = None  # SIMPLE WHITESPACE
-whitespace_stack = []
+_main_current = None  # THE CURRENT OF THE MAIN THREAD
+
+
+class _Context(local):
+    """
+    THE Whitespace CONTEXT STACK, ONE PER THREAD, SO THREADS THAT BUILD OR
+    FINALIZE A GRAMMAR AT THE SAME TIME DO NOT RELEASE EACH OTHER'S CONTEXT
+    A NEW THREAD STARTS IN THE CONTEXT THE MAIN THREAD IS IN
+    """
+
+    def __init__(self):
+        self.main = current_thread() is main_thread()
+        self.current = _main_current
+        self.stack = []  # (Whitespace ENTERED, CURRENT BEFORE IT)
+
+    def set(self, current):
+        global _main_current
+
+        self.current = current
+        if self.main:
+            _main_current = current
+
+
+_context = _Context()
+
+
+def __getattr__(name):
+    if name == "CURRENT":
+        # THE CURRENT DEFINED WHITESPACE, OF THIS THREAD
+        return _context.current
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Whitespace(ParserElement):
@@ -25,12 +56,10 @@ class Whitespace(ParserElement):
         self.ignore_list = []
         self.debug_actions = DebugActions(noop, noop, noop)
         self.all_exceptions = {}
-        self.content = None
-        self.skips = {}
         self.regex = None
         self.expr = None
         self.parent = None
-        self.copies = []
+        self.eager = False
         self._in_regex = False
         self.set_whitespace(white)
 
@@ -42,20 +71,23 @@ class Whitespace(ParserElement):
         output.ignore_list = list(self.ignore_list)
         output.debug_actions = self.debug_actions
         output.all_exceptions = self.all_exceptions
-        output.content = None
-        output.skips = {}
         output.regex = self.regex
         output.expr = self.expr
+        output.eager = self.eager
         output.parent = self
-        output.copies = []
         return output
 
-    def __enter__(self):
-        global CURRENT
+    def __getstate__(self):
+        # THE with BLOCKS THIS Whitespace WAS USED IN DO NOT TRAVEL
+        state = ParserElement.__getstate__(self)
+        state["parent"] = None
+        return state
 
-        whitespace_stack.append(CURRENT)
-        CURRENT = new_whitespace = self.copy()
-        self.copies.append(new_whitespace)
+    def __enter__(self):
+        context = _context
+        context.stack.append((self, context.current))
+        new_whitespace = self.copy()
+        context.set(new_whitespace)
         return new_whitespace
 
     use = __enter__
@@ -64,10 +96,9 @@ class Whitespace(ParserElement):
         """
         REMOVE THIS WHITESPACE CONTEXT
         """
-        global CURRENT
-        if self.copies and self.copies[-1] is CURRENT:
-            self.copies.pop()
-            CURRENT = whitespace_stack.pop()
+        context = _context
+        if context.stack and context.stack[-1][0] is self:
+            context.set(context.stack.pop()[1])
             return
 
         if self.parent:
@@ -96,6 +127,15 @@ class Whitespace(ParserElement):
         es = self.all_exceptions.setdefault(loc, [])
         es.append(exc)
 
+    def set_eager(self, eager=True):
+        """
+        FIND ALL THE WHITESPACE IN A STRING WITH ONE REGEX PASS, THE FIRST TIME
+        IT IS NEEDED, RATHER THAN MATCHING ONE POSITION AT A TIME
+        FASTER WHEN MOST OF THE STRING IS PARSED; SLOWER IF ONLY THE START IS
+        """
+        self.eager = eager
+        return self
+
     def set_literal(self, literal):
         self.id = id(self)
         self.literal = literal
@@ -105,9 +145,9 @@ class Whitespace(ParserElement):
         self.keyword_chars = "".join(sorted(set(chars)))
 
     def set_whitespace(self, chars):
+        clear_skip_cache()
         self.id = id(self)
         self.white_chars = "".join(sorted(set(chars)))
-        self.content = None
         self.expr = None if isinstance(Empty, Expecting) else Empty()
         self.regex = re.compile(self.__regex__()[1], re.DOTALL)
 
@@ -116,11 +156,11 @@ class Whitespace(ParserElement):
         ADD TO THE LIST OF IGNORED EXPRESSIONS
         :param ignore_expr:
         """
+        clear_skip_cache()
         self.id = id(self)
         for ignore_expr in ignore_exprs:
             ignore_expr = ignore_expr.suppress()
             self.ignore_list.append(ignore_expr)
-            self.content = None
             self.expr = None if isinstance(Empty, Expecting) else Empty()
             self.regex = re.compile(self.__regex__()[1], re.DOTALL)
             return self
@@ -140,25 +180,32 @@ class Whitespace(ParserElement):
         """
         if not self.ignore_list and not self.white_chars:
             return start
-        if string is self.content:
-            try:
-                end = self.skips[start]
-                if end != -1:
-                    return end
-            except IndexError:
-                return start
-        else:
-            num = len(string)
-            self.skips = [-1] * num
-            self.content = string
-            if start >= num:
-                return start
+        state = parse_state()
+        if string is not state.content:
+            if state.previous is None:
+                # NO PARSE IS RUNNING, AND THE IDLE ParseState WOULD KEEP THE string
+                found = start < len(string) and self.regex.match(string, start)
+                return found.end() if found else start
+            state.content = string
+            state.skips = {}
+        skips = state.skips.get(self)
+        if skips is None:
+            if self.eager:
+                skips = EagerSkips(self.regex, string, not self.ignore_list)
+            else:
+                skips = new_skips()
+            state.skips[self] = skips
+        end = skips.get(start)
+        if end is not None:
+            return end
+        if start >= len(string):
+            return start
 
         end = start  # TO AVOID RECURSIVE LOOP
         found = self.regex.match(string, start)
         if found:
             end = found.end()
-        self.skips[start] = end  # THE REAL VALUE
+        skips[start] = end  # THE REAL VALUE
         return end
 
     def __regex__(self):
@@ -189,16 +236,23 @@ class Whitespace(ParserElement):
 
 class Backup(object):
     def __init__(self, whitespace):
+        state = parse_state()
         self.whitespace = whitespace
-        self.content = whitespace.content
-        self.skips = whitespace.skips
+        self.content = state.content
+        self.table = state.skips
+        self.skips = state.skips.get(whitespace)
 
     def __enter__(self):
         pass
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.whitespace.content = self.content
-        self.whitespace.skips = self.skips
+        state = parse_state()
+        state.content = self.content
+        state.skips = self.table
+        if self.skips is None:
+            self.table.pop(self.whitespace, None)
+        else:
+            self.table[self.whitespace] = self.skips
 
 
 def noop(*args):
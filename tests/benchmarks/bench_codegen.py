@@ -0,0 +1,52 @@
+# encoding: utf-8
+"""
+PARSE TIME OF THE INTERPRETED Parser, AND OF THE SAME GRAMMAR COMPILED
+TO PYTHON SOURCE WITH Parser.compile()
+"""
+from time import perf_counter
+
+from mo_parsing.core import Parser
+from mo_parsing.whitespaces import Whitespace
+
+from bench_collapse import arithmetic
+from grammars import json_documents, timed
+
+
+def examples():
+    with Whitespace():
+        from examples import jsonParser, fourFn
+        from examples.bigquery_view_parser import BigQueryViewParser
+
+    statements = [sql.strip() for sql, _ in BigQueryViewParser.TEST_CASES]
+    return [
+        ("jsonParser", jsonParser.jsonObject, json_documents(30)),
+        ("fourFn", fourFn.bnf, arithmetic(200)),
+        ("bigquery_view_parser", BigQueryViewParser._get_parser(), statements),
+    ]
+
+
+def run(name, element, inputs):
+    parser = Parser(element)
+    start = perf_counter()
+    compiled = parser.compile()
+    build = perf_counter() - start
+
+    for s in inputs:
+        if repr(compiled.parse(s).as_list()) != repr(parser.parse(s).as_list()):
+            print(f"{name}: DIFFERENT RESULT FOR {s!r}")
+            return
+
+    def parse(p):
+        for s in inputs:
+            p.parse(s)
+
+    slow = timed(parse, parser)
+    fast = timed(parse, compiled)
+    lines = compiled.source.count("\n")
+    print(f"{name}: compiled to {lines} lines in {build:.3f}s")
+    print(f"    {slow:.3f}s interpreted, {fast:.3f}s compiled ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    for name, element, inputs in examples():
+        run(name, element, inputs)
@@ -0,0 +1,137 @@
+# encoding: utf-8
+"""
+HOW MUCH OF EACH GRAMMAR IS REPLACED BY ONE REGEX (mo_parsing.collapse), AND
+THE PARSE TIME WITH, AND WITHOUT, THE REPLACEMENT
+"""
+from random import Random
+
+from mo_parsing import CaselessLiteral, Group, Word, collapse
+from mo_parsing.collapse import Collapsed
+from mo_parsing.core import Parser, ParserElement
+from mo_parsing.helpers import delimited_list, upcase_tokens
+from mo_parsing.utils import alphanums, alphas
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import json_documents, json_grammar, sql_grammar, sql_statements, timed
+
+
+def simple_sql():
+    """
+    THE GRAMMAR IN tests/test_simple_sql.py
+    """
+    with Whitespace():
+        selectToken = CaselessLiteral("select")
+        fromToken = CaselessLiteral("from")
+        ident = Word(alphas, alphanums + "_$")
+        columnName = delimited_list(ident, ".", combine=True).add_parse_action(upcase_tokens)
+        columnNameList = Group(delimited_list(columnName)).set_parser_name("columns")
+        columnSpec = "*" | columnNameList
+        tableName = delimited_list(ident, ".", combine=True).add_parse_action(upcase_tokens)
+        tableNameList = Group(delimited_list(tableName)).set_parser_name("tables")
+        return selectToken("command") + columnSpec("columns") + fromToken + tableNameList("tables")
+
+
+def simple_statements(count, seed=0):
+    rand = Random(seed)
+    names = ["a", "b", "sys.xyzzy", "abc", "t.d", "price"]
+    return [
+        "select "
+        + ", ".join(rand.choice(names) for _ in range(rand.randrange(1, 6)))
+        + " from "
+        + ", ".join(rand.choice(names) for _ in range(rand.randrange(1, 4)))
+        for _ in range(count)
+    ]
+
+
+def arithmetic(count, seed=0):
+    rand = Random(seed)
+
+    def expr(depth):
+        if depth > 3 or rand.random() < 0.3:
+            return rand.choice(["1", "2.5", "pi", "e", "x", "sin(3)"])
+        return f"({expr(depth + 1)} {rand.choice('+-*/^')} {expr(depth + 1)})"
+
+    return [expr(0) for _ in range(count)]
+
+
+def example(name):
+    with Whitespace():
+        if name == "jsonParser":
+            from examples import jsonParser
+
+            return jsonParser.jsonObject
+        if name == "fourFn":
+            from examples import fourFn
+
+            return fourFn.bnf
+        if name == "configParse":
+            from examples import configParse
+
+            return configParse.inifile_BNF()
+        if name == "idlParse":
+            from examples import idlParse
+
+            return idlParse.CORBA_IDL_BNF()
+
+
+def elements(element):
+    """
+    :return: ALL ParserElements REACHABLE FROM element
+    """
+    found = {}
+    todo = [element]
+    while todo:
+        e = todo.pop()
+        if id(e) in found:
+            continue
+        found[id(e)] = e
+        if isinstance(e, Collapsed):
+            todo.append(e.expr)
+        elif getattr(e, "exprs", None):
+            todo.extend(e.exprs)
+        elif isinstance(getattr(e, "expr", None), ParserElement):
+            todo.append(e.expr)
+    return found.values()
+
+
+def coverage(parser):
+    """
+    :return: (NUMBER OF Collapsed, ELEMENTS THEY REPLACE, ELEMENTS IN THE GRAMMAR)
+    """
+    replaced = [e for e in elements(parser.element) if isinstance(e, Collapsed)]
+    inside = {id(i) for c in replaced for i in elements(c.expr)}
+    total = {id(e) for e in elements(parser.original)}
+    return len(replaced), len(inside & total), len(total)
+
+
+def run(name, element, inputs):
+    collapse.ENABLED = False
+    before = Parser(element)
+    collapse.ENABLED = True
+    after = Parser(element)
+    subtrees, replaced, total = coverage(after)
+    print(f"{name}: {subtrees} subtrees collapsed, {replaced} of {total} elements ({replaced / total:.0%})")
+    if not inputs:
+        return
+
+    def parse(parser):
+        for s in inputs:
+            parser.parse(s)
+
+    slow = timed(parse, before)
+    fast = timed(parse, after)
+    print(f"    {slow:.3f}s without, {fast:.3f}s with ({slow / fast:.2f}x)")
+
+
+if __name__ == "__main__":
+    if not collapse.ENABLED:
+        print("collapse needs python 3.11")
+    run("test_simple_sql", simple_sql(), simple_statements(500))
+    run("jsonParser", example("jsonParser"), json_documents(30))
+    run("fourFn", example("fourFn"), arithmetic(200))
+    with open("tests/resources/Setup.ini") as f:
+        ini = "\n".join(f.read().splitlines())
+    run("configParse", example("configParse"), [ini])
+    run("idlParse", example("idlParse"), [])
+    run("json (grammars.py)", json_grammar(), json_documents(30))
+    run("sql (grammars.py)", sql_grammar(), sql_statements(60))
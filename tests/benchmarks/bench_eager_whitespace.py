@@ -0,0 +1,41 @@
+# encoding: utf-8
+"""
+EAGER (ONE finditer PASS, THEN bisect) COMPARED TO LAZY (regex.match PER POSITION) WHITESPACE SKIPPING
+"""
+import json
+
+from grammars import json_documents, json_grammar, sql_grammar, sql_statements, timed
+
+
+def whitespace_heavy_json(count):
+    return [json.dumps(json.loads(d), indent=8) for d in json_documents(count)]
+
+
+def comment_heavy_json(count):
+    return [d.replace(", ", ", // a comment about the next value\n    /* and another */ ") for d in json_documents(count)]
+
+
+def comment_heavy_sql(count):
+    return [s.replace(" ", "  -- a comment\n  ") for s in sql_statements(count)]
+
+
+def run(name, grammar, inputs):
+    results = {}
+    for eager in [False, True]:
+        parser = grammar(eager).finalize()
+
+        def parse():
+            for s in inputs:
+                parser.parse(s, parse_all=True)
+
+        results[eager] = timed(parse)
+    lazy, eager = results[False], results[True]
+    print(f"{name}: lazy {lazy:.3f}s, eager {eager:.3f}s ({lazy / eager:.2f}x)")
+
+
+if __name__ == "__main__":
+    run("json", json_grammar, json_documents(30))
+    run("whitespace heavy json", json_grammar, whitespace_heavy_json(30))
+    run("comment heavy json", json_grammar, comment_heavy_json(30))
+    run("sql", sql_grammar, sql_statements(60))
+    run("comment heavy sql", sql_grammar, comment_heavy_sql(60))
@@ -0,0 +1,36 @@
+# encoding: utf-8
+"""
+THROUGHPUT AND PEAK MEMORY (tracemalloc) WITH ParseResults.failures, COMPARED
+TO THE SINGLE FARTHEST-FAILURE REGISTER (finalize(farthest=True))
+"""
+import tracemalloc
+
+from grammars import json_documents, json_grammar, sql_grammar, sql_statements, timed
+
+
+def peak_memory(parser, inputs):
+    tracemalloc.start()
+    for s in inputs:
+        parser.parse(s, parse_all=True)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(name, element, inputs):
+    for farthest in [False, True]:
+        parser = element.finalize(farthest=farthest)
+
+        def parse():
+            for s in inputs:
+                parser.parse(s, parse_all=True)
+
+        duration = timed(parse)
+        peak = peak_memory(parser, inputs)
+        mode = "farthest" if farthest else "failures"
+        print(f"{name} {mode}: {len(inputs) / duration:.1f}/sec, peak {peak:,} bytes")
+
+
+if __name__ == "__main__":
+    run("json", json_grammar(), json_documents(30))
+    run("sql", sql_grammar(), sql_statements(60))
@@ -0,0 +1,85 @@
+# encoding: utf-8
+"""
+FIRST-SET dispatch: HOW MANY ALTERNATIVES OF EACH MatchFirst AND Or ARE
+SKIPPED PER PARSE, AND THE PARSE TIME WITH AND WITHOUT THE dispatch TABLES
+"""
+from mo_parsing import expressions
+from mo_parsing.core import Parser, ParserElement
+from mo_parsing.expressions import MatchFirst, Or
+from mo_parsing.first import _reachable
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import sql_grammar, sql_statements, timed
+
+
+def examples():
+    with Whitespace():
+        from examples.bigquery_view_parser import BigQueryViewParser
+
+    statements = [sql.strip() for sql, _ in BigQueryViewParser.TEST_CASES]
+    return [
+        ("sql", sql_grammar(), sql_statements(60)),
+        ("bigquery_view_parser", BigQueryViewParser._get_parser(), statements),
+    ]
+
+
+def choices(parser):
+    return [e for e in _reachable([parser.original, parser.element]) if isinstance(e, (MatchFirst, Or))]
+
+
+def count(parser, inputs):
+    """
+    :return: (ALTERNATIVES SKIPPED BY THE dispatch, ParserElement._parse CALLS) OVER ALL inputs
+    """
+    counts = [0, 0]
+    candidates, parse = expressions._candidates, ParserElement._parse
+
+    def counting_candidates(expr, string, start):
+        output = candidates(expr, string, start)
+        counts[0] += len(expr.alternate) - len(output)
+        return output
+
+    def counting_parse(self, string, start, do_actions=True):
+        counts[1] += 1
+        return parse(self, string, start, do_actions)
+
+    expressions._candidates, ParserElement._parse = counting_candidates, counting_parse
+    try:
+        for s in inputs:
+            parser.parse(s)
+    finally:
+        expressions._candidates, ParserElement._parse = candidates, parse
+    return counts
+
+
+def run(name, element, inputs):
+    parser = Parser(element)
+    nodes = choices(parser)
+    tables = [e.dispatch for e in nodes]
+    skipped, calls = count(parser, inputs)
+    for e in nodes:
+        e.dispatch = None
+    _, all_calls = count(parser, inputs)
+    for e, t in zip(nodes, tables):
+        e.dispatch = t
+
+    n = len(inputs)
+    print(f"{name}: {sum(t is not None for t in tables)} of {len(nodes)} choices have a dispatch table")
+    print(f"    per parse: {skipped / n:.0f} alternatives skipped, {all_calls / n:.0f} -> {calls / n:.0f} element parses")
+
+    def parse(p):
+        for s in inputs:
+            p.parse(s)
+
+    fast = timed(parse, parser)
+    for e in nodes:
+        e.dispatch = None
+    slow = timed(parse, parser)
+    for e, t in zip(nodes, tables):
+        e.dispatch = t
+    print(f"    {slow:.3f}s without dispatch, {fast:.3f}s with ({slow / fast:.2f}x)")
+
+
+if __name__ == "__main__":
+    for name, element, inputs in examples():
+        run(name, element, inputs)
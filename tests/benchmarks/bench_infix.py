@@ -0,0 +1,54 @@
+# encoding: utf-8
+"""
+infix_notation ON LONG EXPRESSIONS, UP TO 10k TERMS
+
+THE TREE IS BUILT IN ONE PASS OVER THE OPERANDS AND OPERATORS, SO THE TIME
+PER TERM SHOULD STAY FLAT AS THE EXPRESSION GROWS
+"""
+from random import Random
+
+from mo_parsing import LEFT_ASSOC, RIGHT_ASSOC, Literal, Word, infix_notation
+from mo_parsing.infix import one_of
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+SIZES = [100, 1000, 3000, 10000]
+
+
+def grammar():
+    with Whitespace():
+        operand = Word(nums) | Word(alphas, exact=1)
+        return infix_notation(
+            operand,
+            [
+                (Literal("!"), 1, LEFT_ASSOC),
+                (Literal("^"), 2, RIGHT_ASSOC),
+                (one_of("+ -"), 1, RIGHT_ASSOC),
+                (one_of("* /"), 2, LEFT_ASSOC),
+                (one_of("+ -"), 2, LEFT_ASSOC),
+            ],
+        )
+
+
+def sum_of(terms):
+    return "+".join(str(i) for i in range(terms))
+
+
+def power_of(terms):
+    return "^".join(str(i) for i in range(terms))
+
+
+def mixed(terms, seed=0):
+    rand = Random(seed)
+    return "".join(f"{rand.randrange(100)}{rand.choice('+-*/^')}" for _ in range(terms - 1)) + "x"
+
+
+if __name__ == "__main__":
+    parser = grammar().finalize()
+    for name, make in [("a+b+c...", sum_of), ("a^b^c...", power_of), ("mixed", mixed)]:
+        for terms in SIZES:
+            text = make(terms)
+            duration = timed(parser.parse, text, True)
+            print(f"{name} {terms:>5} terms: {duration:.4f}s ({duration / terms * 1_000_000:.0f}us/term)")
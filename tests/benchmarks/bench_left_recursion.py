@@ -0,0 +1,48 @@
+# encoding: utf-8
+"""
+LEFT RECURSIVE Forward (SEED-GROWING) COMPARED TO THE EQUIVALENT infix_notation
+
+BOTH GRAMMARS HAVE TWO LEFT-ASSOCIATIVE PRECEDENCE LEVELS: "*" BINDS TIGHTER THAN "+"
+TIME PER TERM SHOULD STAY FLAT AS THE EXPRESSION GROWS
+"""
+from random import Random
+
+from mo_parsing import Forward, Group, LEFT_ASSOC, Word, infix_notation
+from mo_parsing.utils import nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+SIZES = [10, 100, 1000, 3000]
+
+
+def left_recursive_grammar():
+    with Whitespace():
+        term = Word(nums)
+        product = Forward(left_recursion=True)
+        product <<= Group(product + "*" + term) | term
+        total = Forward(left_recursion=True)
+        total <<= Group(total + "+" + product) | product
+        return total
+
+
+def infix_grammar():
+    with Whitespace():
+        return infix_notation(Word(nums), [("*", 2, LEFT_ASSOC), ("+", 2, LEFT_ASSOC)])
+
+
+def expression(terms, seed=0):
+    rand = Random(seed)
+    return "".join(f"{rand.randrange(100)}{rand.choice('*+')}" for _ in range(terms - 1)) + "1"
+
+
+if __name__ == "__main__":
+    parsers = [
+        ("left recursion", left_recursive_grammar().finalize()),
+        ("infix_notation", infix_grammar().finalize()),
+    ]
+    for terms in SIZES:
+        text = expression(terms)
+        for name, parser in parsers:
+            duration = timed(parser.parse, text, True)
+            print(f"{terms:>5} terms {name}: {duration:.4f}s ({duration / terms * 1_000_000:.0f}us/term)")
@@ -0,0 +1,88 @@
+# encoding: utf-8
+"""
+lineno()/col()/line() ON A MULTI-MEGABYTE STRING: SCANNING THE STRING, AS
+BEFORE, COMPARED TO THE NEWLINE INDEX (mo_parsing.lines)
+"""
+from random import Random
+
+from mo_parsing import ParseException, Word
+from mo_parsing.lines import LineIndex
+from mo_parsing.utils import alphas, col, line, lineno
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+
+def scan_col(loc, string):
+    return 1 if 0 < loc < len(string) and string[loc - 1] == "\n" else loc - string.rfind("\n", 0, loc)
+
+
+def scan_lineno(loc, string):
+    return string.count("\n", 0, loc) + 1
+
+
+def scan_line(loc, string):
+    last = string.rfind("\n", 0, loc)
+    next = string.find("\n", loc)
+    if next >= 0:
+        return string[last + 1 : next]
+    return string[last + 1 :]
+
+
+def words(lines, seed=0):
+    rand = Random(seed)
+    return "\n".join(
+        " ".join("".join(rand.choice(alphas) for _ in range(rand.randrange(1, 9))) for _ in range(8))
+        for _ in range(lines)
+    )
+
+
+def lookups(name, string, positions, lineno, col, line):
+    def run():
+        for loc in positions:
+            lineno(loc, string), col(loc, string), line(loc, string)
+
+    return timed(run)
+
+
+def error_messages(string, positions):
+    def run():
+        for loc in positions:
+            str(ParseException(None, loc, string))
+
+    return timed(run)
+
+
+def parse_actions(string):
+    with Whitespace():
+        grammar = (Word(alphas) / (lambda t, l, s: lineno(l, s)))[1, ...]
+
+    def run():
+        grammar.parse(string, parse_all=True)
+
+    return timed(run, repeat=1)
+
+
+if __name__ == "__main__":
+    string = words(100_000)
+    positions = Random(1).sample(range(len(string)), 2_000)
+    print(f"{len(string):,} chars, {len(positions):,} positions")
+
+    scan = lookups("scan", string, positions, scan_lineno, scan_col, scan_line)
+    # lineno() OUTSIDE A PARSE SCANS, SO THE INDEX IS MADE HERE
+    found = LineIndex(string)
+    index = lookups(
+        "index",
+        string,
+        positions,
+        lambda loc, _: found.lineno(loc),
+        lambda loc, _: found.col(loc),
+        lambda loc, _: found.line(loc),
+    )
+    print(f"lineno+col+line: scan {scan:.3f}s, index {index:.3f}s ({scan / index:.1f}x)")
+    print(f"making the index: {timed(lambda: LineIndex(string)):.3f}s")
+
+    print(f"exception messages: {error_messages(string, positions):.3f}s")
+
+    small = words(5_000)
+    print(f"parse action calling lineno() on every word of {len(small):,} chars: {parse_actions(small):.3f}s")
@@ -0,0 +1,54 @@
+# encoding: utf-8
+"""
+START A PROCESS THAT NEEDS A GRAMMAR: BUILD IT (COLD), OR LOAD THE SNAPSHOT
+MADE BY Parser.load_or_build() (WARM)
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from mo_parsing.core import Parser
+
+from grammars import json_grammar, sql_grammar, timed
+
+START = """
+import sys
+from time import perf_counter
+start = perf_counter()
+import grammars
+from mo_parsing.core import Parser
+Parser.load_or_build(sys.argv[1], getattr(grammars, sys.argv[2]))
+print(perf_counter() - start)
+"""
+
+
+def in_process(path, factory, warm):
+    if not warm and os.path.exists(path):
+        os.remove(path)
+    Parser.load_or_build(path, factory)
+
+
+def new_process(path, factory, warm):
+    """
+    :return: SECONDS FROM THE START OF THE PROCESS, UNTIL IT HAS A Parser
+    """
+    if not warm and os.path.exists(path):
+        os.remove(path)
+    output = subprocess.run(
+        [sys.executable, "-c", START, path, factory.__name__], capture_output=True, check=True, text=True,
+    )
+    return float(output.stdout)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp:
+        for factory in [json_grammar, sql_grammar]:
+            path = os.path.join(temp, factory.__name__ + ".pickle")
+            cold = timed(in_process, path, factory, False)
+            warm = timed(in_process, path, factory, True)
+            print(f"{factory.__name__}: snapshot {os.path.getsize(path)} bytes")
+            print(f"    in process: cold {cold * 1000:.1f}ms, warm {warm * 1000:.1f}ms ({cold / warm:.1f}x)")
+            cold = min(new_process(path, factory, False) for _ in range(5))
+            warm = min(new_process(path, factory, True) for _ in range(5))
+            print(f"    new process, import and grammar: cold {cold * 1000:.1f}ms, warm {warm * 1000:.1f}ms")
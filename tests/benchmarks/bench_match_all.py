@@ -0,0 +1,72 @@
+# encoding: utf-8
+"""
+ORDER-FREE (&) CONFIG GRAMMARS: PARSE TIME BY NUMBER OF CLAUSES, WITH AND
+WITHOUT THE dispatch TABLE OF THE MatchAll
+"""
+import random
+
+from mo_parsing import Group, Keyword, MatchAll, Optional, Suppress, Word
+from mo_parsing.core import Parser, ParserElement
+from mo_parsing.first import _reachable
+from mo_parsing.utils import alphanums, nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+
+def grammar(size):
+    """
+    :return: size OPTIONAL CLAUSES, LIKE "key7 = 42;", IN ANY ORDER
+    """
+    with Whitespace():
+        value = Word(nums) / (lambda t: int(t[0])) | Word(alphanums)
+        clauses = [
+            Optional(Group(Keyword(f"key{i}") + Suppress("=") + value + Suppress(";")))
+            for i in range(size)
+        ]
+        return MatchAll(clauses)
+
+
+def document(size):
+    keys = list(range(size))
+    random.Random(size).shuffle(keys)
+    return " ".join(f"key{i} = {i};" for i in keys)
+
+
+def count(parser, string):
+    """
+    :return: NUMBER OF ParserElement._parse CALLS
+    """
+    counts = [0]
+    parse = ParserElement._parse
+
+    def counting_parse(self, string, start, do_actions=True):
+        counts[0] += 1
+        return parse(self, string, start, do_actions)
+
+    ParserElement._parse = counting_parse
+    try:
+        parser.parse(string, parse_all=True)
+    finally:
+        ParserElement._parse = parse
+    return counts[0]
+
+
+if __name__ == "__main__":
+    print("clauses: element parses, without dispatch -> with; time without dispatch, with")
+    for size in [10, 20, 40, 80, 160]:
+        parser = Parser(grammar(size))
+        string = document(size)
+        (node,) = [e for e in _reachable([parser.original, parser.element]) if isinstance(e, MatchAll)]
+        table = node.dispatch
+
+        def parse():
+            parser.parse(string, parse_all=True)
+
+        fast_calls = count(parser, string)
+        fast = timed(parse)
+        node.dispatch = None
+        slow_calls = count(parser, string)
+        slow = timed(parse)
+        node.dispatch = table
+        print(f"    {size}: {slow_calls} -> {fast_calls}; {slow:.3f}s, {fast:.3f}s ({slow / fast:.1f}x)")
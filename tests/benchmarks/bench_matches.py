@@ -0,0 +1,95 @@
+# encoding: utf-8
+"""
+VALIDATE MANY SHORT INPUTS, MOSTLY INVALID: matches() ONLY ANSWERS YES OR NO,
+COMPARED TO parse() AND CATCHING THE ParseException
+"""
+import random
+
+from mo_parsing import Combine, Keyword, Literal, Optional, ParseException, Word
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import json_grammar, timed
+
+COUNT = 20_000
+VALID = 0.1
+
+
+def header_grammar():
+    """
+    :return: A REGULAR GRAMMAR, LIKE AN HTTP HEADER: Name: token; q=0.5
+    """
+    with Whitespace():
+        name = Word(alphas, alphanums + "-")
+        value = Word(alphanums + "-/.*")
+        weight = Literal(";") + Keyword("q") + "=" + Combine(Word(nums) + Optional("." + Word(nums)))
+        return name + Literal(":") + value + Optional(weight)
+
+
+def headers(rand):
+    valid = f"Accept-{rand.randrange(100)}: text/html; q=0.{rand.randrange(10)}"
+    invalid = rand.choice([
+        f"Accept {rand.randrange(100)} text/html",
+        f"Accept-{rand.randrange(100)}: text/html; q=",
+        f"{rand.randrange(100)}: text",
+        f"Accept: text/html; q=0.5; x",
+    ])
+    return valid, invalid
+
+
+def documents(rand):
+    valid = f'{{"id": {rand.randrange(1000)}, "tags": ["a", "b"], "ok": true}}'
+    invalid = rand.choice([
+        f'{{"id": {rand.randrange(1000)}, "tags": ["a", "b", "ok": true}}',
+        f'{{"id" {rand.randrange(1000)}}}',
+        f'{{"id": {rand.randrange(1000)}, "tags": ["a", "b"], "ok": true',
+        f'["x", {rand.randrange(1000)}, ]',
+    ])
+    return valid, invalid
+
+
+def inputs(make):
+    rand = random.Random(42)
+    acc = []
+    for _ in range(COUNT):
+        valid, invalid = make(rand)
+        acc.append(valid if rand.random() < VALID else invalid)
+    return acc
+
+
+def by_parse(parser, strings):
+    count = 0
+    for s in strings:
+        try:
+            parser.parse(s, parse_all=True)
+            count += 1
+        except ParseException:
+            pass
+    return count
+
+
+def by_matches(parser, strings):
+    return sum(1 for s in strings if parser.matches(s))
+
+
+def by_offset(parser, strings):
+    return sum(1 for s in strings if parser.failure_offset(s) is None)
+
+
+if __name__ == "__main__":
+    for name, grammar, make in [("http header (regular)", header_grammar, headers), ("json", json_grammar, documents)]:
+        strings = inputs(make)
+        print(f"{name}, {COUNT} inputs, {int(VALID * 100)}% valid")
+        for farthest in [False, True]:
+            parser = Parser(grammar(), farthest=farthest)
+            expected = by_parse(parser, strings)
+            assert by_matches(parser, strings) == expected
+            assert by_offset(parser, strings) == expected
+            slow = timed(by_parse, parser, strings)
+            fast = timed(by_matches, parser, strings)
+            offset = timed(by_offset, parser, strings)
+            print(
+                f"    farthest={farthest}: parse {slow:.3f}s, matches {fast:.3f}s ({slow / fast:.1f}x),"
+                f" failure_offset {offset:.3f}s"
+            )
@@ -0,0 +1,43 @@
+# encoding: utf-8
+"""
+PACKRAT MEMOIZATION: PARSE TIME AND CACHE STATISTICS, WITH AND WITHOUT A Memo
+
+THE "backtracking" GRAMMAR SHARES A PREFIX ACROSS ALTERNATIVES, SO IT IS
+EXPONENTIAL IN NESTING DEPTH WITHOUT A MEMO
+"""
+from mo_parsing import Forward, Group, Literal, Word
+from mo_parsing.memo import Memo
+from mo_parsing.utils import nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import json_grammar, json_documents, sql_grammar, sql_statements, timed
+
+
+def backtracking_grammar():
+    with Whitespace():
+        expr = Forward()
+        atom = Group(Word(nums) | Literal("(").suppress() + expr + Literal(")").suppress())
+        expr << (atom + "+" + expr | atom + "-" + expr | atom)
+        return expr
+
+
+def backtracking_inputs(depth):
+    return ["(" * depth + "1" + ")" * depth + "+2-3"]
+
+
+def run(name, element, inputs):
+    def parse(parser):
+        for s in inputs:
+            parser.parse(s, parse_all=True)
+
+    base = timed(parse, element.finalize())
+    print(f"{name}: no memo {base:.3f}s")
+    for memo in [Memo(), Memo(size=1000), Memo(window=200)]:
+        duration = timed(parse, element.finalize(memo=memo))
+        print(f"    {memo.__data__()}: {duration:.3f}s ({base / duration:.2f}x)")
+
+
+if __name__ == "__main__":
+    run("backtracking depth 8", backtracking_grammar(), backtracking_inputs(8))
+    run("json", json_grammar(), json_documents(30))
+    run("sql", sql_grammar(), sql_statements(60))
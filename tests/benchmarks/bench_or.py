@@ -0,0 +1,74 @@
+# encoding: utf-8
+"""
+LONGEST MATCH (^): THE TRIAL ParseResults OF THE WINNER ARE THE RESULT,
+COMPARED TO PARSING THE WINNER A SECOND TIME (AS Or DID BEFORE)
+"""
+from mo_parsing import Forward, Group, Literal, Regex, Suppress, Word, delimited_list
+from mo_parsing.core import Parser
+from mo_parsing.expressions import Or
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+
+def grammar(actions):
+    """
+    :return: NESTED LISTS AND CALLS, WHERE EVERY CHOICE IS A LONGEST MATCH
+    """
+    with Whitespace():
+        value = Forward()
+        integer = Word(nums)
+        real = Regex(r"\d+\.\d+")
+        name = Word(alphas, alphanums)
+        if actions:
+            integer = integer / (lambda t: int(t[0]))
+            real = real / (lambda t: float(t[0]))
+        call = Group(name + Suppress("(") + delimited_list(value) + Suppress(")"))
+        array = Group(Suppress("[") + delimited_list(value) + Suppress("]"))
+        value << (integer ^ real ^ name ^ call ^ array ^ Literal("-") + value)
+    return delimited_list(value)
+
+
+def document(depth, width=3):
+    if depth == 0:
+        return "f(1, 2.5, x)"
+    inner = document(depth - 1, width)
+    return "[" + ", ".join([inner] * width) + "]"
+
+
+def parse_twice(parse_impl):
+    def wrapper(self, string, start, do_actions=True):
+        result = parse_impl(self, string, start, do_actions)
+        result.tokens[0].type._parse(string, start, do_actions)
+        return result
+
+    return wrapper
+
+
+def run(name, actions):
+    parser = Parser(grammar(actions))
+
+    print(f"{name}, by depth: parse twice, trial kept")
+    for depth in [2, 4, 6, 8]:
+        string = document(depth)
+
+        def parse():
+            parser.parse(string, parse_all=True)
+
+        fast = timed(parse)
+        if depth <= 6:
+            single = Or.parse_impl
+            Or.parse_impl = parse_twice(single)
+            try:
+                slow = timed(parse)
+            finally:
+                Or.parse_impl = single
+            print(f"    {depth}: {slow:.3f}s, {fast:.3f}s ({slow / fast:.1f}x)")
+        else:
+            print(f"    {depth}: (too slow), {fast:.3f}s")
+
+
+if __name__ == "__main__":
+    run("no actions", False)
+    run("actions on the numbers", True)
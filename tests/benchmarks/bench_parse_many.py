@@ -0,0 +1,39 @@
+# encoding: utf-8
+"""
+PARSE MANY SMALL JSON DOCUMENTS WITH parse_many() ON 1, 2, 4 AND 8 WORKERS
+THE SCALING IS LIMITED BY THE NUMBER OF CPUS
+"""
+import os
+import random
+
+from grammars import json_grammar, timed
+
+COUNT = 20_000
+
+
+def documents():
+    rand = random.Random(42)
+    acc = []
+    for i in range(COUNT):
+        if rand.random() < 0.1:
+            acc.append(f'{{"id": {i}, "tags": ["a", "b", "ok": true}}')
+        else:
+            acc.append(f'{{"id": {i}, "tags": ["a", "b"], "score": {rand.random()}, "ok": true}}')
+    return acc
+
+
+def run(parser, strings, workers):
+    return sum(1 for _ in parser.parse_many(strings, json_grammar, workers=workers, chunksize=200))
+
+
+if __name__ == "__main__":
+    strings = documents()
+    parser = json_grammar()
+    expected = [str(r) for r in parser.parse_many(strings, workers=1)]
+    assert [str(r) for r in parser.parse_many(strings, json_grammar, workers=2, chunksize=200)] == expected
+    print(f"{COUNT} json documents, {os.cpu_count()} cpus")
+    single = None
+    for workers in [1, 2, 4, 8]:
+        duration = timed(run, parser, strings, workers)
+        single = single or duration
+        print(f"    {workers} workers: {duration:.3f}s ({single / duration:.1f}x)")
@@ -0,0 +1,34 @@
+# encoding: utf-8
+"""
+REPEATED parse_string() ON THE SAME ELEMENT, WITH THE CACHED Parser
+COMPARED TO BUILDING A NEW Parser FOR EVERY CALL (THE OLD BEHAVIOUR)
+"""
+from mo_parsing import Word
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import json_grammar, sql_grammar, timed
+
+CALLS = 10_000
+
+
+def run(name, element, string):
+    def cached():
+        for _ in range(CALLS):
+            element.parse_string(string)
+
+    def rebuilt():
+        for _ in range(CALLS):
+            Parser(element).parse(string)
+
+    new = timed(cached)
+    old = timed(rebuilt)
+    print(f"{name}: {CALLS} calls, rebuilt {old:.3f}s, cached {new:.3f}s ({old / new:.2f}x)")
+
+
+if __name__ == "__main__":
+    with Whitespace():
+        run("word", Word(alphas) + Word(nums), "abc 123")
+    run("json", json_grammar(), '{"a": 1}')
+    run("sql", sql_grammar(), "SELECT a FROM b")
@@ -0,0 +1,54 @@
+# encoding: utf-8
+"""
+MAKE THE Regex OF A GRAMMAR: THE PATTERN IS ONLY COMPILED, AND PARSED INTO
+A GRAMMAR ON FIRST USE OF expr, COMPARED TO PARSING EVERY PATTERN UP FRONT
+"""
+import re
+import subprocess
+import sys
+
+from mo_parsing import Regex
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+PATTERNS = [
+    r"[+-]?\d+",
+    r"[+-]?(?:\d+\.\d*|\.\d+)",
+    r"[+-]?(?:\d+(?:[eE][+-]?\d+)|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)",
+    r"[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}",
+    r"[0-9a-f]{2}([:.-])[0-9a-f]{2}(?:\1[0-9a-f]{2}){4}",
+    r'"(?:[^"\n\r\\]|(?:"")|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*"',
+    r"/\*(?:[^*]|\*(?!/))*\*/",
+    r"(?:if|then|else|while|for|return)\b",
+    r"[a-zA-Z_][a-zA-Z0-9_]*",
+    r"\s*#[^\n]*",
+]
+COUNT = 200
+
+START = "from time import perf_counter; start = perf_counter(); import mo_parsing.helpers; print(perf_counter() - start)"
+
+
+def build(eager):
+    for _ in range(COUNT):
+        for p in PATTERNS:
+            r = Regex(p)
+            if eager:
+                r.expr
+            else:
+                r.expecting()
+
+
+def import_helpers():
+    return min(
+        float(subprocess.run([sys.executable, "-c", START], capture_output=True, check=True, text=True).stdout)
+        for _ in range(5)
+    )
+
+
+if __name__ == "__main__":
+    with Whitespace():
+        eager = timed(build, True)
+        lazy = timed(build, False)
+    print(f"{COUNT * len(PATTERNS)} Regex: parsed {eager:.3f}s, compiled with expecting() {lazy:.3f}s ({eager / lazy:.1f}x)")
+    print(f"import mo_parsing.helpers: {import_helpers() * 1000:.0f}ms")
@@ -0,0 +1,64 @@
+# encoding: utf-8
+"""
+search_string OVER A LOG: JUMP TO THE NEXT PLACE A MATCH CAN START WITH THE
+Parser.scan REGEX, COMPARED TO TRYING THE GRAMMAR AT EVERY CHARACTER (scan=None)
+"""
+import random
+
+from mo_parsing import Combine, Group, Keyword, Literal, Regex, Word
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphanums, nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+SIZES = [100_000, 1_000_000, 10_000_000]
+SLOW_LIMIT = 1_000_000  # LARGER IS TOO SLOW WITHOUT THE scan
+
+
+def grammars():
+    with Whitespace():
+        octet = Word(nums, max=3)
+        yield "ip address", Combine(octet + "." + octet + "." + octet + "." + octet)
+        yield "error line", Group(Keyword("ERROR") + Regex(r"[^\n]*"))
+        yield "key=value", Group(Word(alphanums) + Literal("=") + Word(nums))
+
+
+def log(size):
+    """
+    :return: ABOUT size CHARACTERS OF LOG LINES, MOSTLY WORDS, WITH RARE MATCHES
+    """
+    rand = random.Random(size)
+    words = ["request", "served", "from", "cache", "in", "ms", "user", "session", "started", "INFO", "DEBUG"]
+    acc = []
+    length = 0
+    while length < size:
+        line = " ".join(rand.choice(words) for _ in range(12))
+        r = rand.random()
+        if r < 0.01:
+            line += f" ERROR at 10.0.{rand.randrange(256)}.{rand.randrange(256)}"
+        elif r < 0.02:
+            line += f" retries={rand.randrange(10)}"
+        acc.append(line)
+        length += len(line) + 1
+    return "\n".join(acc)
+
+
+if __name__ == "__main__":
+    for name, grammar in grammars():
+        parser = Parser(grammar)
+        scan = parser._scanner()
+        print(f"{name}: matches; per character, scan")
+        for size in SIZES:
+            string = log(size)
+            fast = timed(parser.search_string, string)
+            matches = len(parser.search_string(string))
+            if size > SLOW_LIMIT:
+                print(f"    {size:>10}: {matches} matches; (too slow), {fast:.3f}s")
+                continue
+            parser.scan = None
+            try:
+                slow = timed(parser.search_string, string, repeat=1)
+            finally:
+                parser.scan = scan
+            print(f"    {size:>10}: {matches} matches; {slow:.3f}s, {fast:.3f}s ({slow / fast:.0f}x)")
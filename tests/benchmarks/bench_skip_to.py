@@ -0,0 +1,74 @@
+# encoding: utf-8
+"""
+SkipTo OVER A LONG BODY: SEARCH FOR THE NEXT CANDIDATE WITH THE scan REGEX,
+COMPARED TO TRYING THE TARGET AT EVERY CHARACTER (scan=None)
+"""
+import random
+
+from mo_parsing import Keyword, Literal, Regex, SkipTo, Word
+from mo_parsing.core import Parser
+from mo_parsing.first import _reachable
+from mo_parsing.helpers import QuotedString
+from mo_parsing.utils import alphas
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def grammars():
+    """
+    :return: (name, grammar, THE extra WORDS IN THE body)
+    """
+    with Whitespace():
+        yield "literal", SkipTo(Literal(";")) + ";", []
+        yield "keyword + fail_on", SkipTo(Keyword("end") + ";", fail_on=Literal("#")) + "end" + ";", ["end"]
+        yield "ignore strings", SkipTo(Literal(";"), ignore=QuotedString('"')) + ";", ['"a;b"']
+        yield "regex, include", Word(alphas) + SkipTo(Regex(r"\d+"), include=True), []
+    with Whitespace() as white:
+        white.add_ignore(Literal("//") + Regex("[^\n]*"))
+        yield "comments", SkipTo(Literal(";")) + ";", ["// x;y\n"]
+
+
+def body(size, extra):
+    """
+    :return: ABOUT size CHARACTERS OF WORDS, AND THE extra WORDS, WITH THE TARGET AT THE END
+    """
+    rand = random.Random(size)
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "\n"] + extra
+    acc = []
+    length = 0
+    while length < size:
+        word = rand.choice(words)
+        acc.append(word)
+        length += len(word) + 1
+    return " ".join(acc) + " 42 end;"
+
+
+def unscanned(parser):
+    elements = [e for e in _reachable([parser.original, parser.element]) if isinstance(e, SkipTo)]
+    scans = [e.scan for e in elements]
+
+    def undo():
+        for e, s in zip(elements, scans):
+            e.scan = s
+
+    for e in elements:
+        e.scan = None
+    return undo
+
+
+if __name__ == "__main__":
+    for name, grammar, extra in grammars():
+        parser = Parser(grammar)
+        print(f"{name}: per character, scan")
+        for size in SIZES:
+            string = body(size, extra)
+            fast = timed(parser.parse, string)
+            undo = unscanned(parser)
+            try:
+                slow = timed(parser.parse, string, repeat=1)
+            finally:
+                undo()
+            print(f"    {size:>9}: {slow:.3f}s, {fast:.4f}s ({slow / fast:.0f}x)")
@@ -0,0 +1,95 @@
+# encoding: utf-8
+"""
+MEMORY (tracemalloc) HELD BY THE Whitespace.skip() CACHE, AND PARSE TIME, FOR EACH BACKEND
+
+"list" IS THE OLD [-1] * len(string) FOR EACH Whitespace
+"""
+import tracemalloc
+from random import Random
+
+from mo_parsing.skips import set_skip_cache
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import json_documents, json_grammar, timed
+
+BACKENDS = ["list", "sparse", "array"]
+
+
+class ListSkips(list):
+    def get(self, start):
+        try:
+            end = self[start]
+        except IndexError:
+            return None
+        if end == -1:
+            return None
+        return end
+
+
+def ini_grammar():
+    with Whitespace():
+        from examples import configParse
+
+        return configParse.inifile_BNF()
+
+
+def ini_file(sections, seed=0):
+    rand = Random(seed)
+    lines = []
+    for s in range(sections):
+        lines.append(f"[section{s}]")
+        for k in range(rand.randrange(5, 20)):
+            lines.append(f"key{k} = {rand.randrange(1_000_000)}   ; comment {k}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def resource(name):
+    with open(f"tests/resources/{name}") as f:
+        return "\n".join(f.read().splitlines())
+
+
+def measure(element, string):
+    """
+    :return: BYTES HELD BY THE SKIP CACHE AT THE END OF THE PARSE (IT IS DROPPED WITH THE ParseState)
+    """
+    snapshots = []
+
+    def snapshot(tokens):
+        snapshots.append(tracemalloc.take_snapshot())
+        return tokens
+
+    with Whitespace():
+        parser = (element / snapshot).finalize()
+    tracemalloc.start(1)
+    before = tracemalloc.take_snapshot()
+    parser.parse(string)
+    tracemalloc.stop()
+    after = snapshots[-1]
+
+    filters = [tracemalloc.Filter(True, "*/skips.py"), tracemalloc.Filter(True, "*/whitespaces.py"), tracemalloc.Filter(True, __file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "filename")
+    return sum(s.size_diff for s in stats)
+
+
+def run(name, element, string):
+    parser = element.finalize()
+    print(f"{name}: {len(string):,} chars")
+    for backend in BACKENDS:
+        if backend == "list":
+            set_skip_cache(backend=lambda: ListSkips([-1] * len(string)))
+        else:
+            set_skip_cache(backend=backend)
+        size = measure(element, string)
+        duration = timed(parser.parse, string)
+        print(f"    {backend}: {size:,} bytes, {duration:.3f}s")
+    set_skip_cache()
+
+
+if __name__ == "__main__":
+    ini = ini_grammar()
+    run("Setup.ini", ini, resource("Setup.ini"))
+    run("karthik.ini", ini, resource("karthik.ini"))
+    run("synthetic ini", ini, ini_file(2000))
+    documents = ", ".join(f'"{i}": {d}' for i, d in enumerate(json_documents(20)))
+    run("synthetic json", json_grammar(), "{" + documents + "}")
@@ -0,0 +1,80 @@
+# encoding: utf-8
+"""
+ONLY THE (start, end) OF THE MATCHES, OR THEIR NUMBER: scan_spans AND count
+RUN NO PARSE ACTIONS, AND KEEP NO FAILURES, COMPARED TO search_string
+"""
+import random
+import tracemalloc
+
+from mo_parsing import Group, Literal, Optional, Regex, Word
+from mo_parsing.core import Parser
+from mo_parsing.results import ParseResults
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+from grammars import timed
+
+SIZE = 1_000_000
+
+
+def grammar(longest):
+    """
+    :param longest: USE A LONGEST MATCH (^), SO THE GRAMMAR IS NOT ONE REGEX
+    :return: key=value PAIRS, WITH AN OPTIONAL UNIT, AND PARSE ACTIONS
+    """
+    with Whitespace():
+        number = Word(nums) / (lambda t: int(t[0]))
+        if longest:
+            number = number ^ Regex(r"\d+\.\d+") / (lambda t: float(t[0]))
+        unit = Word(alphas) / (lambda t: t[0].lower())
+        return Group(Word(alphas, alphanums) + Literal("=") + number + Optional(unit))
+
+
+def log(size):
+    rand = random.Random(size)
+    words = ["request", "served", "from", "cache", "in", "user", "session", "INFO"]
+    acc = []
+    length = 0
+    while length < size:
+        line = " ".join(rand.choice(words) for _ in range(6))
+        line += f" latency={rand.randrange(1000)} ms size={rand.randrange(100000)}"
+        acc.append(line)
+        length += len(line) + 1
+    return "\n".join(acc)
+
+
+def allocations(func, *args):
+    """
+    :return: (NUMBER OF ParseResults MADE, PEAK BYTES ALLOCATED) BY func(*args)
+    """
+    counts = [0]
+    init = ParseResults.__init__
+
+    def counting_init(self, *args):
+        counts[0] += 1
+        init(self, *args)
+
+    ParseResults.__init__ = counting_init
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        ParseResults.__init__ = init
+    return counts[0], peak
+
+
+if __name__ == "__main__":
+    string = log(SIZE)
+    for longest, farthest in [(False, False), (True, False), (True, True)]:
+        parser = Parser(grammar(longest), farthest=farthest)
+        print(f"{'longest match' if longest else 'regular'}, farthest={farthest}: time, ParseResults made, peak memory")
+        for name, func in [
+            ("search_string", parser.search_string),
+            ("scan_spans", lambda s: list(parser.scan_spans(s))),
+            ("count", parser.count),
+        ]:
+            duration = timed(func, string)
+            made, peak = allocations(func, string)
+            print(f"    {name:>13}: {duration:.3f}s, {made:>8}, {peak / 1_000_000:.1f}MB")
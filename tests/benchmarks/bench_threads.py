@@ -0,0 +1,36 @@
+# encoding: utf-8
+"""
+THROUGHPUT OF INDEPENDENT PARSES RUN ON A THREAD POOL
+
+ON A GIL BUILD THE THREADED NUMBERS SHOW THERE IS NO LOCK CONTENTION (NEAR 1x);
+ON FREE-THREADED CPYTHON (3.13t) THEY SHOW THE PARSES USING MORE THAN ONE CORE
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from grammars import json_grammar, json_documents, sql_grammar, sql_statements, timed
+
+THREADS = [1, 2, 4, 8]
+
+
+def run(name, parser, inputs):
+    def sequential():
+        for s in inputs:
+            parser.parse(s, parse_all=True)
+
+    def threaded(pool):
+        list(pool.map(lambda s: parser.parse(s, parse_all=True), inputs))
+
+    base = timed(sequential)
+    print(f"{name}: {len(inputs)} inputs, sequential {len(inputs) / base:.0f}/sec")
+    for n in THREADS:
+        with ThreadPoolExecutor(n) as pool:
+            duration = timed(threaded, pool)
+        print(f"    {n} threads: {len(inputs) / duration:.0f}/sec ({base / duration:.2f}x)")
+
+
+if __name__ == "__main__":
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    run("json", json_grammar().finalize(), json_documents(100))
+    run("sql", sql_grammar().finalize(), sql_statements(100))
@@ -0,0 +1,31 @@
+# encoding: utf-8
+"""
+THROUGHPUT OF farthest MODE WHEN FAILED ALTERNATIVES RAISE ParseException,
+COMPARED TO RETURNING None (THE try_impl() PROTOCOL)
+"""
+from mo_parsing import core
+
+from grammars import json_documents, json_grammar, sql_grammar, sql_statements, timed
+
+
+def run(name, element, inputs):
+    parser = element.finalize(farthest=True)
+
+    def parse():
+        for s in inputs:
+            parser.parse(s, parse_all=True)
+
+    native_parse = core._native_parse
+    core._native_parse = None  # FORCE THE EXCEPTION PROTOCOL
+    try:
+        raising = timed(parse)
+    finally:
+        core._native_parse = native_parse
+    returning = timed(parse)
+    print(f"{name} exceptions: {len(inputs) / raising:.1f}/sec")
+    print(f"{name} no exceptions: {len(inputs) / returning:.1f}/sec ({raising / returning:.2f}x)")
+
+
+if __name__ == "__main__":
+    run("json", json_grammar(), json_documents(30))
+    run("sql", sql_grammar(), sql_statements(60))
@@ -0,0 +1,59 @@
+# encoding: utf-8
+"""
+NESTING DEPTH: THE INTERPRETED Parser RECURSES FOR EACH LEVEL, THE
+Program FROM Parser.assemble() DOES NOT
+"""
+from time import perf_counter
+
+from mo_parsing.core import Parser
+
+from grammars import json_documents, json_grammar, sql_grammar, sql_statements, timed
+
+
+def nested_json(depth):
+    return '{"a": ' + "[" * depth + '{"b": 1}' + "]" * depth + "}"
+
+
+def nested_sql(depth):
+    return "SELECT " + "(SELECT " * depth + "a" + " FROM t)" * depth + " FROM t"
+
+
+def attempt(parser, string):
+    """
+    :return: SECONDS TO PARSE, OR THE NAME OF THE ERROR
+    """
+    start = perf_counter()
+    try:
+        parser.parse(string, parse_all=True)
+    except RecursionError:
+        return "RecursionError"
+    return f"{perf_counter() - start:.3f}s"
+
+
+def depths(name, element, make):
+    parser = Parser(element)
+    program = parser.assemble()
+    print(f"{name}, by depth: interpreted, assembled")
+    for depth in [10, 100, 1_000, 10_000, 100_000]:
+        string = make(depth)
+        print(f"    {depth:>7}: {attempt(parser, string):>14}, {attempt(program, string):>8}")
+
+
+def throughput(name, element, inputs):
+    parser = Parser(element)
+    program = parser.assemble()
+
+    def parse(p):
+        for s in inputs:
+            p.parse(s)
+
+    slow = timed(parse, parser)
+    fast = timed(parse, program)
+    print(f"{name}: {slow:.3f}s interpreted, {fast:.3f}s assembled ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    depths("json", json_grammar(), nested_json)
+    depths("sql", sql_grammar(), nested_sql)
+    throughput("json", json_grammar(), json_documents(30))
+    throughput("sql", sql_grammar(), sql_statements(60))
@@ -0,0 +1,157 @@
+# encoding: utf-8
+"""
+GRAMMARS AND INPUTS SHARED BY THE BENCHMARKS
+
+RUN ANY BENCHMARK FROM THE PROJECT ROOT WITH
+    export PYTHONPATH=.
+    python tests/benchmarks/bench_threads.py
+"""
+import random
+from time import perf_counter
+
+from mo_parsing import (
+    CaselessKeyword,
+    Dict,
+    Forward,
+    Group,
+    Keyword,
+    Literal,
+    Optional,
+    Suppress,
+    Word,
+    delimited_list,
+    infix_notation,
+    LEFT_ASSOC,
+    RIGHT_ASSOC,
+    one_of,
+)
+from mo_parsing.helpers import cppStyleComment, dblQuotedString, number, quoted_string, remove_quotes, restOfLine
+from mo_parsing.utils import alphanums, alphas
+from mo_parsing.whitespaces import Whitespace
+
+
+def json_grammar(eager=False):
+    """
+    :param eager: SCAN FOR WHITESPACE EAGERLY
+    :return: ParserElement FOR A JSON OBJECT (WITH C++ STYLE COMMENTS)
+    """
+    with Whitespace() as whitespace:
+        whitespace.set_eager(eager)
+        TRUE = Keyword("true") / (lambda: True)
+        FALSE = Keyword("false") / (lambda: False)
+        NULL = Keyword("null") / (lambda: None)
+        LBRACK, RBRACK, LBRACE, RBRACE, COLON = map(Suppress, "[]{}:")
+
+        json_string = dblQuotedString / remove_quotes
+        json_object = Forward()
+        json_value = Forward()
+        json_array = Group(LBRACK + Optional(delimited_list(json_value), []) + RBRACK)
+        json_value << (json_string | number | json_object | json_array | TRUE | FALSE | NULL)
+        member = Group(json_string + COLON + json_value)
+        json_object << Dict(LBRACE + Optional(delimited_list(member)) + RBRACE)
+        whitespace.add_ignore(cppStyleComment)
+    return json_object
+
+
+def sql_grammar(eager=False):
+    """
+    :param eager: SCAN FOR WHITESPACE EAGERLY
+    :return: ParserElement FOR A SMALL SQL SELECT DIALECT (KEYWORDS, INFIX EXPRESSIONS, SUB-QUERIES)
+    """
+    with Whitespace() as whitespace:
+        whitespace.set_eager(eager)
+        SELECT, FROM, WHERE, AND, OR, NOT, AS, IN, IS, NULL, GROUP, BY, ORDER, LIMIT = map(
+            CaselessKeyword, "select from where and or not as in is null group by order limit".split()
+        )
+        keyword = SELECT | FROM | WHERE | AND | OR | NOT | AS | IN | IS | NULL | GROUP | BY | ORDER | LIMIT
+        LPAR, RPAR = map(Suppress, "()")
+
+        select_stmt = Forward()
+        expr = Forward()
+        ident = (~keyword + Word(alphas + "_", alphanums + "_$")).set_parser_name("identifier")
+        column = delimited_list(ident, ".", combine=True)
+        call = Group(ident("op") + LPAR + Optional(delimited_list(expr))("params") + RPAR)
+        term = (
+            number
+            | quoted_string
+            | NULL
+            | call
+            | LPAR + select_stmt + RPAR
+            | column
+        )
+        expr << infix_notation(
+            term,
+            [
+                (one_of("- +") | NOT, 1, RIGHT_ASSOC),
+                (one_of("* / %"), 2, LEFT_ASSOC),
+                (one_of("+ -"), 2, LEFT_ASSOC),
+                (one_of("= != <> < <= > >="), 2, LEFT_ASSOC),
+                (IS, 2, LEFT_ASSOC),
+                (AND, 2, LEFT_ASSOC),
+                (OR, 2, LEFT_ASSOC),
+            ],
+        )
+        select_column = Group(expr("value") + Optional(Optional(AS) + ident("name")))
+        select_stmt << (
+            SELECT
+            + (Literal("*") | delimited_list(select_column))("select")
+            + FROM
+            + delimited_list(Group(column("value") + Optional(Optional(AS) + ident("name"))))("from")
+            + Optional(WHERE + expr("where"))
+            + Optional(GROUP + BY + delimited_list(expr)("groupby"))
+            + Optional(ORDER + BY + delimited_list(expr)("orderby"))
+            + Optional(LIMIT + number("limit"))
+        )
+        whitespace.add_ignore(Literal("--") + restOfLine)
+    return select_stmt
+
+
+def json_documents(count, seed=42):
+    """
+    :return: LIST OF count SMALL-TO-MEDIUM JSON DOCUMENTS
+    """
+    rand = random.Random(seed)
+
+    def value(depth):
+        r = rand.random()
+        if depth > 2 or r < 0.3:
+            return rand.choice([str(rand.randint(-1000, 1000)), "3.14159", '"text value"', "true", "false", "null"])
+        if r < 0.6:
+            return "[" + ", ".join(value(depth + 1) for _ in range(rand.randint(0, 5))) + "]"
+        return "{" + ", ".join(f'"k{i}": {value(depth + 1)}' for i in range(rand.randint(0, 5))) + "}"
+
+    return ["{" + ", ".join(f'"key{i}": {value(0)}' for i in range(8)) + "}" for _ in range(count)]
+
+
+def sql_statements(count, seed=42):
+    """
+    :return: LIST OF count SQL SELECT STATEMENTS
+    """
+    rand = random.Random(seed)
+    columns = ["a", "b", "c", "t.d", "price", "quantity"]
+
+    def condition(depth):
+        if depth > 2 or rand.random() < 0.4:
+            return f"{rand.choice(columns)} {rand.choice(['=', '<', '>=', '<>'])} {rand.randint(0, 99)}"
+        if rand.random() < 0.2:
+            return f"{rand.choice(columns)} = (select max(x) from u where {condition(depth + 1)})"
+        return f"({condition(depth + 1)} {rand.choice(['and', 'or'])} {condition(depth + 1)})"
+
+    return [
+        f"select {', '.join(rand.sample(columns, 3))}, price * quantity as total from t, s"
+        f" where {condition(0)} order by a limit {rand.randint(1, 100)}"
+        for _ in range(count)
+    ]
+
+
+def timed(func, *args, repeat=3):
+    """
+    :return: BEST WALL-CLOCK SECONDS TO RUN func(*args) OUT OF repeat TRIES
+    """
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        func(*args)
+        duration = perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best
@@ -0,0 +1,148 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import (
+    Dict,
+    Forward,
+    Group,
+    Keyword,
+    Literal,
+    Optional,
+    ParseException,
+    Regex,
+    Suppress,
+    Word,
+    collapse,
+    delimited_list,
+)
+from mo_parsing.codegen import CompiledParser
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestCodegen(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def json(self):
+        value = Forward()
+        string = Regex(r'"[^"]*"') / (lambda t: t[0][1:-1])
+        number = Regex(r"\d+(\.\d+)?") / (lambda t: float(t[0]) if "." in t[0] else int(t[0]))
+        member = Group(string + Suppress(":") + value)
+        obj = Dict(Suppress("{") + Optional(delimited_list(member)) + Suppress("}"))
+        array = Group(Suppress("[") + Optional(delimited_list(value)) + Suppress("]"))
+        value << (string | number | obj | array | Keyword("true") / (lambda: True) | Keyword("null") / (lambda: None))
+        return value
+
+    def test_same_results(self):
+        grammar = self.json()
+        parser = Parser(grammar)
+        compiled = parser.compile()
+        self.assertIsInstance(compiled, CompiledParser)
+        for string in ['{"a": [1, 2.5, "x"], "b": {"c": true, "d": null}}', "[]", '{"a": {}}', "[[], [[]]]"]:
+            expected = parser.parse(string, parse_all=True)
+            result = compiled.parse(string, parse_all=True)
+            # repr, BECAUSE FuzzyTestCase TREATS EMPTY LISTS AS MISSING
+            self.assertEqual(repr(result.as_list()), repr(expected.as_list()))
+
+    def test_one_function_per_element(self):
+        grammar = Word(alphas) + Optional("=" + Word(nums))
+        collapse.ENABLED = False
+        try:
+            compiled = Parser(grammar).compile()
+        finally:
+            collapse.ENABLED = True
+        # Group, And, Word, Optional, And, Literal, Word
+        self.assertEqual(compiled.source.count("\ndef p") + compiled.source.startswith("def p"), 7)
+        self.assertIn("'='", compiled.source)
+
+    def test_same_failure(self):
+        grammar = Word(alphas)("key") + "=" + Word(nums)("value") + ";"
+        parser = Parser(grammar)
+        compiled = parser.compile()
+        for string in ["a = 1", "a 1;", "a = b;", "= 1;", "a = 1; extra"]:
+            self.assertEqual(str(failure(compiled, string)), str(failure(parser, string)))
+        self.assertEqual(compiled.parse("a = 1;")["value"], "1")
+
+    def test_failure_runs_actions_once(self):
+        calls = []
+        key = Word(alphas) / (lambda t: calls.append(t[0]))
+        grammar = key + "=" + Word(nums) + ";"
+        parser = Parser(grammar)
+        compiled = parser.compile()
+        expected = str(failure(parser, "a = b;"))
+        calls[:] = []
+        self.assertEqual(str(failure(compiled, "a = b;")), expected)
+        self.assertEqual(calls, ["a"])
+
+    def test_failure_from_condition(self):
+        grammar = Word(nums).add_condition(lambda t: int(t[0]) < 10, message="too big") + ";"
+        parser = Parser(grammar)
+        compiled = parser.compile()
+        self.assertEqual(str(failure(compiled, "12;")), str(failure(parser, "12;")))
+
+    def test_longest(self):
+        grammar = (Word(nums) ^ Word(nums) + "." + Word(nums) ^ Literal("1")) + Optional("!")
+        parser = Parser(grammar)
+        compiled = parser.compile()
+        for string in ["1", "12.5", "1.2!", "3!"]:
+            self.assertEqual(compiled.parse(string).as_list(), parser.parse(string).as_list())
+
+    def test_actions(self):
+        calls = []
+        ident = Word(alphas, alphanums) / (lambda t: calls.append(t[0]) or t[0].upper())
+        grammar = Group(ident + "(" + Optional(delimited_list(ident)) + ")") | ident
+        parser = Parser(grammar)
+        compiled = parser.compile()
+        expected = parser.parse("f(a, b)").as_list()
+        expected_calls, calls[:] = list(calls), []
+        self.assertEqual(compiled.parse("f(a, b)").as_list(), expected)
+        self.assertEqual(calls, expected_calls)
+
+    def test_memo(self):
+        # THE SAME IMPURE ACTION IS CALLED ONCE, BECAUSE OF THE MEMO
+        counter = [0]
+
+        def count(t):
+            counter[0] += 1
+            return counter[0]
+
+        item = Group(Word(alphas) / count)
+        compiled = (item + "," | item + ";").finalize(memo=True).compile()
+        self.assertEqual(compiled.parse("a;", parse_all=True).as_list(), [[1], ";"])
+
+    def test_forward_reassigned(self):
+        value = Forward()
+        grammar = Word(alphas) + "=" + value
+        value << Word(nums)
+        compiled = Parser(grammar).compile()
+        self.assertEqual(compiled.parse("a = 1").as_list(), ["a", "=", "1"])
+
+        value << Word(alphas)
+        self.assertEqual(compiled.parse("a = b").as_list(), ["a", "=", "b"])
+
+    def test_examples(self):
+        from examples import fourFn
+
+        parser = Parser(fourFn.bnf)
+        compiled = parser.compile()
+        for string in ["9", "-9", "2^3^2", "sin(pi/2)+e*3", "(1+2)*(3-4)/5", "round(2.5) + sgn(-3)"]:
+            fourFn.exprStack[:] = []
+            expected = parser.parse(string, parse_all=True).as_list()
+            expected_value = fourFn.evaluate_stack(fourFn.exprStack)
+            fourFn.exprStack[:] = []
+            self.assertEqual(compiled.parse(string, parse_all=True).as_list(), expected)
+            self.assertEqual(fourFn.evaluate_stack(fourFn.exprStack), expected_value)
+
+
+def failure(parser, string):
+    try:
+        parser.parse(string, parse_all=True)
+    except ParseException as cause:
+        return cause
+    raise AssertionError("expecting failure")
@@ -0,0 +1,112 @@
+# encoding: utf-8
+from unittest import skipIf
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Forward, Group, Literal, ParseException, Regex, Word, collapse
+from mo_parsing.collapse import Collapsed
+from mo_parsing.core import Parser
+from mo_parsing.helpers import delimited_list
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@skipIf(not collapse.ENABLED, "needs python 3.11")
+@add_error_reporting
+class TestCollapse(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_same_results(self):
+        ident = Word(alphas, alphanums + "_")
+        name = delimited_list(ident, ".", combine=True)
+        version = Word(nums) + "." + Word(nums)
+        grammar = Group(name + ":" + version)[1, ...]
+        string = "a.b: 1.2 c : 3 .4 d.e.f:5.6"
+
+        before, after = parsers(grammar)
+        self.assertGreater(len(collapsed(after)), 0)
+        self.assertEqual(
+            after.parse(string, parse_all=True).as_list(),
+            before.parse(string, parse_all=True).as_list(),
+        )
+
+    def test_keeps_peg_meaning(self):
+        # "a" MATCHES, SO "ab" IS NEVER TRIED
+        grammar = (Literal("a") | "ab") + "c"
+        before, after = parsers(grammar)
+        self.assertGreater(len(collapsed(after)), 0)
+        self.assertEqual(str(failure(after, "abc")), str(failure(before, "abc")))
+        self.assertEqual(after.parse("a c").as_list(), ["a", "c"])
+
+    def test_same_failure(self):
+        grammar = Word(alphas) + "=" + Word(nums) + ";"
+        before, after = parsers(grammar)
+        for string in ["a = 1", "a 1;", "a = b;", "= 1;"]:
+            self.assertEqual(str(failure(after, string)), str(failure(before, string)))
+
+    def test_parse_action_not_collapsed(self):
+        grammar = Word(alphas) + (Literal("=") / (lambda: "is")) + Word(nums)
+        _, after = parsers(grammar)
+        self.assertEqual(collapsed(after), [])
+        self.assertEqual(after.parse("a = 1").as_list(), ["a", "is", "1"])
+
+    def test_token_name_not_collapsed(self):
+        grammar = Word(alphas)("key") + "=" + Word(nums)("value")
+        _, after = parsers(grammar)
+        self.assertEqual(collapsed(after), [])
+        self.assertEqual(after.parse("a = 1")["value"], "1")
+
+    def test_backtracking_regex_not_collapsed(self):
+        grammar = Regex("(?:a+)+b") + "c"
+        _, after = parsers(grammar)
+        self.assertEqual(collapsed(after), [])
+
+    def test_forward_reassigned(self):
+        value = Forward()
+        grammar = Word(alphas) + "=" + value
+        value << Word(nums) + "." + Word(nums)
+        parser = Parser(grammar)
+        self.assertEqual(parser.parse("a = 1.2").as_list(), ["a", "=", "1", ".", "2"])
+
+        value << Word(alphas) + "/" + Word(alphas)
+        self.assertEqual(parser.parse("a = b/c").as_list(), ["a", "=", "b", "/", "c"])
+        self.assertGreater(len(collapsed(parser)), 0)
+
+
+def parsers(grammar):
+    collapse.ENABLED = False
+    try:
+        before = Parser(grammar)
+    finally:
+        collapse.ENABLED = True
+    return before, Parser(grammar)
+
+
+def collapsed(parser):
+    found = []
+    todo = [parser.element]
+    seen = set()
+    while todo:
+        e = todo.pop()
+        if id(e) in seen:
+            continue
+        seen.add(id(e))
+        if isinstance(e, Collapsed):
+            found.append(e)
+        elif getattr(e, "exprs", None):
+            todo.extend(e.exprs)
+        elif getattr(e, "expr", None) is not None and not isinstance(e, Regex):
+            todo.append(e.expr)
+    return found
+
+
+def failure(parser, string):
+    try:
+        parser.parse(string, parse_all=True)
+    except ParseException as cause:
+        return cause
+    raise AssertionError("expecting failure")
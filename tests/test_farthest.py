@@ -0,0 +1,82 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from examples.jsonParser import jsonObject
+from mo_parsing import Forward, Group, Literal, ParseException, Word, delimited_list
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestFarthest(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+        value = Forward()
+        array = Group(Literal("[").suppress() + delimited_list(value) + Literal("]").suppress())
+        value << (Word(nums).set_parser_name("number") | Word(alphas).set_parser_name("word") | array)
+        self.grammar = value
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_same_result(self):
+        string = "[1, a, [2, [b]]]"
+        expected = self.grammar.parse_string(string, parse_all=True)
+        result = self.grammar.finalize(farthest=True).parse(string, parse_all=True)
+        self.assertEqual(result.as_list(), expected.as_list())
+
+    def test_failures_empty(self):
+        def all_failures(result):
+            yield result.failures
+            for t in result.tokens:
+                if hasattr(t, "failures"):
+                    yield from all_failures(t)
+
+        result = self.grammar.finalize(farthest=True).parse("[1, a, [2, [b]]]", parse_all=True)
+        self.assertEqual([f for f in all_failures(result) if f], [])
+
+    def test_error_location(self):
+        string = "[1, a, [2, [b !]]]"
+        normal = failure(self.grammar.finalize(), string)
+        farthest = failure(self.grammar.finalize(farthest=True), string)
+        self.assertEqual(farthest.loc, normal.loc)
+        self.assertIn('found "!', str(farthest))
+
+    def test_expected_set(self):
+        farthest = failure(self.grammar.finalize(farthest=True), "[1, ]")
+        self.assertEqual(farthest.loc, 4)
+        self.assertIn("number", str(farthest))
+        self.assertIn("word", str(farthest))
+
+    def test_same_message(self):
+        # THE SAME ALTERNATIVES AS THE DEFAULT MODE, NOT ONLY THE NAMED ONES
+        document = '{"a": [1, 2.5, "x", {"b": null, "c": [true, false, []]}], "d": {}}'
+        strings = [document[:i] for i in range(len(document))] + [
+            '{"a": [1, }',
+            '{"a": tru}',
+            '{"a" 1}',
+            '{"a": [1, 2 x',
+        ]
+        normal = jsonObject.finalize()
+        farthest = jsonObject.finalize(farthest=True)
+        for string in strings:
+            self.assertEqual(str(failure(farthest, string)), str(failure(normal, string)))
+        self.assertIn("{]}", str(failure(farthest, '{"a": [')))
+        self.assertIn("Expecting string enclosed in double quotes", str(failure(farthest, '{"')))
+
+    def test_parse_action_message(self):
+        def no_zero(tokens, start, string):
+            if tokens[0] == "0":
+                raise ParseException(tokens.type, start, string, "zero is not allowed")
+
+        grammar = delimited_list(Word(nums) / no_zero)
+        farthest = failure(grammar.finalize(farthest=True), "1, 0")
+        self.assertIn("zero is not allowed", str(farthest))
+
+
+def failure(parser, string):
+    try:
+        parser.parse(string, parse_all=True)
+    except ParseException as cause:
+        return cause
+    raise AssertionError("expecting failure")
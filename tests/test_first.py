@@ -0,0 +1,157 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import (
+    CaselessKeyword,
+    Forward,
+    Group,
+    Keyword,
+    Literal,
+    Optional,
+    ParseException,
+    Regex,
+    Word,
+    delimited_list,
+)
+from mo_parsing.core import Parser
+from mo_parsing.expressions import MatchFirst, Or
+from mo_parsing.first import ALL, _reachable, first_sets
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestFirst(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_leaves(self):
+        self.assertEqual(chars(Word(alphas, nums)), set(alphas))
+        self.assertEqual(chars(Literal("ab")), {"a"})
+        self.assertEqual(chars(CaselessKeyword("select")), {"s", "S"})
+        self.assertEqual(chars(Regex(r"-?\d+")), set("-" + nums))
+        self.assertEqual(chars(Regex(r"(?:ab)*c|d")), {"a", "c", "d"})
+        self.assertEqual(chars(Regex(r"[^x]")), {chr(c) for c in range(256)} - {"x"})
+
+    def test_caseless(self):
+        # re FOLDS ſ TO s, AND ÿ TO Ÿ, SO THE RANGE STARTS WITH SOME LATIN-1
+        self.assertEqual(chars(Regex(r"(?i)[Ÿ-ſ]x")), set("sSÿ"))
+        self.assertEqual(chars(Regex(r"(?i)ſx")), set("sS"))
+        self.assertEqual(chars(Regex(r"(?i)kx")), set("kK"))
+        for pattern, strings in [
+            (r"(?i)[Ÿ-ſ]x", ["sx", "ÿx", "Ÿx", "ſx"]),
+            (r"(?i)ſx", ["sx", "Sx"]),
+            (r"(?i)kx", ["\u212ax"]),
+        ]:
+            for grammar in (Regex(pattern) | Literal("q"), Regex(pattern) ^ Regex(r"(?i)ſb") ^ Literal("q")):
+                for string in strings:
+                    self.assertEqual(grammar.parse_string(string, parse_all=True), [string])
+
+    def test_nullable(self):
+        grammar = Optional("a") + Word(nums)
+        chars_, _, nullable = first_sets(grammar)[id(grammar)]
+        self.assertEqual(as_set(chars_), set("a" + nums))
+        self.assertFalse(nullable)
+        self.assertTrue(first(Optional("a"))[2])
+
+    def test_forward_recursion(self):
+        expr = Forward()
+        expr << (Word(nums) | "(" + expr + ")")
+        self.assertEqual(chars(expr), set("(" + nums))
+
+    def test_unknown_is_anything(self):
+        expr = Forward()
+        self.assertEqual(first(expr), (ALL, True, True))
+
+    def test_dispatch_skips(self):
+        number, name, sign = Word(nums), Word(alphas), Word("+-")
+        parser = Parser((number | name | sign) / (lambda t: t))
+        table = choices(parser)[0].dispatch
+        self.assertIsNotNone(table)
+        self.assertEqual(len(table["1"]), 1)
+        self.assertIs(table["1"][0], number)
+        self.assertIs(table["-"][0], sign)
+        self.assertEqual(table["("], ())
+        self.assertEqual(parser.parse("abc").as_list(), ["abc"])
+
+    def test_same_results(self):
+        # EACH Parser NEEDS ITS OWN GRAMMAR, THE dispatch IS ON THE ELEMENTS
+        parser = Parser(self.sql())
+        undispatched = undispatch(Parser(self.sql()))
+        for string in ["select a, f(b, 1) from t", "select (select 1 from u) from t", "select a from t where a"]:
+            expected = undispatched.parse(string, parse_all=True)
+            self.assertEqual(repr(parser.parse(string, parse_all=True).as_list()), repr(expected.as_list()))
+
+    def test_same_failure(self):
+        for farthest in [False, True]:
+            parser = Parser(self.sql(), farthest=farthest)
+            undispatched = undispatch(Parser(self.sql(), farthest=farthest))
+            for string in ["select from t", "select a t", "select f(1 from t", "select a from t where", "delete"]:
+                self.assertEqual(str(failure(parser, string)), str(failure(undispatched, string)))
+
+    def test_zero_width_winner(self):
+        # THE SKIPPED "x" IS STILL EXPECTED
+        def grammar():
+            return (Literal("x") / (lambda t: t) | Optional("y")) + "z"
+
+        expected = str(failure(undispatch(Parser(grammar())), "w"))
+        self.assertIn("{x}", expected)
+        self.assertEqual(str(failure(Parser(grammar()), "w")), expected)
+
+    def test_forward_reassigned(self):
+        value = Forward()
+        grammar = (value | Keyword("none")) / (lambda t: t)
+        value << Word(nums)
+        parser = grammar.finalize()
+        self.assertEqual(parser.parse("1").as_list(), ["1"])
+
+        value << Word(alphas)
+        parser = grammar.finalize()
+        self.assertEqual(parser.parse("a").as_list(), ["a"])
+
+    def sql(self):
+        select = Forward()
+        ident = Word(alphas, alphanums) / (lambda t: t[0].upper())
+        call = Group(ident + "(" + Optional(delimited_list(select | Word(nums) | ident)) + ")")
+        term = Word(nums) | call | "(" + select + ")" | ident
+        select << (
+            CaselessKeyword("select")
+            + delimited_list(term)
+            + CaselessKeyword("from")
+            + ident
+            + Optional(CaselessKeyword("where") + term)
+        )
+        return select
+
+
+def first(element):
+    return first_sets(element)[id(element)]
+
+
+def chars(element):
+    return as_set(first(element)[0])
+
+
+def as_set(mask):
+    return {chr(c) for c in range(256) if mask >> c & 1}
+
+
+def choices(parser):
+    return [e for e in _reachable([parser.original, parser.element]) if isinstance(e, (MatchFirst, Or))]
+
+
+def undispatch(parser):
+    for e in choices(parser):
+        e.dispatch = None
+    return parser
+
+
+def failure(parser, string):
+    try:
+        parser.parse(string, parse_all=True)
+    except ParseException as cause:
+        return cause
+    raise AssertionError("expecting failure")
@@ -0,0 +1,61 @@
+# encoding: utf-8
+import json
+import subprocess
+import sys
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+IMPORT_BUDGET = 0.5  # SECONDS FOR import mo_parsing.helpers, IN A NEW PROCESS
+HELPERS_SHARE = 0.10  # mo_parsing.helpers MAY ADD THIS MUCH TO import mo_parsing
+
+START = """
+import json
+from time import perf_counter
+start = perf_counter()
+import mo_parsing
+middle = perf_counter()
+import mo_parsing.helpers
+end = perf_counter()
+print(json.dumps({
+    "total": end - start,
+    "package": middle - start,
+    "helpers": end - middle,
+    "built": sorted(n for n in mo_parsing.helpers._lazy_builders if n in vars(mo_parsing.helpers)),
+}))
+"""
+
+
+def import_times():
+    """
+    :return: THE FASTEST OF A FEW NEW PROCESSES
+    """
+    runs = [
+        json.loads(subprocess.run([sys.executable, "-c", START], capture_output=True, check=True, text=True).stdout)
+        for _ in range(5)
+    ]
+    return {
+        "total": min(r["total"] for r in runs),
+        "package": min(r["package"] for r in runs),
+        "helpers": min(r["helpers"] for r in runs),
+        "built": runs[0]["built"],
+    }
+
+
+@add_error_reporting
+class TestImportTime(FuzzyTestCase):
+    def test_budget(self):
+        times = import_times()
+        self.assertEqual(times["built"], [])
+        self.assertLess(times["total"], IMPORT_BUDGET)
+        self.assertLess(times["helpers"], HELPERS_SHARE * times["package"])
+
+    def test_lazy(self):
+        from mo_parsing import helpers
+
+        self.assertIs(helpers.quoted_string, helpers.quoted_string)
+        self.assertIn("quoted_string", vars(helpers))
+        self.assertIn("uuid", dir(helpers))
+        self.assertEqual(helpers.uuid.parse("12345678-1234-1234-1234-123456789abc"), ["12345678-1234-1234-1234-123456789abc"])
+        self.assertEqual(helpers.nested_expr().parse('(a "(b" c)'), [["a", '"(b"', "c"]])
+        with self.assertRaises(AttributeError):
+            helpers.not_a_helper
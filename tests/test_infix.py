@@ -347,3 +347,64 @@ class TestParsing(PyparsingExpressionTestCase):
 
         result = expr.parse_string("a / b c")
         self.assertEqual(result, [{"/": ["a", [{"*": ["b", "c"]}]]}])
+
+    def test_prefix_after_tighter_operator(self):
+        integer = Word(nums) / (lambda t: int(t[0]))
+        expr = infix_notation(
+            integer,
+            [
+                ("^", 2, RIGHT_ASSOC),
+                ("-", 1, RIGHT_ASSOC),
+                ("*", 2, LEFT_ASSOC),
+                ("-", 2, LEFT_ASSOC),
+            ],
+        )
+        self.assertParseResultsEquals(
+            expr.parse_string("2 ^ - 3", parse_all=True),
+            expected_list=[[2, "^", ["-", 3]]],
+        )
+        self.assertParseResultsEquals(
+            expr.parse_string("1 - 2 * - 3", parse_all=True),
+            expected_list=[[1, "-", [2, "*", ["-", 3]]]],
+        )
+
+    def test_ternary_around_looser_operator(self):
+        expr = infix_notation(
+            integer, [(("?", ":"), 3, RIGHT_ASSOC), ("+", 2, LEFT_ASSOC)]
+        )
+        self.assertParseResultsEquals(
+            expr.parse_string("1 ? 2 : 3 ? 4 + 5 : 6", parse_all=True),
+            expected_list=[[1, "?", 2, ":", [3, "?", [4, "+", 5], ":", 6]]],
+        )
+
+    def test_incomplete_ternary(self):
+        # AN INCOMPLETE TERNARY IS NOT CONSUMED
+        expr = infix_notation(
+            Word(alphas), [(one_of("+ -"), 2, LEFT_ASSOC), (("?", ":"), 3, RIGHT_ASSOC)]
+        )
+        self.assertParseResultsEquals(
+            expr.parse_string("a ? b : c ? d"), expected_list=[["a", "?", "b", ":", "c"]],
+        )
+        self.assertEqual(expr.parse_string("a ? b : c ? d").end, 10)  # BEFORE THE SECOND "?"
+        self.assertParseResultsEquals(expr.parse_string("x ? y"), expected_list=["x"])
+        self.assertParseResultsEquals(expr.parse_string("a + b ? c"), expected_list=[["a", "+", "b"]])
+        self.assertParseResultsEquals(expr.parse_string("a ? b ? c : d"), expected_list=["a"])
+        self.assertParseResultsEquals(expr.parse_string("a : b"), expected_list=["a"])
+        for string in ["a ? b : c ? d", "x ? y", "a + b ? c", "a ? b ? c : d", "a : b", "(a ? b) : c"]:
+            with self.assertRaises(ParseException):
+                expr.parse_string(string, parse_all=True)
+
+    def test_long_expression(self):
+        # ONE PASS, AND NO RECURSION, SO LONG CHAINS ARE FINE
+        expr = infix_notation(
+            Word(nums), [("^", 2, RIGHT_ASSOC), ("+", 2, LEFT_ASSOC)]
+        )
+        result = expr.parse_string("+".join(["1"] * 10_000), parse_all=True)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0].end, 19_997)
+        self.assertEqual(result[-1], "1")
+
+        result = expr.parse_string("^".join(["1"] * 10_000), parse_all=True)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0], "1")
+        self.assertEqual(result[-1].start, 2)
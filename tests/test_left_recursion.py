@@ -0,0 +1,59 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Forward, Group, Word, ParseException, RecursiveGrammarException
+from mo_parsing.utils import nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestLeftRecursion(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+        self.term = Word(nums) / (lambda t: int(t[0]))
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_left_associative(self):
+        expr = Forward(left_recursion=True)
+        expr <<= Group(expr + "+" + self.term) | self.term
+        result = expr.parse_string("1+2+3", parse_all=True)
+        self.assertEqual(result.as_list(), [[[1, "+", 2], "+", 3]])
+
+    def test_single_term(self):
+        expr = Forward(left_recursion=True)
+        expr <<= Group(expr + "+" + self.term) | self.term
+        self.assertEqual(expr.parse_string("7", parse_all=True).as_list(), [7])
+
+    def test_no_match(self):
+        expr = Forward(left_recursion=True)
+        expr <<= Group(expr + "+" + self.term) | self.term
+        with self.assertRaises(ParseException):
+            expr.parse_string("+", parse_all=True)
+
+    def test_precedence(self):
+        product = Forward(left_recursion=True)
+        product <<= Group(product + "*" + self.term) | self.term
+        total = Forward(left_recursion=True)
+        total <<= Group(total + "+" + product) | product
+        result = total.parse_string("1+2*3*4+5", parse_all=True)
+        self.assertEqual(result.as_list(), [[[1, "+", [[2, "*", 3], "*", 4]], "+", 5]])
+
+    def test_indirect(self):
+        expr = Forward(left_recursion=True)
+        difference = Group(expr + "-" + self.term)
+        expr <<= difference | self.term
+        result = expr.parse_string("9-8-7", parse_all=True)
+        self.assertEqual(result.as_list(), [[[9, "-", 8], "-", 7]])
+
+    def test_with_memo(self):
+        expr = Forward(left_recursion=True)
+        expr <<= Group(expr + "+" + self.term) | Group(expr + "-" + self.term) | self.term
+        result = expr.finalize(memo=True).parse("1+2-3+4", parse_all=True)
+        self.assertEqual(result.as_list(), [[[[1, "+", 2], "-", 3], "+", 4]])
+
+    def test_still_an_error(self):
+        with self.assertRaises(RecursiveGrammarException):
+            expr = Forward()
+            expr <<= Group(expr + "+" + self.term) | self.term
@@ -0,0 +1,84 @@
+# encoding: utf-8
+import gc
+from random import Random
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import ParseException, Word
+from mo_parsing.core import parse_state
+from mo_parsing.lines import LineIndex, line_index
+from mo_parsing.utils import alphas, col, line, lineno, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestLines(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_same_as_scan(self):
+        rand = Random(0)
+        for _ in range(500):
+            string = "".join(rand.choice("ab\n") for _ in range(rand.randrange(12)))
+            index = LineIndex(string)
+            for loc in range(len(string) + 2):
+                self.assertEqual(index.col(loc), scan_col(loc, string), string)
+                self.assertEqual(index.lineno(loc), scan_lineno(loc, string), string)
+                self.assertEqual(index.line(loc), scan_line(loc, string), string)
+                self.assertEqual(col(loc, string), scan_col(loc, string), string)
+                self.assertEqual(lineno(loc, string), scan_lineno(loc, string), string)
+                self.assertEqual(line(loc, string), scan_line(loc, string), string)
+
+    def test_index_is_reused(self):
+        string = "a\nb\nc"
+        indexes = []
+        grammar = Word(alphas)[1, ...] / (lambda t, l, s: indexes.extend([line_index(s), line_index(s)]))
+        grammar.parse(string)
+        self.assertIs(indexes[0], indexes[1])
+        self.assertEqual(lineno(4, string), 3)
+        self.assertEqual(col(4, string), 1)
+        self.assertEqual(line(3, string), "b")
+
+    def test_index_dropped_after_parse(self):
+        string = "".join(["1\n", "2\n", "3"])
+        grammar = (Word(nums) / (lambda t, l, s: lineno(l, s)))[1, ...]
+        self.assertEqual(grammar.parse(string).as_list(), [1, 2, 3])
+        self.assertEqual(lineno(4, string), 3)
+        self.assertIsNone(parse_state().lines)
+        gc.collect()
+        self.assertFalse(any(isinstance(o, LineIndex) and o.string is string for o in gc.get_objects()))
+
+    def test_equal_strings(self):
+        # A DIFFERENT STRING OBJECT IS NOT CONFUSED WITH AN OLD ONE
+        for text in ["a\nb", "ab\n", "\nab"]:
+            string = "".join(list(text))
+            self.assertEqual(lineno(2, string), scan_lineno(2, string))
+
+    def test_exception_position(self):
+        string = "1 2\n3 4\n5 x"
+        try:
+            (Word(nums)[1, ...]).parse(string, parse_all=True)
+            raise AssertionError("expecting failure")
+        except ParseException as cause:
+            self.assertEqual(cause.lineno, 3)
+            self.assertEqual(cause.col, 3)
+            self.assertEqual(cause.line, "5 x")
+
+
+def scan_col(loc, string):
+    return 1 if 0 < loc < len(string) and string[loc - 1] == "\n" else loc - string.rfind("\n", 0, loc)
+
+
+def scan_lineno(loc, string):
+    return string.count("\n", 0, loc) + 1
+
+
+def scan_line(loc, string):
+    last = string.rfind("\n", 0, loc)
+    next = string.find("\n", loc)
+    if next >= 0:
+        return string[last + 1 : next]
+    return string[last + 1 :]
@@ -0,0 +1,105 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import (
+    Group,
+    Keyword,
+    Literal,
+    MatchAll,
+    OneOrMore,
+    Optional,
+    ParseException,
+    Suppress,
+    Word,
+)
+from mo_parsing.core import Parser
+from mo_parsing.first import _reachable
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestMatchAll(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_any_order(self):
+        parser = Parser(config(["key1", "key10", "key2", "name"]))
+        result = parser.parse("key10 = 3; name = x; key1 = 1;", parse_all=True)
+        self.assertEqual(result.as_list(), [["key10", 3], ["name", "x"], ["key1", 1]])
+
+    def test_same_results(self):
+        keys = ["key1", "key10", "key2", "name"]
+        parser = Parser(config(keys))
+        undispatched = undispatch(Parser(config(keys)))
+        for string in ["key2 = 2; key1 = 1;", "", "name = a; key10 = 10; key1 = 1; key2 = b;"]:
+            expected = undispatched.parse(string, parse_all=True)
+            self.assertEqual(repr(parser.parse(string, parse_all=True).as_list()), repr(expected.as_list()))
+
+    def test_same_failure(self):
+        def grammar():
+            return Keyword("a") & OneOrMore(Word(nums)) & Optional(Literal("b") + "c")
+
+        for farthest in [False, True]:
+            parser = Parser(grammar(), farthest=farthest)
+            undispatched = undispatch(Parser(grammar(), farthest=farthest))
+            for string in ["a", "1 a b", "x", "a 1 a", "b c 1"]:
+                self.assertEqual(str(failure(parser, string)), str(failure(undispatched, string)))
+
+    def test_actions_run_once(self):
+        calls = []
+        number = Word(nums) / (lambda t: calls.append(t[0]) or t)
+        parser = Parser(Keyword("a") & number)
+        self.assertEqual(parser.parse("1 a").as_list(), ["1", "a"])
+        self.assertEqual(calls, ["1"])
+
+    def test_optional_default(self):
+        parser = Parser(Keyword("a") & Optional(Word(alphas), default="none"))
+        self.assertEqual(parser.parse("a").as_list(), ["a", "none"])
+
+    def test_linear(self):
+        # EACH CLAUSE IS TRIED ONLY WHERE ITS KEYWORD IS
+        keys = [f"key{i:02}" for i in range(40)]
+        Counted.calls = 0
+        parser = Parser(config(keys, Counted))
+        parser.parse(" ".join(f"{k} = 1;" for k in reversed(keys)), parse_all=True)
+        self.assertEqual(Counted.calls, len(keys))
+
+
+class Counted(Keyword):
+    """
+    A Keyword THAT COUNTS ITS ATTEMPTS
+    """
+
+    __slots__ = []
+    calls = 0
+
+    def parse_impl(self, string, start, do_actions=True):
+        Counted.calls += 1
+        return Keyword.parse_impl(self, string, start, do_actions)
+
+
+def config(keys, keyword=Keyword):
+    value = Word(nums) / (lambda t: int(t[0])) | Word(alphanums)
+    return MatchAll([
+        Optional(Group(keyword(k) + Suppress("=") + value + Suppress(";")))
+        for k in keys
+    ])
+
+
+def undispatch(parser):
+    for e in _reachable([parser.original, parser.element]):
+        if isinstance(e, MatchAll):
+            e.dispatch = None
+    return parser
+
+
+def failure(parser, string):
+    try:
+        parser.parse(string, parse_all=True)
+    except ParseException as cause:
+        return cause
+    raise AssertionError("expecting failure")
@@ -0,0 +1,61 @@
+# encoding: utf-8
+from unittest import skipIf
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Group, Literal, OneOrMore, Optional, ParseException, Suppress, Word, collapse
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestMatches(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    @skipIf(not collapse.ENABLED, "needs python 3.11")
+    def test_regular(self):
+        parser = Parser(Group(Word(alphas, alphanums) + Suppress("=") + Word(nums) + Optional(Word(alphas))))
+        self.assertIsNotNone(parser._exact())
+        self.assertTrue(parser.matches("a = 1 ms"))
+        self.assertFalse(parser.matches("a = 1 2"))
+        self.assertTrue(parser.matches("a = 1 2", parse_all=False))
+
+    def test_actions_run(self):
+        calls = []
+        parser = Parser(Word(nums) / (lambda t: calls.append(t[0]) or t))
+        self.assertIsNone(parser._exact())
+        self.assertTrue(parser.matches("12"))
+        self.assertEqual(calls, ["12"])
+
+    def test_condition(self):
+        grammar = Word(nums).add_condition(lambda t: len(t[0]) > 1)
+        self.assertFalse(grammar.matches("1"))
+        self.assertTrue(grammar.matches("12"))
+
+    def test_same_answer(self):
+        grammars = [
+            Word(alphas) + "=" + Word(nums),
+            OneOrMore(Group(Word(nums) + ",")),
+            Word(nums) ^ Literal("1.5"),
+        ]
+        strings = ["a = 1", "a =", "1, 2,", "1, 2", "1.5", "", "1.5 x"]
+        for grammar in grammars:
+            for farthest in [False, True]:
+                parser = Parser(grammar, farthest=farthest)
+                for string in strings:
+                    try:
+                        parser.parse(string, parse_all=True)
+                        expected = None
+                    except ParseException as cause:
+                        expected = cause.loc
+                    self.assertEqual(parser.matches(string), expected is None)
+                    offset = parser.failure_offset(string)
+                    if farthest:
+                        self.assertEqual(offset, expected)
+                    else:
+                        self.assertEqual(offset is None, expected is None)
@@ -0,0 +1,124 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Forward, Group, Keyword, Literal, Word, ParseException
+from mo_parsing.core import Parser
+from mo_parsing.helpers import indented_block
+from mo_parsing.memo import Memo
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestMemo(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def backtracking(self):
+        # EVERY ALTERNATIVE STARTS WITH THE SAME term, SO IT IS RE-PARSED WITHOUT A MEMO
+        calls = []
+        term = Word(nums) / (lambda t: calls.append(t[0]) or int(t[0]))
+        term = Group(term)
+        expr = Forward()
+        expr << (term + "+" + expr | term + "-" + expr | term + "*" + expr | term)
+        return expr, calls
+
+    def test_off_by_default(self):
+        expr, _ = self.backtracking()
+        parser = expr.finalize()
+        self.assertIsNone(parser.memo)
+
+    def test_same_results(self):
+        expr, _ = self.backtracking()
+        expected = expr.finalize().parse("1*2*3-4", parse_all=True)
+        result = expr.finalize(memo=True).parse("1*2*3-4", parse_all=True)
+        self.assertEqual(result, expected)
+        self.assertEqual(result.as_list(), [[1], "*", [2], "*", [3], "-", [4]])
+
+    def test_fewer_attempts(self):
+        expr, calls = self.backtracking()
+        expr.finalize().parse("1*2*3*4", parse_all=True)
+        without_memo = len(calls)
+        calls.clear()
+
+        memo = Memo()
+        expr.finalize(memo=memo).parse("1*2*3*4", parse_all=True)
+        self.assertLess(len(calls), without_memo)
+        self.assertGreater(memo.hits, 0)
+        self.assertGreater(memo.misses, 0)
+
+    def test_cached_failure(self):
+        memo = Memo()
+        number = Group(Word(nums))
+        parser = (number + "a" | number + "b").finalize(memo=memo)
+        with self.assertRaises(ParseException):
+            parser.parse("x", parse_all=True)
+        with self.assertRaises(ParseException):
+            parser.parse("x", parse_all=True)
+        self.assertGreater(memo.hits, 0)
+
+    def test_lru_size(self):
+        expr, _ = self.backtracking()
+        memo = Memo(size=3)
+        result = expr.finalize(memo=memo).parse("1+2+3+4+5", parse_all=True)
+        self.assertEqual(result.as_list(), [[1], "+", [2], "+", [3], "+", [4], "+", [5]])
+        self.assertGreater(memo.evictions, 0)
+
+    def test_window(self):
+        expr, _ = self.backtracking()
+        memo = Memo(window=2)
+        result = expr.finalize(memo=memo).parse("1+2+3+4+5", parse_all=True)
+        self.assertEqual(result.as_list(), [[1], "+", [2], "+", [3], "+", [4], "+", [5]])
+        self.assertGreater(memo.evictions, 0)
+
+    def test_counters_accumulate(self):
+        expr, _ = self.backtracking()
+        memo = Memo()
+        parser = expr.finalize(memo=memo)
+        parser.parse("1+2", parse_all=True)
+        first = memo.misses
+        parser.parse("1+2", parse_all=True)
+        self.assertEqual(memo.misses, first * 2)
+        memo.reset()
+        self.assertEqual(memo.hits, 0)
+        self.assertEqual(memo.misses, 0)
+
+    def test_no_memo(self):
+        # AN IMPURE ACTION, THE RESULT DEPENDS ON HOW MANY TIMES IT WAS CALLED
+        counter = [0]
+
+        def count(t):
+            counter[0] += 1
+            return counter[0]
+
+        for impure, expected in [(False, [[1], ";"]), (True, [[2], ";"])]:
+            counter[0] = 0
+            item = Group(Word(alphas) / count)
+            if impure:
+                item = item.no_memo()
+            expr = item + "," | item + ";"
+            result = expr.finalize(memo=True).parse("a;", parse_all=True)
+            self.assertEqual(result.as_list(), expected)
+
+    def test_nested_indented_block(self):
+        # THE ELEMENTS INSIDE AN indented_block DEPEND ON THE indent_stack
+        with Whitespace(" \t"):
+            stmt = Forward()
+            func = Group(Keyword("def") + Word(alphas) + indented_block(stmt))
+            stmt << (func | Group(Word(alphas)[1, ...]))
+            module = indented_block(stmt, False)
+        text = "def a\n  x\n  def b\n    y z\n  w\nq\n"
+        expected = [[[["def", "a", [[["x"]], [["def", "b", [[["y", "z"]]]]], [["w"]]]]], [["q"]]]]
+        for memo in (None, True):
+            parser = Parser(module, memo=memo)
+            for engine in (parser, parser.compile(), parser.assemble()):
+                self.assertEqual(engine.parse(text).as_list(), expected)
+
+    def test_bad_memo(self):
+        with self.assertRaises(Exception):
+            Memo(size=0)
+        with self.assertRaises(Exception):
+            Literal("a").finalize(memo="big")
@@ -0,0 +1,74 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Group, Literal, ParseException, Regex, Word
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestOr(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_longest(self):
+        grammar = Word(nums) / (lambda t: int(t[0])) ^ Regex(r"\d+\.\d+") / (lambda t: float(t[0]))
+        self.assertEqual(Parser(grammar).parse("12.5").as_list(), [12.5])
+        self.assertEqual(Parser(grammar).parse("12").as_list(), [12])
+
+    def test_first_of_equal_length(self):
+        grammar = Word(alphas) / (lambda t: "word") ^ Word(alphanums) / (lambda t: "alphanum")
+        self.assertEqual(Parser(grammar).parse("abc").as_list(), ["word"])
+
+    def test_actions_run_once(self):
+        calls = []
+
+        def count(name):
+            def action(tokens):
+                calls.append(name)
+                return tokens
+
+            return action
+
+        grammar = Group(Word(nums) / count("integer") ^ Regex(r"\d+\.\d+") / count("real"))
+        result = Parser(grammar).parse("1.5")
+        self.assertEqual(result.as_list(), [["1.5"]])
+        # EACH ALTERNATIVE IS TRIED ONCE, THE WINNER IS NOT PARSED AGAIN
+        self.assertEqual(sorted(calls), ["integer", "real"])
+
+    def test_no_match(self):
+        grammar = Literal("a") ^ Literal("b")
+        with self.assertRaises(ParseException):
+            Parser(grammar).parse("c")
+
+    def test_same_actions_in_every_engine(self):
+        calls = []
+
+        def record(tokens):
+            calls.append(tokens[0])
+            return tokens
+
+        number = Word(nums) / record ^ Regex(r"\d+\.\d+") / record
+        parser = Parser(Group(number / (lambda t: float(t[0])))[1, ...])
+        expected = [[1.5], [2.0]]
+        for engine in (parser, parser.compile(), parser.assemble()):
+            calls.clear()
+            self.assertEqual(engine.parse("1.5 2", parse_all=True).as_list(), expected)
+            # THE WINNER'S ACTIONS RUN IN ITS TRIAL ONLY
+            self.assertEqual(calls, ["1", "1.5", "2"])
+
+    def test_condition_without_actions(self):
+        calls = []
+        small = (Word(nums) / (lambda t: int(t[0]))).add_condition(lambda t: t[0] < 10)
+        digit = Word(nums, max=1) / (lambda t: calls.append(t[0]))
+        parser = Parser((small ^ digit) + "2")
+        self.assertEqual(parser.parse("12").as_list(), ["1", "2"])
+        calls.clear()
+        # THE CONDITION REJECTS "12" WITHOUT THE PARSE ACTIONS TOO
+        self.assertEqual(list(parser.scan_spans("12")), [(0, 2)])
+        self.assertEqual(parser.count("12 12"), 2)
+        self.assertEqual(calls, [])
@@ -0,0 +1,56 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Forward, Group, Literal, Word
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestParserCache(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_reused(self):
+        expr = Word(nums) + Word(alphas)
+        self.assertIs(expr.finalize(), expr.finalize())
+        self.assertEqual(expr.parse_string("1 a").as_list(), ["1", "a"])
+        self.assertEqual(expr.parse_string("2 b").as_list(), ["2", "b"])
+
+    def test_not_shared_by_copies(self):
+        expr = Word(nums)
+        parser = expr.finalize()
+        self.assertIsNot((expr / (lambda t: int(t[0]))).finalize(), parser)
+
+    def test_memo_not_cached(self):
+        expr = Word(nums) + Word(alphas)
+        self.assertIsNot(expr.finalize(memo=True), expr.finalize(memo=True))
+        self.assertIsNone(expr.finalize().memo)
+
+    def test_forward_reassigned(self):
+        inner = Forward()
+        inner << Word(nums)
+        expr = Group(inner) + "!"
+        parser = expr.finalize()
+        self.assertEqual(expr.parse_string("12!").as_list(), [["12"], "!"])
+
+        inner << Word(alphas)
+        self.assertIsNot(expr.finalize(), parser)
+        self.assertEqual(expr.parse_string("ab!").as_list(), [["ab"], "!"])
+
+    def test_other_forward_reassigned(self):
+        expr = Word(nums) + Literal("!")
+        parser = expr.finalize()
+        other = Forward()
+        other << Word(alphas)
+        self.assertIs(expr.finalize(), parser)
+
+    def test_whitespace_changed(self):
+        expr = Literal("a") + Literal("b")
+        parser = expr.finalize()
+        with Whitespace(" "):
+            self.assertIsNot(expr.finalize(), parser)
+        self.assertIs(expr.finalize(), expr.finalize())
@@ -0,0 +1,61 @@
+# encoding: utf-8
+import pickle
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Forward, Group, Literal, Optional, ParseException, Suppress, Word, delimited_list
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+def to_int(tokens):
+    return int(tokens[0])
+
+
+def outcome(parser, string):
+    try:
+        return str(parser.parse(string, parse_all=True))
+    except ParseException as cause:
+        return str(cause)
+
+
+@add_error_reporting
+class TestPickle(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_forward(self):
+        # A LIST OF NUMBERS AND LISTS, WITH A CYCLE THROUGH THE Forward
+        scale = 10
+        value = Forward()
+        number = Word(nums) / to_int
+        value << (number / (lambda t: t[0] * scale) | Group(Suppress("[") + Optional(delimited_list(value)) + Suppress("]")))
+        parser = Parser(value)
+        copy = pickle.loads(pickle.dumps(parser))
+        for string in ["1", "[1, [2, 3], []]", "[1, [2, ]", "x"]:
+            self.assertEqual(outcome(copy, string), outcome(parser, string))
+
+    def test_by_name(self):
+        element = Word(nums) / to_int
+        data = pickle.dumps(element)
+        self.assertIn(b"to_int", data)
+        self.assertIs(pickle.loads(data).parse_action[0].action, to_int)
+
+    def test_condition(self):
+        element = Word(alphas).add_condition(lambda t: len(t[0]) > 2, message="too short")
+        copy = pickle.loads(pickle.dumps(element))
+        self.assertEqual(copy.parse("abc"), ["abc"])
+        with self.assertRaises("too short"):
+            copy.parse("ab")
+
+    def test_whitespace(self):
+        with Whitespace() as white:
+            white.add_ignore(Literal("#") + Word(alphas))
+            element = Word(nums)[1, ...]
+        copy = pickle.loads(pickle.dumps(Parser(element)))
+        self.assertEqual(copy.parse("1 #x 2"), ["1", "2"])
+        self.assertIsNone(copy.whitespace.parent)
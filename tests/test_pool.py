@@ -0,0 +1,60 @@
+# encoding: utf-8
+import pickle
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Group, Literal, ParseException, Word
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+def grammar():
+    # IMPORTABLE, SO EACH WORKER CAN BUILD THE GRAMMAR
+    with Whitespace():
+        return Group(Word(alphas) + Literal("=") + Word(nums) / (lambda t: int(t[0])))
+
+
+def to_dict(result):
+    return {result[0]: result[2]}
+
+
+@add_error_reporting
+class TestPool(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_in_process(self):
+        result = list(grammar().parse_many(["a=1", "b = x"], workers=1))
+        self.assertEqual(result[0], [["a", "=", 1]])
+        self.assertIsInstance(result[1], ParseException)
+        self.assertEqual(result[1].loc, 4)
+
+    def test_same_results(self):
+        strings = [f"k{i} = {i}" if i % 3 else f"k{i} = x" for i in range(50)]
+        parser = grammar()
+        expected = [str(r) for r in parser.parse_many(strings, workers=1)]
+        self.assertEqual(
+            [str(r) for r in parser.parse_many(strings, grammar, workers=2, chunksize=7)], expected,
+        )
+        self.assertEqual(
+            sorted(str(r) for r in parser.parse_many(strings, grammar, workers=2, chunksize=7, ordered=False)),
+            sorted(expected),
+        )
+
+    def test_convert(self):
+        result = list(grammar().parse_many(["a=1", "b=2"], grammar, workers=2, convert=to_dict))
+        self.assertEqual(result, [{"a": 1}, {"b": 2}])
+
+    def test_plain_exception(self):
+        error = list(grammar().parse_many(["a = x"], workers=1))[0]
+        copy = pickle.loads(pickle.dumps(error))
+        self.assertEqual(str(copy), str(error))
+
+    def test_pickled(self):
+        # WITHOUT A factory, THE WORKERS GET THE GRAMMAR PICKLED
+        result = list(grammar().parse_many(["a=1", "b = x"], workers=2))
+        self.assertEqual(result[0], [["a", "=", 1]])
+        self.assertEqual(result[1].loc, 4)
@@ -262,3 +262,22 @@ class TestRegexParsing(PyparsingExpressionTestCase):
         self.assertEqual(parser.match("b").group(1), None)
         self.assertEqual(parser.match("b").group(2), "b")
         self.assertEqual(parser.match("c"), None)
+
+    def test_lazy_expr(self):
+        # ONLY THE COMPILED regex IS MADE; THE PATTERN IS PARSED ON FIRST USE OF expr
+        from mo_parsing.regex import _expr_slot
+
+        r = Regex(r"(?:if|then)\b")
+        self.assertEqual(list(r.expecting().keys()), ["if", "then"])
+        self.assertEqual(r.min_length(), 2)
+        self.assertEqual(r.parse_string("then"), ["then"])
+        self.assertIsNone(_expr_slot.__get__(r))
+        self.assertIsNotNone(r.expr)
+
+    def test_expecting_optional_start(self):
+        self.assertEqual(Regex(r"-?\d+").expecting(), {})
+        self.assertEqual(
+            list(Regex(r"-?[0-9]").expecting().keys()), ["-" + d for d in "0123456789"] + list("0123456789"),
+        )
+        self.assertEqual(list(Regex(r"ab*").expecting().keys()), ["ab", "a"])
+        self.assertEqual(Regex(r"ab*").min_length(), 1)
@@ -0,0 +1,78 @@
+# encoding: utf-8
+from unittest import skipIf
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Combine, Group, Keyword, Literal, OneOrMore, Optional, Regex, Word, collapse
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestScan(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_jump(self):
+        parser = Parser(Keyword("end") + ";")
+        string = "to the end; or the end ;"
+        self.assertEqual(parser._scanner().search(string).start(), 7)
+        self.assertEqual([(s, e) for _, s, e in parser.scan_string(string)], [(7, 11), (19, 24)])
+
+    def test_anywhere(self):
+        # A MATCH OF NOTHING CAN START ANYWHERE
+        parser = Parser(Optional("a") + Optional("b"))
+        self.assertIsNone(parser._scanner())
+
+    def test_same_results(self):
+        def grammars():
+            yield Word(alphas)
+            yield Combine(Word(nums) + "." + Word(nums))
+            yield Literal("a") + "b"
+            yield Optional("a") + "b"
+            with Whitespace() as white:
+                white.add_ignore(Literal("#") + Regex("[^\n]*"))
+                yield Literal(";") + Word(alphas)
+            with Whitespace(""):
+                yield Literal(" a")
+
+        strings = ["a b ; c", "1.5 and 2.25", "ab a b", "x # ; y\n; z", " a  a", "", ";"]
+        for grammar in grammars():
+            parser = Parser(grammar)
+            unscanned = Parser(grammar)
+            unscanned.scan = None
+            for string in strings:
+                for overlap in [False, True]:
+                    self.assertEqual(
+                        [(repr(t), s, e) for t, s, e in parser.scan_string(string, overlap=overlap)],
+                        [(repr(t), s, e) for t, s, e in unscanned.scan_string(string, overlap=overlap)],
+                    )
+                self.assertEqual(parser.transform_string(string), unscanned.transform_string(string))
+                self.assertEqual(list(parser.split(string)), list(unscanned.split(string)))
+
+    def test_spans(self):
+        calls = []
+        number = Word(nums) / (lambda t: calls.append(t[0]) or t)
+        for grammar in [Group(Word(alphas) + "=" + number), OneOrMore(number)]:
+            parser = Parser(grammar)
+            string = "a = 1 b=22, c = x, 3 4"
+            expected = [(s, e) for _, s, e in parser.scan_string(string)]
+            del calls[:]
+            self.assertEqual(list(parser.scan_spans(string)), expected)
+            self.assertEqual(parser.count(string), len(expected))
+            self.assertEqual(calls, [])
+
+    @skipIf(not collapse.ENABLED, "needs python 3.11")
+    def test_regular(self):
+        # WITHOUT THE PARSE ACTIONS, THE GRAMMAR IS ONE REGEX
+        parser = Parser(Group(Word(alphas) + "=" + Word(nums) / (lambda t: int(t[0]))))
+        self.assertIsNotNone(parser._regular())
+        self.assertEqual(list(parser.scan_spans("a=1 b = 2")), [(0, 3), (4, 9)])
+
+    def test_condition_during_try(self):
+        parser = Parser(Word(nums).add_condition(lambda t: len(t[0]) > 1, callDuringTry=True))
+        self.assertEqual(list(parser.scan_spans("1 22 333")), [(2, 4), (5, 8)])
@@ -0,0 +1,66 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import CaselessLiteral, Keyword, Literal, Optional, ParseException, Regex, SkipTo, Word
+from mo_parsing.core import Parser
+from mo_parsing.first import _reachable
+from mo_parsing.helpers import QuotedString
+from mo_parsing.utils import alphas
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestSkipTo(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_scan(self):
+        parser = Parser(SkipTo(Keyword("end") + ";") + "end")
+        string = "a lot of text end;"
+        for skip_to in skips(parser):
+            self.assertEqual(skip_to.scan.search(string).start(), 14)
+        self.assertEqual(parser.parse(string).as_list(), ["a lot of text", "end"])
+
+    def test_no_scan(self):
+        # A TARGET THAT CAN MATCH NOTHING COULD STOP ANYWHERE
+        parser = Parser(SkipTo(Optional("a")) + ";")
+        for skip_to in skips(parser):
+            self.assertIsNone(skip_to.scan)
+
+    def test_same_results(self):
+        def grammars():
+            yield SkipTo(Literal(";"), include=True) + Word(alphas)
+            yield SkipTo(Literal(";"), fail_on="x") + ";"
+            yield SkipTo(Literal(";"), ignore=QuotedString('"')) + ";"
+            yield SkipTo(CaselessLiteral("END")) + Word(alphas)
+            with Whitespace() as white:
+                white.add_ignore(Literal("#") + Regex(".*"))
+                yield SkipTo(Literal(";")) + ";" + Word(alphas)
+
+        strings = ['a b ; c', ' x ;', 'a "b;" ; c', "a\n#;\n; b", "end end", "no target", "", ";"]
+        for grammar in grammars():
+            for farthest in [False, True]:
+                parser = Parser(grammar, farthest=farthest)
+                unscanned = unscan(Parser(grammar, farthest=farthest))
+                for string in strings:
+                    self.assertEqual(result(parser, string), result(unscanned, string))
+
+
+def skips(parser):
+    return [e for e in _reachable([parser.original, parser.element]) if isinstance(e, SkipTo)]
+
+
+def unscan(parser):
+    for e in skips(parser):
+        e.scan = None
+    return parser
+
+
+def result(parser, string):
+    try:
+        return repr(parser.parse(string).as_list())
+    except ParseException as cause:
+        return str(cause)
@@ -0,0 +1,91 @@
+# encoding: utf-8
+import gc
+import weakref
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Literal, Word, ZeroOrMore
+from mo_parsing.core import parse_state
+from mo_parsing.skips import ArraySkips, PAGE_SIZE, set_skip_cache
+from mo_parsing.utils import alphas
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestSkips(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+        self.whitespace.add_ignore(Literal("#") + Word(alphas))
+
+    def tearDown(self):
+        self.whitespace.release()
+        set_skip_cache()
+
+    def test_array_skips(self):
+        skips = ArraySkips()
+        self.assertIsNone(skips.get(5))
+        skips[5] = 9
+        skips[3 * PAGE_SIZE + 1] = 3 * PAGE_SIZE + 2
+        self.assertEqual(skips.get(5), 9)
+        self.assertIsNone(skips.get(6))
+        self.assertEqual(skips.get(3 * PAGE_SIZE + 1), 3 * PAGE_SIZE + 2)
+        self.assertEqual(len(skips.pages), 2)
+
+    def test_backends_agree(self):
+        expr = ZeroOrMore(Word(alphas))
+        string = "a  #comment b\n  c #x d"
+        expected = expr.parse_string(string, parse_all=True).as_list()
+        for backend in ["sparse", "array"]:
+            set_skip_cache(backend=backend)
+            self.assertEqual(expr.parse_string(string, parse_all=True).as_list(), expected)
+            self.assertEqual(expr.parse_string(string + " e", parse_all=True).as_list(), expected + ["e"])
+
+    def test_kept_for_the_parse(self):
+        tables = []
+        expr = ZeroOrMore(Word(alphas) / (lambda: tables.append(parse_state().skips)))
+        expr.parse_string("a #x b\n  c")
+        self.assertEqual(len(tables), 3)
+        self.assertTrue(all(t is tables[0] for t in tables))
+        self.assertTrue(tables[0])
+        # NOTHING IS LEFT ON THE THREAD
+        self.assertIsNone(parse_state().content)
+        self.assertEqual(parse_state().skips, {})
+
+    def test_dropped_after_parse(self):
+        string = Text("a #x b\n  c")
+        found = weakref.ref(string)
+        expr = ZeroOrMore(Word(alphas))
+        self.assertEqual(expr.parse_string(string).as_list(), ["a", "b", "c"])
+        self.assertEqual(self.whitespace.skip(string, 1), 5)
+        del string
+        gc.collect()
+        self.assertIsNone(found())
+
+    def test_bad_backend(self):
+        with self.assertRaises(Exception):
+            set_skip_cache(backend="unknown")
+
+    def test_eager(self):
+        expr = ZeroOrMore(Word(alphas))
+        string = "a  #comment b\n  c #x d   "
+        expected = expr.parse_string(string, parse_all=True).as_list()
+        self.whitespace.set_eager()
+        self.assertEqual(expr.parse_string(string, parse_all=True).as_list(), expected)
+
+    def test_eager_inside_run(self):
+        with Whitespace() as plain:
+            plain.set_eager()
+            string = "a    b"
+            for start in range(len(string) + 1):
+                self.assertEqual(plain.skip(string, start), 5 if 1 <= start <= 5 else start)
+
+        self.whitespace.set_eager()
+        string = "a #comment b"
+        # INSIDE THE COMMENT IS NOT WHITESPACE
+        self.assertEqual(self.whitespace.skip(string, 1), 11)
+        self.assertEqual(self.whitespace.skip(string, 4), 4)
+
+
+class Text(str):
+    # A str THAT CAN HAVE A weakref
+    pass
@@ -0,0 +1,56 @@
+# encoding: utf-8
+import os
+import tempfile
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Group, Literal, Word
+from mo_parsing.core import Parser, _unscanned
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+built = []
+
+
+def grammar():
+    built.append(True)
+    with Whitespace():
+        return Group(Word(alphas) + Literal("=") + Word(nums) / (lambda t: int(t[0])))
+
+
+@add_error_reporting
+class TestSnapshot(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+        self.temp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp.name, "grammar.pickle")
+        del built[:]
+
+    def tearDown(self):
+        self.temp.cleanup()
+        self.whitespace.release()
+
+    def test_warm(self):
+        cold = Parser.load_or_build(self.path, grammar)
+        warm = Parser.load_or_build(self.path, grammar)
+        self.assertEqual(len(built), 1)
+        self.assertIsNot(warm, cold)
+        self.assertEqual(warm.parse("a = 1"), cold.parse("a = 1"))
+        # THE REGEXES MADE ON FIRST USE ARE IN THE SNAPSHOT
+        self.assertIsNot(warm.scan, _unscanned)
+        self.assertIsNot(warm.exact, _unscanned)
+
+    def test_other_settings(self):
+        Parser.load_or_build(self.path, grammar)
+        parser = Parser.load_or_build(self.path, grammar, farthest=True)
+        self.assertEqual(len(built), 2)
+        self.assertTrue(parser.farthest)
+
+    def test_broken(self):
+        Parser.load_or_build(self.path, grammar)
+        with open(self.path, "r+b") as file:
+            file.seek(-10, os.SEEK_END)
+            file.write(b"0123456789")
+        parser = Parser.load_or_build(self.path, grammar)
+        self.assertEqual(len(built), 2)
+        self.assertEqual(parser.parse("a = 1"), [["a", "=", 1]])
@@ -0,0 +1,81 @@
+# encoding: utf-8
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import Forward, Group, Literal, Regex, Word, delimited_list, whitespaces
+from mo_parsing.core import parse_state
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestThreads(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_concurrent_parse(self):
+        value = Forward()
+        array = Group(Literal("[").suppress() + delimited_list(value) + Literal("]").suppress())
+        value << (Word(nums) / (lambda t: int(t[0])) | Word(alphas) | array)
+        parser = value.finalize()
+
+        inputs = [f"[{i}, a{'b' * i}, [{i}, [c, {i * 2}]]]" for i in range(200)]
+        expected = [[[i, "a" + "b" * i, [i, ["c", i * 2]]]] for i in range(200)]
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda s: parser.parse(s, parse_all=True).as_list(), inputs))
+        self.assertEqual(results, expected)
+
+    def test_concurrent_regex_construction(self):
+        threads = 8
+        barrier = Barrier(threads, timeout=10)
+
+        def build(i):
+            # EVERY THREAD ENTERS ITS CONTEXT BEFORE ANY LEAVES, SO THE with BLOCKS ALWAYS INTERLEAVE
+            with Whitespace(" \t" if i % 2 else " ") as whitespace:
+                barrier.wait()
+                self.assertIs(whitespaces.CURRENT, whitespace)
+                expr = Regex(f"(a)(?P<b{i}>b)(c{{{i + 1}}})").capture_groups()
+                result = expr.parse_string("ab" + "c" * (i + 1))
+                self.assertIs(whitespaces.CURRENT, whitespace)
+                barrier.wait()
+            return result
+
+        for _ in range(5):
+            with ThreadPoolExecutor(threads) as pool:
+                results = list(pool.map(build, range(threads)))
+            for i, result in enumerate(results):
+                self.assertEqual(result["1"], "a")
+                self.assertEqual(result[f"b{i}"], "b")
+                self.assertEqual(result["3"], "c" * (i + 1))
+        self.assertIs(whitespaces.CURRENT, self.whitespace)
+
+    def test_new_thread_context(self):
+        # A NEW THREAD STARTS IN THE CONTEXT OF THE MAIN THREAD
+        with ThreadPoolExecutor(1) as pool:
+            self.assertIs(pool.submit(lambda: whitespaces.CURRENT).result(), self.whitespace)
+
+    def test_nested_parse_keeps_state(self):
+        inner = Word(nums)
+
+        def check(tokens):
+            # A PARSE INSIDE A PARSE ACTION GETS ITS OWN STATE
+            before = parse_state()
+            self.assertTrue(inner.matches("42"))
+            self.assertIs(parse_state(), before)
+
+        expr = (Word(alphas) / check) + Word(alphas)
+        result = expr.parse_string("  hello   world")
+        self.assertEqual(result, ["hello", "world"])
+
+    def test_scan_string_is_lazy(self):
+        expr = Word(nums)
+        scanner = expr.scan_string("a 1 b 22 c 333")
+        other = Word(alphas).parse_string("interleaved parse")
+        self.assertEqual(other, ["interleaved"])
+        self.assertEqual([t[0] for t, s, e in scanner], ["1", "22", "333"])
@@ -0,0 +1,106 @@
+# encoding: utf-8
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import (
+    Forward,
+    Group,
+    Literal,
+    OneOrMore,
+    Optional,
+    ParseException,
+    ParserElement,
+    ParseResults,
+    SkipTo,
+    Word,
+    ZeroOrMore,
+    delimited_list,
+)
+from mo_parsing.utils import alphas, nums
+from mo_parsing.whitespaces import Whitespace
+
+
+class Even(ParserElement):
+    """
+    A CUSTOM ELEMENT THAT ONLY KNOWS ABOUT parse_impl()
+    """
+
+    __slots__ = []
+
+    def parse_impl(self, string, start, do_actions=True):
+        end = start
+        while end < len(string) and string[end] in nums:
+            end += 1
+        if end == start or int(string[start:end]) % 2:
+            raise ParseException(self, start, string, "expecting even number")
+        return ParseResults(self, start, end, [string[start:end]], [])
+
+
+class Odd(Literal):
+    """
+    OVERRIDES parse_impl(), SO MUST NOT USE Literal.try_impl()
+    """
+
+    __slots__ = []
+
+    def parse_impl(self, string, start, do_actions=True):
+        if string.startswith("1", start):
+            return ParseResults(self, start, start + 1, ["1"], [])
+        raise ParseException(self, start, string)
+
+
+@add_error_reporting
+class TestTry(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def test_same_results(self):
+        value = Forward()
+        array = Group(Literal("[").suppress() + Optional(delimited_list(value)) + Literal("]").suppress())
+        value << (Word(nums) | Word(alphas) | array)
+        grammar = OneOrMore(value) + ZeroOrMore("!") + SkipTo("end") + "end"
+
+        string = "[1, a, [2, [b]], []] x y !! skipped text end"
+        expected = grammar.parse_string(string, parse_all=True)
+        result = grammar.finalize(farthest=True).parse(string, parse_all=True)
+        self.assertEqual(result.as_list(), expected.as_list())
+
+    def test_same_error(self):
+        value = Forward()
+        array = Group(Literal("[").suppress() + delimited_list(value) + Literal("]").suppress())
+        value << (Word(nums).set_parser_name("number") | array)
+
+        string = "[1, [2, [3 4]]]"
+        normal = failure(value.finalize(), string)
+        farthest = failure(value.finalize(farthest=True), string)
+        self.assertEqual(farthest.loc, normal.loc)
+
+    def test_custom_element(self):
+        grammar = delimited_list(Even())
+        parser = grammar.finalize(farthest=True)
+        self.assertEqual(parser.parse("2, 4, 10", parse_all=True), ["2", "4", "10"])
+
+        error = failure(parser, "2, 4, 7")
+        self.assertEqual(error.loc, 6)
+        self.assertIn("expecting even number", str(error))
+
+    def test_subclass_parse_impl(self):
+        grammar = OneOrMore(Odd("odd"))
+        self.assertEqual(grammar.finalize(farthest=True).parse("111", parse_all=True), ["1", "1", "1"])
+
+    def test_memo(self):
+        grammar = OneOrMore(Word(nums) + "+" | Word(nums) + "-" | Word(alphas))
+        string = "1- 2+ a 3-"
+        expected = grammar.parse_string(string, parse_all=True)
+        result = grammar.finalize(memo=True, farthest=True).parse(string, parse_all=True)
+        self.assertEqual(result.as_list(), expected.as_list())
+
+
+def failure(parser, string):
+    try:
+        parser.parse(string, parse_all=True)
+    except ParseException as cause:
+        return cause
+    raise AssertionError("expecting failure")
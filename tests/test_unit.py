@@ -4113,7 +4113,6 @@ class TestParsing(PyparsingExpressionTestCase):
         success, _ = parser.run_tests([sample2])
         self.assertTrue(success, "Failed indentedBlock multi-block test for issue #87")
 
-    @unittest.skip("need a stack of parse state to do this correctly")
     def testIndentedBlockScan(self):
         def get_parser():
             """
@@ -0,0 +1,153 @@
+# encoding: utf-8
+import sys
+
+from mo_testing.fuzzytestcase import FuzzyTestCase, add_error_reporting
+
+from mo_parsing import (
+    Dict,
+    Forward,
+    Group,
+    Keyword,
+    Literal,
+    Optional,
+    ParseException,
+    Regex,
+    Suppress,
+    Word,
+    delimited_list,
+)
+from mo_parsing.core import Parser
+from mo_parsing.utils import alphanums, alphas, nums
+from mo_parsing.vm import Program
+from mo_parsing.whitespaces import Whitespace
+
+
+@add_error_reporting
+class TestVM(FuzzyTestCase):
+    def setUp(self):
+        self.whitespace = Whitespace().use()
+
+    def tearDown(self):
+        self.whitespace.release()
+
+    def json(self):
+        value = Forward()
+        string = Regex(r'"[^"]*"') / (lambda t: t[0][1:-1])
+        number = Regex(r"\d+(\.\d+)?") / (lambda t: float(t[0]) if "." in t[0] else int(t[0]))
+        member = Group(string + Suppress(":") + value)
+        obj = Dict(Suppress("{") + Optional(delimited_list(member)) + Suppress("}"))
+        array = Group(Suppress("[") + Optional(delimited_list(value)) + Suppress("]"))
+        value << (string | number | obj | array | Keyword("true") / (lambda: True) | Keyword("null") / (lambda: None))
+        return value
+
+    def test_same_results(self):
+        parser = Parser(self.json())
+        program = parser.assemble()
+        self.assertIsInstance(program, Program)
+        for string in ['{"a": [1, 2.5, "x"], "b": {"c": true, "d": null}}', "[]", '{"a": {}}', "[[], [[]]]"]:
+            expected = parser.parse(string, parse_all=True)
+            result = program.parse(string, parse_all=True)
+            # repr, BECAUSE FuzzyTestCase TREATS EMPTY LISTS AS MISSING
+            self.assertEqual(repr(result.as_list()), repr(expected.as_list()))
+
+    def test_deep_nesting(self):
+        parser = Parser(self.json())
+        program = parser.assemble()
+        depth = sys.getrecursionlimit() * 5
+        string = "[" * depth + "1" + "]" * depth
+
+        try:
+            parser.parse(string)
+            self.fail("expecting RecursionError")
+        except RecursionError:
+            pass
+
+        result = program.parse(string, parse_all=True)
+        self.assertEqual(result.end, len(string))
+
+    def test_deep_failure(self):
+        program = Parser(self.json()).assemble()
+        depth = sys.getrecursionlimit() * 5
+        string = "[" * depth + "1" + "]" * (depth - 1)
+        cause = failure(program, string)
+        self.assertEqual(cause.loc, len(string))
+
+    def test_same_failure(self):
+        grammar = Word(alphas)("key") + "=" + Word(nums)("value") + ";"
+        parser = Parser(grammar)
+        program = parser.assemble()
+        for string in ["a = 1", "a 1;", "a = b;", "= 1;", "a = 1; extra"]:
+            self.assertEqual(str(failure(program, string)), str(failure(parser, string)))
+        self.assertEqual(program.parse("a = 1;")["value"], "1")
+
+    def test_failure_runs_actions_once(self):
+        calls = []
+        key = Word(alphas) / (lambda t: calls.append(t[0]))
+        grammar = key + "=" + Word(nums) + ";"
+        parser = Parser(grammar)
+        program = parser.assemble()
+        expected = str(failure(parser, "a = b;"))
+        calls[:] = []
+        self.assertEqual(str(failure(program, "a = b;")), expected)
+        self.assertEqual(calls, ["a"])
+
+    def test_failure_from_condition(self):
+        grammar = Word(nums).add_condition(lambda t: int(t[0]) < 10, message="too big") + ";"
+        parser = Parser(grammar)
+        program = parser.assemble()
+        self.assertEqual(str(failure(program, "12;")), str(failure(parser, "12;")))
+
+    def test_longest(self):
+        grammar = (Word(nums) ^ Word(nums) + "." + Word(nums) ^ Literal("1")) + Optional("!")
+        parser = Parser(grammar)
+        program = parser.assemble()
+        for string in ["1", "12.5", "1.2!", "3!"]:
+            self.assertEqual(program.parse(string).as_list(), parser.parse(string).as_list())
+
+    def test_actions(self):
+        calls = []
+        ident = Word(alphas, alphanums) / (lambda t: calls.append(t[0]) or t[0].upper())
+        grammar = Group(ident + "(" + Optional(delimited_list(ident)) + ")") | ident
+        parser = Parser(grammar)
+        program = parser.assemble()
+        expected = parser.parse("f(a, b)").as_list()
+        expected_calls, calls[:] = list(calls), []
+        self.assertEqual(program.parse("f(a, b)").as_list(), expected)
+        self.assertEqual(calls, expected_calls)
+
+    def test_memo(self):
+        # THE SAME IMPURE ACTION IS CALLED ONCE, BECAUSE OF THE MEMO
+        counter = [0]
+
+        def count(t):
+            counter[0] += 1
+            return counter[0]
+
+        item = Group(Word(alphas) / count)
+        program = (item + "," | item + ";").finalize(memo=True).assemble()
+        self.assertEqual(program.parse("a;", parse_all=True).as_list(), [[1], ";"])
+
+    def test_forward_reassigned(self):
+        value = Forward()
+        grammar = Word(alphas) + "=" + value
+        value << Word(nums)
+        program = Parser(grammar).assemble()
+        self.assertEqual(program.parse("a = 1").as_list(), ["a", "=", "1"])
+
+        value << Word(alphas)
+        self.assertEqual(program.parse("a = b").as_list(), ["a", "=", "b"])
+
+    def test_listing(self):
+        # THE PARSE ACTION STOPS THE GRAMMAR FROM BEING COLLAPSED TO ONE REGEX
+        program = Parser(Word(alphas) / (lambda t: t[0].upper()) + Optional(";")).assemble()
+        listing = str(program)
+        for op in ["CALL", "REGEX", "ACTIONS", "CHOICE", "COMMIT", "RET", "HALT"]:
+            self.assertIn(op, listing)
+
+
+def failure(parser, string):
+    try:
+        parser.parse(string, parse_all=True)
+    except ParseException as cause:
+        return cause
+    raise AssertionError("expecting failure")